@@ -0,0 +1,58 @@
+"""Per-call dispatch overhead: rebuilt tool_mapping vs. the precompiled registry.
+
+Run from the package root:
+
+    python benchmarks/bench_dispatch.py [--number N]
+
+"Before" reproduces the old ``call_tool`` behaviour by evaluating every payload
+builder into a fresh mapping and then picking one entry. "After" is the
+single ``TOOL_REGISTRY`` lookup used by ``mcp_server.call_tool`` today.
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from revit_mcp_server.tools.registry import TOOL_REGISTRY
+
+ARGUMENTS = {
+    "start_x": 0, "start_y": 0, "end_x": 20, "end_y": 0,
+    "height": 12, "level": "L1", "category": "Walls",
+    "points": [{"x": 0, "y": 0}, {"x": 20, "y": 0}, {"x": 20, "y": 20}, {"x": 0, "y": 20}],
+    "operations": [{"tool": "revit_create_wall", "arguments": {"end_x": 20}}],
+}
+
+
+def dispatch_rebuilt(name: str, arguments: dict) -> tuple[str, dict]:
+    tool_mapping = {
+        spec.name: (spec.bridge_tool, spec.build_payload(arguments))
+        for spec in TOOL_REGISTRY.values()
+    }
+    return tool_mapping[name]
+
+
+def dispatch_registry(name: str, arguments: dict) -> tuple[str, dict]:
+    spec = TOOL_REGISTRY[name]
+    return spec.bridge_tool, spec.build_payload(arguments)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--tool", default="revit_create_wall")
+    args = parser.parse_args()
+
+    assert dispatch_rebuilt(args.tool, ARGUMENTS) == dispatch_registry(args.tool, ARGUMENTS)
+
+    results = {}
+    for label, fn in (("before (rebuilt mapping)", dispatch_rebuilt), ("after (registry lookup)", dispatch_registry)):
+        best = min(timeit.repeat(lambda: fn(args.tool, ARGUMENTS), number=args.number, repeat=5))
+        results[label] = best / args.number * 1e6
+        print(f"{label:<26} {results[label]:8.2f} us/call")
+
+    before, after = results.values()
+    print(f"{'speedup':<26} {before / after:8.1f}x  ({len(TOOL_REGISTRY)} tools)")
+
+
+if __name__ == "__main__":
+    main()
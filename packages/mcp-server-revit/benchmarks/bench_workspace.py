@@ -0,0 +1,77 @@
+"""Workspace path checks: linear root scan vs. cached, trie-indexed monitor.
+
+Run from the package root:
+
+    python benchmarks/bench_workspace.py [--roots N] [--checks N]
+
+"Before" reproduces the old ``assert_in_workspace``: ``Path.resolve()`` on
+every call followed by ``is_relative_to`` against each allowed root. "After"
+is ``WorkspaceMonitor`` with its resolve cache and root trie. Candidates are
+drawn from a fixed pool, as repeated exports into the same folders are.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from revit_mcp_server.errors import WorkspaceViolation
+from revit_mcp_server.security.workspace import WorkspaceMonitor
+
+
+class LinearMonitor:
+    def __init__(self, allowed_directories):
+        self.allowed_directories = [directory.resolve() for directory in allowed_directories]
+
+    def assert_in_workspace(self, candidate: Path) -> Path:
+        candidate = candidate.resolve()
+        if not any(candidate.is_relative_to(directory) for directory in self.allowed_directories):
+            raise WorkspaceViolation(f"{candidate} is outside the allowed workspace directories")
+        return candidate
+
+
+def run(monitor, candidates) -> tuple[float, int]:
+    rejected = 0
+    start = time.perf_counter()
+    for candidate in candidates:
+        try:
+            monitor.assert_in_workspace(candidate)
+        except WorkspaceViolation:
+            rejected += 1
+    return time.perf_counter() - start, rejected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roots", type=int, default=5000)
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--pool", type=int, default=500, help="distinct candidate paths")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        roots = [base / f"project-{index // 100}" / f"job-{index}" for index in range(args.roots)]
+        for root in roots:
+            root.mkdir(parents=True)
+        pool = [
+            (rng.choice(roots) if rng.random() < 0.9 else base / "outside") / f"sheet-{index}.pdf"
+            for index in range(args.pool)
+        ]
+        candidates = [rng.choice(pool) for _ in range(args.checks)]
+
+        results = {}
+        for label, monitor in (("before (linear scan)", LinearMonitor(roots)), ("after (cache + trie)", WorkspaceMonitor(roots))):
+            elapsed, rejected = run(monitor, candidates)
+            results[label] = (elapsed, rejected)
+            print(f"{label:<22} {elapsed / args.checks * 1e6:10.2f} us/check  ({rejected} rejected)")
+
+    (before, before_rejected), (after, after_rejected) = results.values()
+    assert before_rejected == after_rejected
+    print(f"{'speedup':<22} {before / after:10.1f}x  ({args.roots} roots, {args.checks} checks)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
 """Revit MCP server entrypoint."""
 
-from .server import run_server
-
 __all__ = ["run_server"]
+
+
+def __getattr__(name: str):
+    # Deferred so importing the package (e.g. for ``mcp_server``) does not
+    # load the stdio server, its schemas and handlers.
+    if name == "run_server":
+        from .server import run_server
+
+        return run_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
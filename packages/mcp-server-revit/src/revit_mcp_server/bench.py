@@ -0,0 +1,311 @@
+"""Offline micro-benchmarks for the Python request path (``revit-mcp-bench``).
+
+Each case times one layer with a small, medium and huge payload:
+
+- ``handlers.validate``: ``revit.batch_execute`` payload validation from ``TOOL_VALIDATORS``, without
+  running the operations
+- ``registry.dispatch``: ``TOOL_REGISTRY`` lookup and payload building for each ``revit_batch`` operation
+- ``workspace.check``: ``WorkspaceMonitor.assert_in_workspace`` against a thousand allowed roots
+- ``server.handle_tool``: ``MCPServer.handle_tool`` in mock mode, audit included
+- ``mcp.call_tool``: ``mcp_server.call_tool`` against an in-process bridge returning canned results,
+  always inline; ``mcp.call_tool_spill`` stores every result in the ``ResultStore`` and returns its summary
+- ``bridge.normalize``: ``unwrap_response`` plus ``BridgeClient._normalize_element_ids`` per batch entry
+- ``formatting.auto`` / ``formatting.table``: ``encode_result``
+
+No Revit, bridge or network is needed. Results are written as JSON; passing
+``--baseline`` compares the run against an earlier file and exits with
+status 1 when a case got slower by more than ``--threshold``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+SIZES = {"small": 1, "medium": 100, "huge": 5000}
+WORKSPACE_ROOTS = 1000
+WALL_ARGUMENTS = {"start_x": 0, "start_y": 0, "end_x": 20, "end_y": 0, "height": 12, "level": "L1"}
+
+
+def records(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "element_id": index,
+            "name": f"Level {index}",
+            "elevation": index * 3.5,
+            "category": "Levels",
+            "parameters": {"Mark": f"L{index}", "Comments": ""},
+        }
+        for index in range(count)
+    ]
+
+
+def batch_payload(count: int, output_dir: Path) -> dict[str, Any]:
+    return {
+        "request_id": "bench",
+        "operations": [
+            {"tool": "revit.export_schedules", "payload": {"output_path": str(output_dir / f"schedule-{index}.csv")}}
+            for index in range(count)
+        ],
+    }
+
+
+class _CannedBridge:
+    """In-process stand-in for ``AsyncBridgeClient`` that answers with a fixed result."""
+
+    tool_catalog = None
+
+    def __init__(self, result: dict[str, Any]):
+        self.result = result
+
+    async def call_tool(self, tool: str, payload: dict[str, Any]) -> dict[str, Any]:
+        return self.result
+
+
+def _cases(workspace: Path) -> Iterator[tuple[str, Callable[[int], Callable[[], Any]]]]:
+    from .bridge import BridgeClient
+    from .bridge.client import unwrap_response
+    from .config import Config, get_config
+    from .errors import WorkspaceViolation
+    from .formatting import encode_result
+    from .security.workspace import WorkspaceMonitor
+    from .server import MCPServer
+    from .tools import TOOL_REGISTRY, TOOL_VALIDATORS
+
+    validator = TOOL_VALIDATORS["revit.batch_execute"]
+
+    def validate(count: int) -> Callable[[], Any]:
+        monitor = WorkspaceMonitor([workspace])
+        payload = batch_payload(count, workspace)
+        return lambda: validator(payload, monitor)
+
+    yield "handlers.validate", validate
+
+    spec = TOOL_REGISTRY["revit_batch"]
+
+    def dispatch(count: int) -> Callable[[], Any]:
+        arguments = {"operations": [{"tool": "revit_create_wall", "arguments": WALL_ARGUMENTS}] * count}
+        return lambda: spec.build_payload(arguments)
+
+    yield "registry.dispatch", dispatch
+
+    roots = [workspace / "roots" / f"project-{index // 100}" / f"job-{index}" for index in range(WORKSPACE_ROOTS)]
+    for root in roots:
+        root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(0)
+    # Repeated exports land in the same folders; one in ten is outside every root
+    pool = [
+        (rng.choice(roots) if rng.random() < 0.9 else workspace / "outside") / f"sheet-{index}.pdf"
+        for index in range(500)
+    ]
+    monitor = WorkspaceMonitor(roots)
+
+    def check(count: int) -> Callable[[], Any]:
+        candidates = [rng.choice(pool) for _ in range(count)]
+
+        def run() -> None:
+            for candidate in candidates:
+                try:
+                    monitor.assert_in_workspace(candidate)
+                except WorkspaceViolation:
+                    pass
+
+        return run
+
+    yield "workspace.check", check
+
+    server = MCPServer(Config(
+        workspace_dir=workspace,
+        allowed_directories=[workspace],
+        audit_log=workspace / "audit.log",
+        mode="mock",
+    ))
+
+    def handle_tool(count: int) -> Callable[[], Any]:
+        payload = batch_payload(count, workspace)
+        return lambda: server.handle_tool("revit.batch_execute", payload)
+
+    try:
+        yield "server.handle_tool", handle_tool
+    finally:
+        server.close()
+
+    from . import mcp_server
+    from .results import ResultStore
+
+    config = get_config()
+    saved = mcp_server.bridge, mcp_server.results, config.result_inline_limit
+    mcp_server.results = ResultStore(workspace / ".revit-mcp-results")
+    loop = asyncio.new_event_loop()
+
+    def call_tool(count: int) -> Callable[[], Any]:
+        mcp_server.bridge = _CannedBridge({"levels": records(count)})
+        return lambda: loop.run_until_complete(mcp_server.call_tool("revit_list_levels", {}))
+
+    try:
+        # The huge payload is over the default inline limit; time the inline
+        # path on its own and the ResultStore path as a separate case.
+        config.result_inline_limit = 0
+        yield "mcp.call_tool", call_tool
+        config.result_inline_limit = 1
+        yield "mcp.call_tool_spill", call_tool
+    finally:
+        loop.close()
+        mcp_server.bridge, mcp_server.results, config.result_inline_limit = saved
+
+    client = BridgeClient()
+
+    def normalize(count: int) -> Callable[[], Any]:
+        response = {
+            "Status": "ok",
+            "Result": {"results": [{"index": i, "status": "ok", "result": {"wall_id": i}} for i in range(count)]},
+        }
+
+        def run() -> None:
+            for entry in unwrap_response(response)["results"]:
+                client._normalize_element_ids(entry["result"])
+
+        return run
+
+    yield "bridge.normalize", normalize
+
+    for encoding in ("auto", "table"):
+        def encode(count: int, encoding: str = encoding) -> Callable[[], Any]:
+            result = {"levels": records(count)}
+            return lambda: encode_result(result, encoding)
+
+        yield f"formatting.{encoding}", encode
+
+
+def measure(fn: Callable[[], Any], *, min_time: float, repeat: int) -> dict[str, Any]:
+    """Per-call time of ``fn`` in microseconds over ``repeat`` rounds of at least ``min_time`` seconds."""
+    fn()  # warm caches and lazy imports outside the timed rounds
+    number, elapsed = 1, 0.0
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    rounds = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - started) / number)
+    return {
+        "median_us": round(statistics.median(rounds) * 1e6, 3),
+        "min_us": round(min(rounds) * 1e6, 3),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_suite(
+    *,
+    workspace: Path,
+    min_time: float = 0.2,
+    repeat: int = 5,
+    select: str | None = None,
+    report: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for case, factory in _cases(workspace):
+        for size, count in SIZES.items():
+            key = f"{case}/{size}"
+            if select and select not in key:
+                continue
+            results[key] = {"items": count, **measure(factory(count), min_time=min_time, repeat=repeat)}
+            if report is not None:
+                report(key, results[key])
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """Rows for cases present in both runs; ``regressed`` marks a median slowdown beyond ``threshold``."""
+    rows = []
+    for key, now in current["results"].items():
+        before = baseline.get("results", {}).get(key)
+        if before is None:
+            continue
+        change = now["median_us"] / before["median_us"] - 1 if before["median_us"] else 0.0
+        rows.append({
+            "case": key,
+            "baseline_us": before["median_us"],
+            "current_us": now["median_us"],
+            "change": round(change, 4),
+            "regressed": change > threshold,
+        })
+    return rows
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="revit-mcp-bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path")
+    parser.add_argument("--baseline", type=Path, help="Earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown, e.g. 0.2 for 20%% (default)")
+    parser.add_argument("--select", help="Only run cases whose name contains this text, e.g. 'formatting' or '/huge'")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timed round")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    def report(key: str, result: dict[str, Any]) -> None:
+        print(f"{key:<32} {result['median_us']:>12.2f} us/call  (min {result['min_us']:.2f}, x{result['number']})")
+
+    environ = dict(os.environ)
+    with tempfile.TemporaryDirectory(prefix="revit-mcp-bench-") as tmp:
+        workspace = Path(tmp)
+        # mcp_server builds the process-wide config on first use; point it at
+        # the scratch directory so a standalone run needs no .env.
+        os.environ.update({
+            "MCP_REVIT_WORKSPACE_DIR": str(workspace),
+            "MCP_REVIT_ALLOWED_DIRECTORIES": str(workspace),
+            "MCP_REVIT_AUDIT_LOG": str(workspace / "audit.log"),
+        })
+        try:
+            current = run_suite(
+                workspace=workspace, min_time=args.min_time, repeat=args.repeat, select=args.select, report=report
+            )
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+    rows = compare(json.loads(args.baseline.read_text(encoding="utf-8")), current, args.threshold)
+    print()
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else ""
+        print(f"{row['case']:<32} {row['baseline_us']:>12.2f} -> {row['current_us']:>12.2f} us  {row['change']:+8.1%}  {flag}")
+    regressions = [row for row in rows if row["regressed"]]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,21 @@
-from .client import BridgeClient
-from .mock import MockBridge
+from importlib import import_module
 
-__all__ = ["BridgeClient", "MockBridge"]
+__all__ = ["AsyncBridgeClient", "BridgeClient", "CircuitBreaker", "MockBridge", "ResultCache", "RetryPolicy"]
+
+_EXPORTS = {
+    "AsyncBridgeClient": ".async_client",
+    "BridgeClient": ".client",
+    "CircuitBreaker": ".breaker",
+    "MockBridge": ".mock",
+    "ResultCache": ".cache",
+    "RetryPolicy": ".policy",
+}
+
+
+def __getattr__(name: str):
+    # Loaded on first use: the HTTP clients pull in httpx, which policy-only
+    # importers such as the tool catalog do not need.
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable, Mapping
+
+import httpx
+
+from ..metrics import METRICS, Metrics
+from .batch import BATCH_TOOL, batch_payload
+from .breaker import CircuitBreaker
+from .cache import ResultCache
+from .catalog_store import ToolCatalogStore
+from .client import (
+    CatalogRevalidation,
+    ExecuteExchange,
+    ToolCall,
+    bridge_unreachable,
+    check_health,
+    client_kwargs,
+    normalize_batch,
+    normalize_element_ids,
+)
+from .paging import MAX_PAGE_SIZE, aiter_elements
+from .policy import RetryPolicy
+from .singleflight import AsyncSingleFlight
+
+
+class AsyncBridgeClient:
+    """asyncio counterpart of ``BridgeClient`` built on ``httpx.AsyncClient``.
+
+    Retries, status normalization and element ID normalization match the
+    synchronous client, but waiting on the bridge (or between retries) never
+    blocks the event loop, so concurrent MCP requests progress independently.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:3000",
+        timeout: float = 30,
+        *,
+        connect_timeout: float | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        result_cache: ResultCache | None = None,
+        coalesce_reads: bool = True,
+        catalog_store: ToolCatalogStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        metrics: Metrics | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http_timeout = httpx.Timeout(
+            timeout, connect=connect_timeout if connect_timeout is not None else timeout
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self.result_cache = result_cache
+        self.single_flight = AsyncSingleFlight() if coalesce_reads else None
+        self.catalog_store = catalog_store
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker
+        self.metrics = metrics if metrics is not None else METRICS
+        self._tool_catalog: frozenset[str] | None = None
+
+    @classmethod
+    def from_config(cls, config_obj: Any, base_url: str | None = None) -> "AsyncBridgeClient":
+        """Build a client using the pool and timeout settings from ``Config``."""
+        return cls(**client_kwargs(config_obj, base_url))
+
+    async def __aenter__(self) -> "AsyncBridgeClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @property
+    def tool_catalog(self) -> frozenset[str] | None:
+        """Tool names advertised by the bridge's ``/tools`` endpoint, if fetched."""
+        return self._tool_catalog
+
+    @property
+    def closed(self) -> bool:
+        return self._client is None or self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The client reopens lazily if used again."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def fetch_health(self) -> dict[str, Any]:
+        """``GET /health`` directly; lightweight and not routed through the Revit UI thread."""
+        return await self._get("/health")
+
+    def observe_health(self, previous: Any, current: Any) -> None:
+        """``Heartbeat`` subscriber keeping the result cache and breaker in step with ``/health``."""
+        if current.healthy:
+            if self.result_cache is not None:
+                self.result_cache.observe_document(current.health.get("active_document"))
+            if self.breaker is not None:
+                self.breaker.record_success()
+        elif self.breaker is not None:
+            self.breaker.record_failure()
+
+    async def initialize(self) -> None:
+        """Check bridge health and fetch tool catalog on startup."""
+        try:
+            health = await self._get("/health")
+            check_health(self, health)
+            self._tool_catalog = await self._fetch_catalog(health)
+        except httpx.RequestError as e:
+            raise bridge_unreachable(self.base_url, e) from e
+
+    async def _fetch_catalog(self, health: dict[str, Any]) -> frozenset[str]:
+        catalog = CatalogRevalidation(self, health)
+        if catalog.fresh:
+            return catalog.tools()
+        return catalog.tools(await self._http().get("/tools", headers=catalog.headers))
+
+    async def call_tool(
+        self, tool: str, payload: dict[str, Any], *, cache: bool = True
+    ) -> dict[str, Any]:
+        """Execute a tool with retry logic, serving cacheable reads from the result cache.
+
+        Pass ``cache=False`` to bypass the result cache for this call, e.g. for
+        paged reads that would otherwise fill it.
+        """
+        call = ToolCall(self, tool, payload, cache=cache)
+        if call.hit:
+            return call.cached
+        with call:
+            result = await call.run(lambda: self._execute(tool, payload))
+        return call.store(result)
+
+    async def _execute(self, tool: str, payload: dict[str, Any]) -> dict[str, Any]:
+        with ExecuteExchange(self, tool, payload) as exchange:
+            for attempt in exchange.attempts():
+                try:
+                    with exchange.attempt(attempt) as record:
+                        record(await self._http().post("/execute", json=exchange.body))
+                except httpx.RequestError as e:
+                    await asyncio.sleep(exchange.retry_delay(attempt, e))
+                    continue
+                return exchange.result()
+
+    async def call_batch(
+        self,
+        operations: Iterable[Mapping[str, Any]],
+        *,
+        transaction: bool = False,
+        stop_on_error: bool | None = None,
+    ) -> dict[str, Any]:
+        """Run ordered ``{tool, payload}`` operations in one bridge round trip.
+
+        Returns the batch summary with one entry per executed operation in
+        ``results``; failures are reported per operation instead of raising.
+        """
+        payload = batch_payload(operations, transaction=transaction, stop_on_error=stop_on_error)
+        return normalize_batch(await self.call_tool(BATCH_TOOL, payload))
+
+    def iter_elements(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        page_size: int = MAX_PAGE_SIZE,
+        max_elements: int | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream every element matching ``filters`` from ``revit.get_elements_by_type``.
+
+        Pages are fetched lazily with the next page prefetched while the
+        current one is consumed. Leaving the ``async for`` early stops paging.
+        """
+        return aiter_elements(
+            self, filters, page_size=page_size, max_elements=max_elements, prefetch=prefetch
+        )
+
+    async def send_tool(self, tool_name: str, payload: dict) -> dict:
+        """Legacy method for backward compatibility."""
+        return await self.call_tool(tool_name, payload)
+
+    def _http(self) -> httpx.AsyncClient:
+        # Only touched from the event loop thread, so no lock is needed.
+        client = self._client
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self._http_timeout,
+                limits=self.limits,
+                transport=self._transport,
+            )
+            self._client = client
+        return client
+
+    async def _get(self, path: str) -> dict[str, Any]:
+        resp = await self._http().get(path)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _post(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
+        resp = await self._http().post(path, json=data)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _normalize_element_ids(self, result: dict[str, Any]) -> None:
+        """Normalize specific element ID keys to generic element_id for consistency."""
+        normalize_element_ids(result)
@@ -0,0 +1,82 @@
+"""Multi-operation batches executed in one bridge round trip.
+
+A batch is sent as the ``revit.batch_execute`` bridge tool, so it travels
+through the normal ``/execute`` endpoint and costs a single ``ExternalEvent``
+hop on the Revit side. ``run_batch`` is the Python reference implementation
+of the same contract, used by mock mode and the local stand-in bridge.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Mapping
+
+from ..errors import SchemaValidationError
+
+BATCH_TOOL = "revit.batch_execute"
+
+
+def batch_payload(
+    operations: Iterable[Mapping[str, Any]],
+    *,
+    transaction: bool = False,
+    stop_on_error: bool | None = None,
+) -> dict[str, Any]:
+    """Build the ``revit.batch_execute`` payload from ``{tool, payload}`` operations."""
+    ops = []
+    for index, operation in enumerate(operations):
+        tool = operation.get("tool")
+        if not isinstance(tool, str) or not tool:
+            raise SchemaValidationError(f"Batch operation {index} is missing 'tool'")
+        if tool == BATCH_TOOL:
+            raise SchemaValidationError("Nested batches are not supported")
+        ops.append({"tool": tool, "payload": dict(operation.get("payload") or {})})
+    if not ops:
+        raise SchemaValidationError("A batch needs at least one operation")
+    return {
+        "operations": ops,
+        "transaction": transaction,
+        "stop_on_error": transaction if stop_on_error is None else stop_on_error,
+    }
+
+
+def run_batch(payload: Mapping[str, Any], execute: Callable[[str, dict], Any]) -> dict[str, Any]:
+    """Execute a batch payload operation by operation with ``execute(tool, payload)``.
+
+    Mirrors ``ExecuteBatch`` in ``BridgeCommandFactory.cs``: each operation
+    reports its own status, an operation that raises or returns
+    ``{"status": "error"}`` has failed, ``stop_on_error`` (default: ``transaction``)
+    stops at the first failure, and a failed transactional batch is reported
+    as rolled back.
+    """
+    operations = payload.get("operations")
+    if not isinstance(operations, list):
+        raise SchemaValidationError("Missing 'operations' array")
+    transaction = bool(payload.get("transaction", False))
+    stop_on_error = payload.get("stop_on_error")
+    if stop_on_error is None:
+        stop_on_error = transaction
+
+    results: list[dict[str, Any]] = []
+    failed = 0
+    for index, operation in enumerate(operations):
+        tool = operation.get("tool", "")
+        try:
+            if tool == BATCH_TOOL:
+                raise SchemaValidationError("Nested batches are not supported")
+            result = execute(tool, dict(operation.get("payload") or {}))
+            if isinstance(result, Mapping) and result.get("status") == "error":
+                raise RuntimeError(result.get("message") or "Command reported an error")
+            results.append({"index": index, "tool": tool, "status": "ok", "result": result})
+        except Exception as exc:  # noqa: BLE001
+            failed += 1
+            results.append({"index": index, "tool": tool, "status": "error", "message": str(exc)})
+            if stop_on_error:
+                break
+
+    return {
+        "results": results,
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "skipped": len(operations) - len(results),
+        "transaction": transaction,
+        "rolled_back": transaction and failed > 0,
+    }
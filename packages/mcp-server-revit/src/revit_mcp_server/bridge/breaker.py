@@ -0,0 +1,115 @@
+"""Circuit breaker that fails fast while the bridge is known to be down.
+
+After ``failure_threshold`` consecutive transport failures the breaker opens
+and calls are rejected without touching the network. Once ``reset_timeout``
+seconds have passed it is half-open: a single probe call is let through, and
+its outcome closes the breaker again or re-opens it for another timeout.
+Only failures to reach the bridge count; a tool that reports an error still
+proves the bridge is alive.
+
+A probe that ends without an outcome (cancelled, or failed with an error
+that says nothing about the bridge) is handed back with ``release_probe``.
+One that is never handed back expires after ``reset_timeout``, so a lost
+probe cannot keep the breaker half-open.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable
+
+
+class BreakerState(str, Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = BreakerState.closed
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Whether a call may go to the bridge now; counts it as the probe when half-open."""
+        with self._lock:
+            state = self._current_state()
+            if state == BreakerState.closed:
+                return True
+            if state == BreakerState.half_open and (
+                not self._probing or self._clock() - self._probe_started >= self.reset_timeout
+            ):
+                self._probing = True
+                self._probe_started = self._clock()
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        with self._lock:
+            if self._state != BreakerState.open:
+                return 0.0
+            return max(self._opened_at + self.reset_timeout - self._clock(), 0.0)
+
+    def release_probe(self) -> None:
+        """Let another call probe a half-open breaker; the last probe had no outcome."""
+        with self._lock:
+            if self._state == BreakerState.half_open:
+                self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = BreakerState.closed
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == BreakerState.half_open or (
+                state == BreakerState.closed and self._failures >= self.failure_threshold
+            ):
+                self._state = BreakerState.open
+                self._opened_at = self._clock()
+                self._probing = False
+                self.trips += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            retry_in = self._opened_at + self.reset_timeout - self._clock() if state == BreakerState.open else 0.0
+            return {
+                "state": state.value,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": round(max(retry_in, 0.0), 3),
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+    def _current_state(self) -> BreakerState:
+        if self._state == BreakerState.open and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = BreakerState.half_open
+        return self._state
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from .policy import is_cacheable, is_mutating
+
+# Keys that identify one invocation rather than what is being read.
+_IGNORED_PAYLOAD_KEYS = frozenset({"request_id"})
+
+
+def canonical_key(tool: str, payload: dict[str, Any]) -> str:
+    """Stable key for ``tool`` + ``payload`` independent of dict ordering."""
+    body = {k: v for k, v in payload.items() if k not in _IGNORED_PAYLOAD_KEYS}
+    return tool + "\x00" + json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def active_document(tool: str, result: Any) -> str | None:
+    """Extract the active document name from results that report it."""
+    if not isinstance(result, dict):
+        return None
+    if tool == "revit.health":
+        return result.get("active_document")
+    if tool == "revit.get_document_info":
+        return result.get("title")
+    return None
+
+
+class ResultCache:
+    """Bounded LRU/TTL cache for results of read-only bridge tools.
+
+    Every mutating tool clears the cache, as does a change of the active
+    document. A generation counter guards against a read that started before
+    a mutation repopulating the cache with pre-mutation data.
+
+    Cached results are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 15.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._document: str | None = None
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def lookup(self, tool: str, payload: dict[str, Any]) -> tuple[bool, Any]:
+        """Return ``(True, result)`` on a fresh hit, ``(False, None)`` otherwise."""
+        if not is_cacheable(tool):
+            return False, None
+        key = canonical_key(tool, payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, result = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, result
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def store(self, tool: str, payload: dict[str, Any], result: Any, generation: int) -> None:
+        """Record the outcome of a bridge call that started at ``generation``."""
+        self.observe_document(active_document(tool, result))
+        if is_mutating(tool):
+            self.invalidate()
+            return
+        if not is_cacheable(tool):
+            return
+        key = canonical_key(tool, payload)
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def observe_document(self, document: str | None) -> None:
+        """Clear the cache when the active document differs from the last one seen."""
+        if document is None:
+            return
+        with self._lock:
+            previous, self._document = self._document, document
+        if previous is not None and previous != document:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,83 @@
+"""On-disk cache of the bridge's ``/tools`` catalog.
+
+Entries are keyed by bridge URL, add-in version and Revit version as reported
+by ``/health``, and carry the catalog's ETag. When ``/health`` reports the
+same ``tools_hash`` the cached catalog is used without contacting ``/tools``;
+otherwise ``/tools`` is fetched with ``If-None-Match`` so an unchanged catalog
+costs a ``304`` instead of a download.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+import httpx
+
+
+def catalog_etag(tools: Iterable[str]) -> str:
+    """Same digest ``BridgeServer.cs`` sends: SHA-256 of the names joined by newlines."""
+    return hashlib.sha256("\n".join(tools).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedCatalog:
+    etag: str
+    tools: frozenset[str]
+
+
+def revalidation_headers(cached: CachedCatalog | None) -> dict[str, str]:
+    return {"If-None-Match": f'"{cached.etag}"'} if cached is not None else {}
+
+
+def catalog_from_response(response: httpx.Response, cached: CachedCatalog | None) -> CachedCatalog:
+    """Turn a (possibly conditional) ``/tools`` response into a catalog."""
+    if response.status_code == 304 and cached is not None:
+        return cached
+    response.raise_for_status()
+    tools = response.json().get("tools", [])
+    etag = response.headers.get("ETag", "").strip('"') or catalog_etag(tools)
+    return CachedCatalog(etag=etag, tools=frozenset(tools))
+
+
+def fresh_catalog(cached: CachedCatalog | None, health: Mapping[str, Any]) -> bool:
+    """Whether ``/health`` already proves the cached catalog is current."""
+    return cached is not None and cached.etag == health.get("tools_hash")
+
+
+class ToolCatalogStore:
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def load(self, base_url: str, health: Mapping[str, Any]) -> CachedCatalog | None:
+        try:
+            data = json.loads(self._path(base_url, health).read_text(encoding="utf-8"))
+            return CachedCatalog(etag=data["etag"], tools=frozenset(data["tools"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, base_url: str, health: Mapping[str, Any], catalog: CachedCatalog) -> None:
+        path = self._path(base_url, health)
+        data = {
+            "base_url": base_url,
+            "version": health.get("version"),
+            "revit_version": health.get("revit_version"),
+            "etag": catalog.etag,
+            "tools": sorted(catalog.tools),
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            partial.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(partial, path)
+        except OSError:
+            # The cache is an optimization; a read-only workspace must not
+            # stop the bridge from initializing.
+            pass
+
+    def _path(self, base_url: str, health: Mapping[str, Any]) -> Path:
+        key = json.dumps([base_url, health.get("version"), health.get("revit_version")])
+        return self.directory / f"tools-{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.json"
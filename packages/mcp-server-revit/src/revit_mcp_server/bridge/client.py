@@ -1,113 +1,526 @@
 from __future__ import annotations
 
 import httpx
+import threading
 import time
 import uuid
-from typing import Any
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping
 
-from ..errors import BridgeError
+from ..errors import BridgeError, BridgeUnavailable
+from ..metrics import METRICS, Metrics, ToolMetrics
+from ..tracing import TRACER
+from .batch import BATCH_TOOL, batch_payload
+from .breaker import CircuitBreaker
+from .cache import ResultCache, canonical_key
+from .catalog_store import ToolCatalogStore, catalog_from_response, fresh_catalog, revalidation_headers
+from .paging import MAX_PAGE_SIZE, iter_elements
+from .policy import RetryPolicy, is_mutating, is_read_only, retry_is_safe
+from .singleflight import SingleFlight
+
+# Map specific element type IDs to generic element_id
+_ID_KEYS = (
+    'wall_id', 'floor_id', 'roof_id', 'door_id', 'window_id',
+    'column_id', 'beam_id', 'level_id', 'view_id', 'sheet_id',
+    'room_id', 'grid_id', 'family_instance_id', 'element_id'
+)
+
+
+def breaker_rejection(breaker: CircuitBreaker) -> BridgeUnavailable:
+    return BridgeUnavailable(
+        "Bridge circuit breaker is open after repeated connection failures; "
+        f"next attempt allowed in {breaker.retry_in():.1f}s"
+    )
+
+
+def check_tool_available(catalog: Collection[str] | None, tool: str) -> None:
+    if catalog and tool not in catalog:
+        raise BridgeError(
+            f"Tool '{tool}' not available in bridge ({len(catalog)} tools advertised)."
+        )
+
+
+def normalize_element_ids(result: dict[str, Any]) -> None:
+    """Normalize specific element ID keys to generic element_id for consistency."""
+    if not isinstance(result, dict):
+        return
+    for key in _ID_KEYS:
+        if key in result and 'element_id' not in result:
+            result['element_id'] = result[key]
+            break
+
+
+def unwrap_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``result`` of an ``/execute`` response or raise ``BridgeError``."""
+    # Handle both lowercase (status) and Pascal case (Status) from C# server
+    status = response.get("status") or response.get("Status", "ok")
+    if status == "error":
+        message = response.get("message") or response.get("Message", "Unknown error")
+        stack = response.get("stack_trace") or response.get("StackTrace", "N/A")
+        raise BridgeError(
+            f"Bridge error: {message}\n"
+            f"Stack: {stack}"
+        )
+
+    # Handle both lowercase and Pascal case for Result
+    result = response.get("result") or response.get("Result", {})
+
+    # Normalize element ID keys from specific types to generic element_id
+    normalize_element_ids(result)
+
+    return result
+
+
+def observe_exchange(tool_metrics: ToolMetrics, resp: httpx.Response, round_trip: float) -> dict[str, Any]:
+    """Decode an ``/execute`` response, splitting its round trip into phases.
+
+    The bridge reports how long the command waited for the Revit UI thread
+    (``QueueMs``) and ran on it (``ExecuteMs``); the rest is network and
+    HTTP handling.
+    """
+    response = resp.json()
+    bridge_seconds = 0.0
+    for phase, keys in (("queue", ("queue_ms", "QueueMs")), ("bridge", ("execute_ms", "ExecuteMs"))):
+        value = response.get(keys[0], response.get(keys[1]))
+        if isinstance(value, (int, float)):
+            tool_metrics.observe(phase, value / 1000)
+            bridge_seconds += value / 1000
+    tool_metrics.observe("network", max(round_trip - bridge_seconds, 0.0))
+    return response
+
+
+def client_kwargs(config_obj: Any, base_url: str | None = None) -> dict[str, Any]:
+    """Constructor arguments shared by both bridge clients, from ``Config``."""
+    return {
+        "base_url": base_url or config_obj.bridge_url,
+        "timeout": config_obj.bridge_timeout,
+        "connect_timeout": config_obj.bridge_connect_timeout,
+        "max_connections": config_obj.bridge_max_connections,
+        "max_keepalive_connections": config_obj.bridge_max_keepalive_connections,
+        "keepalive_expiry": config_obj.bridge_keepalive_expiry,
+        "result_cache": (
+            ResultCache(config_obj.result_cache_max_entries, config_obj.result_cache_ttl)
+            if config_obj.result_cache_max_entries > 0
+            else None
+        ),
+        "coalesce_reads": config_obj.bridge_coalesce_reads,
+        "catalog_store": (
+            ToolCatalogStore(config_obj.workspace_dir / ".revit-mcp-cache")
+            if config_obj.tool_catalog_cache
+            else None
+        ),
+        "retry_policy": RetryPolicy(
+            config_obj.bridge_retry_attempts,
+            config_obj.bridge_retry_base_delay,
+            config_obj.bridge_retry_max_delay,
+        ),
+        "breaker": (
+            CircuitBreaker(config_obj.breaker_failure_threshold, config_obj.breaker_reset_timeout)
+            if config_obj.breaker_failure_threshold > 0
+            else None
+        ),
+    }
+
+
+class ExecuteExchange:
+    """Bookkeeping for one ``/execute`` call, shared by both bridge clients.
+
+    It owns the request body, retry policy, circuit breaker, metrics and
+    trace spans; the caller only sends the HTTP request and waits, which is
+    the one step that differs between the synchronous and asyncio clients::
+
+        with ExecuteExchange(self, tool, payload) as exchange:
+            for attempt in exchange.attempts():
+                try:
+                    with exchange.attempt(attempt) as record:
+                        record(self._http().post("/execute", json=exchange.body))
+                except httpx.RequestError as e:
+                    time.sleep(exchange.retry_delay(attempt, e))
+                    continue
+                return exchange.result()
+
+    A breaker probe that ends without an outcome, for example because the
+    call was cancelled, is released on exit so the breaker cannot stay
+    half-open.
+    """
+
+    def __init__(self, client: Any, tool: str, payload: dict[str, Any]):
+        self.tool = tool
+        self.request_id = str(uuid.uuid4())
+        self.body = {"tool": tool, "payload": payload, "request_id": self.request_id}
+        self.policy = client.retry_policy.for_tool(tool)
+        self.breaker: CircuitBreaker | None = client.breaker
+        self._metrics: Metrics = client.metrics
+        self._stack = ExitStack()
+        self._response: httpx.Response | None = None
+        self._started = 0.0
+        self._probe_pending = False
+        self._sent = self._received = 0
+        self._failed = True
+
+    def __enter__(self) -> "ExecuteExchange":
+        stack = self._stack
+        self.span = stack.enter_context(
+            TRACER.span("bridge.execute", tool=self.tool, request_id=self.request_id)
+        )
+        self.tool_metrics = stack.enter_context(self._metrics.timed("bridge", self.tool))
+        stack.callback(self._record)
+        stack.callback(self._release_probe)
+        if self.span.trace_id is not None:
+            # Lets the add-in log lines be joined to the client trace
+            self.body["trace_id"] = self.span.trace_id
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool | None:
+        return self._stack.__exit__(*exc_info)
+
+    def attempts(self) -> Iterator[int]:
+        """Attempt numbers allowed by the retry policy, gated by the breaker."""
+        for attempt in range(self.policy.max_attempts):
+            if self.breaker is not None:
+                if not self.breaker.allow():
+                    raise breaker_rejection(self.breaker)
+                self._probe_pending = True
+            yield attempt
+        raise BridgeError(f"Retry policy for '{self.tool}' allows no attempts")
+
+    @contextmanager
+    def attempt(self, attempt: int) -> Iterator[Callable[[httpx.Response], None]]:
+        """Trace one HTTP attempt; call the yielded function with its response."""
+        self._started = time.perf_counter()
+        with TRACER.span("bridge.http", attempt=attempt + 1) as http_span:
+            def record(resp: httpx.Response) -> None:
+                http_span.set("status_code", resp.status_code)
+                self._sent += len(resp.request.content)
+                self._received += len(resp.content)
+                self._response = resp
+                if not resp.is_success:
+                    # The bridge answered, so it is reachable.
+                    self._outcome(success=True)
+                resp.raise_for_status()
+
+            yield record
+
+    def retry_delay(self, attempt: int, error: httpx.RequestError) -> float:
+        """Seconds to wait before retrying after a transport error, or raise ``BridgeError``."""
+        self._outcome(success=False)
+        if attempt < self.policy.max_attempts - 1 and retry_is_safe(self.tool, error):
+            self.tool_metrics.record_retry()
+            self.span.set("retries", attempt + 1)
+            return self.policy.delay(attempt)
+        raise BridgeError(
+            f"Bridge request failed after {attempt + 1} attempts: {error}"
+        ) from error
+
+    def result(self) -> dict[str, Any]:
+        """Decode and unwrap the successful response."""
+        self._outcome(success=True)
+        with TRACER.span("bridge.normalize"):
+            response = observe_exchange(self.tool_metrics, self._response, time.perf_counter() - self._started)
+            result = unwrap_response(response)
+        self._failed = False
+        return result
+
+    def _record(self) -> None:
+        self.tool_metrics.record(error=self._failed, request_bytes=self._sent, response_bytes=self._received)
+
+    def _release_probe(self) -> None:
+        if self._probe_pending:
+            self.breaker.release_probe()
+
+    def _outcome(self, *, success: bool) -> None:
+        self._probe_pending = False
+        if self.breaker is not None:
+            if success:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+
+def check_health(client: Any, health: dict[str, Any]) -> None:
+    """Raise ``BridgeError`` unless ``/health`` reports healthy; track the open document."""
+    if health.get("status") != "healthy":
+        raise BridgeError(f"Bridge unhealthy: {health}")
+    if client.result_cache is not None:
+        client.result_cache.observe_document(health.get("active_document"))
+
+
+def bridge_unreachable(base_url: str, error: httpx.RequestError) -> BridgeError:
+    return BridgeError(
+        f"Bridge unreachable at {base_url}. "
+        f"Ensure Revit is running with RevitMCP add-in loaded. Error: {error}"
+    )
+
+
+def normalize_batch(result: dict[str, Any]) -> dict[str, Any]:
+    """Normalize element IDs in every per-operation result of a batch summary."""
+    for entry in result.get("results", []):
+        normalize_element_ids(entry.get("result"))
+    return result
+
+
+def forget_reads(client: Any) -> None:
+    """Drop cached and in-flight reads after the model may have changed."""
+    # Reads issued from now on must not join flights that began before
+    # the model changed, nor be answered from the cache.
+    if client.single_flight is not None:
+        client.single_flight.forget_all()
+    if client.result_cache is not None:
+        client.result_cache.invalidate()
+
+
+class CatalogRevalidation:
+    """Tool catalog lookup shared by both bridge clients.
+
+    The cached catalog is used as is while ``/health`` vouches for it;
+    otherwise the caller sends ``GET /tools`` with ``headers`` and passes the
+    response to ``tools``::
+
+        catalog = CatalogRevalidation(self, health)
+        if catalog.fresh:
+            return catalog.tools()
+        return catalog.tools(self._http().get("/tools", headers=catalog.headers))
+    """
+
+    def __init__(self, client: Any, health: dict[str, Any]):
+        self._store: ToolCatalogStore | None = client.catalog_store
+        self._base_url = client.base_url
+        self._health = health
+        self._cached = self._store.load(self._base_url, health) if self._store is not None else None
+        self.fresh = fresh_catalog(self._cached, health)
+        self.headers = revalidation_headers(self._cached)
+
+    def tools(self, resp: httpx.Response | None = None) -> frozenset[str]:
+        if resp is None:
+            return self._cached.tools
+        catalog = catalog_from_response(resp, self._cached)
+        if self._store is not None and catalog is not self._cached:
+            self._store.save(self._base_url, self._health, catalog)
+        return catalog.tools
+
+
+class ToolCall:
+    """Result cache, single-flight and mutation policy for one ``call_tool``.
+
+    Like ``ExecuteExchange`` it leaves only the waiting to the client::
+
+        call = ToolCall(self, tool, payload, cache=cache)
+        if call.hit:
+            return call.cached
+        with call:
+            result = call.run(lambda: self._execute(tool, payload))
+        return call.store(result)
+
+    ``run`` returns whatever the client's single-flight group or ``execute``
+    returns, so the asyncio client awaits it. Leaving the ``with`` block after
+    a mutation, even a failed one since it may still have changed part of the
+    model, drops cached and in-flight reads.
+    """
+
+    def __init__(self, client: Any, tool: str, payload: dict[str, Any], *, cache: bool = True):
+        check_tool_available(client.tool_catalog, tool)
+        self._client = client
+        self.tool = tool
+        self.payload = payload
+        self._cache: ResultCache | None = client.result_cache if cache else None
+        self.hit = False
+        self.cached: Any = None
+        self._generation = 0
+        if self._cache is not None:
+            self.hit, self.cached = self._cache.lookup(tool, payload)
+            self._generation = self._cache.generation
+
+    def __enter__(self) -> "ToolCall":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if is_mutating(self.tool):
+            forget_reads(self._client)
+
+    def run(self, execute: Callable[[], Any]) -> Any:
+        flights = self._client.single_flight
+        if flights is not None and is_read_only(self.tool):
+            # Identical concurrent reads share one bridge round trip.
+            return flights.do(canonical_key(self.tool, self.payload), execute)
+        return execute()
+
+    def store(self, result: dict[str, Any]) -> dict[str, Any]:
+        if self._cache is not None:
+            self._cache.store(self.tool, self.payload, result, self._generation)
+        return result
 
 
 class BridgeClient:
-    def __init__(self, base_url: str = "http://127.0.0.1:3000", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:3000",
+        timeout: float = 30,
+        *,
+        connect_timeout: float | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        result_cache: ResultCache | None = None,
+        coalesce_reads: bool = True,
+        catalog_store: ToolCatalogStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        metrics: Metrics | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self._tool_catalog: list[str] | None = None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http_timeout = httpx.Timeout(
+            timeout, connect=connect_timeout if connect_timeout is not None else timeout
+        )
+        self._transport = transport
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self.result_cache = result_cache
+        self.single_flight = SingleFlight() if coalesce_reads else None
+        self.catalog_store = catalog_store
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker
+        self.metrics = metrics if metrics is not None else METRICS
+        self._tool_catalog: frozenset[str] | None = None
+
+    @classmethod
+    def from_config(cls, config_obj: Any, base_url: str | None = None) -> "BridgeClient":
+        """Build a client using the pool and timeout settings from ``Config``."""
+        return cls(**client_kwargs(config_obj, base_url))
+
+    def __enter__(self) -> "BridgeClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def tool_catalog(self) -> frozenset[str] | None:
+        """Tool names advertised by the bridge's ``/tools`` endpoint, if fetched."""
+        return self._tool_catalog
+
+    @property
+    def closed(self) -> bool:
+        return self._client is None or self._client.is_closed
+
+    def close(self) -> None:
+        """Close pooled connections. The client reopens lazily if used again."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
 
     def initialize(self) -> None:
         """Check bridge health and fetch tool catalog on startup."""
         try:
             health = self._get("/health")
-            if health.get("status") != "healthy":
-                raise BridgeError(f"Bridge unhealthy: {health}")
-
-            tools_resp = self._get("/tools")
-            self._tool_catalog = tools_resp.get("tools", [])
-
+            check_health(self, health)
+            self._tool_catalog = self._fetch_catalog(health)
         except httpx.RequestError as e:
-            raise BridgeError(
-                f"Bridge unreachable at {self.base_url}. "
-                f"Ensure Revit is running with RevitMCP add-in loaded. Error: {e}"
-            ) from e
-
-    def call_tool(self, tool: str, payload: dict[str, Any]) -> dict[str, Any]:
-        """Execute a tool with retry logic."""
-        if self._tool_catalog and tool not in self._tool_catalog:
-            raise BridgeError(
-                f"Tool '{tool}' not available in bridge. "
-                f"Available tools: {', '.join(self._tool_catalog)}"
-            )
-
-        request_id = str(uuid.uuid4())
-        last_error = None
-
-        for attempt in range(3):
-            try:
-                response = self._post(
-                    "/execute",
-                    {"tool": tool, "payload": payload, "request_id": request_id}
-                )
-
-                # Handle both lowercase (status) and Pascal case (Status) from C# server
-                status = response.get("status") or response.get("Status", "ok")
-                if status == "error":
-                    message = response.get("message") or response.get("Message", "Unknown error")
-                    stack = response.get("stack_trace") or response.get("StackTrace", "N/A")
-                    raise BridgeError(
-                        f"Bridge error: {message}\n"
-                        f"Stack: {stack}"
-                    )
+            raise bridge_unreachable(self.base_url, e) from e
 
-                # Handle both lowercase and Pascal case for Result
-                result = response.get("result") or response.get("Result", {})
+    def _fetch_catalog(self, health: dict[str, Any]) -> frozenset[str]:
+        catalog = CatalogRevalidation(self, health)
+        if catalog.fresh:
+            return catalog.tools()
+        return catalog.tools(self._http().get("/tools", headers=catalog.headers))
 
-                # Normalize element ID keys from specific types to generic element_id
-                self._normalize_element_ids(result)
+    def call_tool(
+        self, tool: str, payload: dict[str, Any], *, cache: bool = True
+    ) -> dict[str, Any]:
+        """Execute a tool with retry logic, serving cacheable reads from the result cache.
 
-                return result
+        Pass ``cache=False`` to bypass the result cache for this call, e.g. for
+        paged reads that would otherwise fill it.
+        """
+        call = ToolCall(self, tool, payload, cache=cache)
+        if call.hit:
+            return call.cached
+        with call:
+            result = call.run(lambda: self._execute(tool, payload))
+        return call.store(result)
 
-            except httpx.RequestError as e:
-                last_error = e
-                if attempt < 2:
-                    delay = 2 ** attempt  # 1s, 2s
-                    time.sleep(delay)
+    def _execute(self, tool: str, payload: dict[str, Any]) -> dict[str, Any]:
+        with ExecuteExchange(self, tool, payload) as exchange:
+            for attempt in exchange.attempts():
+                try:
+                    with exchange.attempt(attempt) as record:
+                        record(self._http().post("/execute", json=exchange.body))
+                except httpx.RequestError as e:
+                    time.sleep(exchange.retry_delay(attempt, e))
                     continue
-                raise BridgeError(
-                    f"Bridge request failed after 3 attempts: {e}"
-                ) from e
+                return exchange.result()
+
+    def call_batch(
+        self,
+        operations: Iterable[Mapping[str, Any]],
+        *,
+        transaction: bool = False,
+        stop_on_error: bool | None = None,
+    ) -> dict[str, Any]:
+        """Run ordered ``{tool, payload}`` operations in one bridge round trip.
 
-        raise BridgeError(f"Bridge request failed: {last_error}") from last_error
+        Returns the batch summary with one entry per executed operation in
+        ``results``; failures are reported per operation instead of raising.
+        """
+        payload = batch_payload(operations, transaction=transaction, stop_on_error=stop_on_error)
+        return normalize_batch(self.call_tool(BATCH_TOOL, payload))
+
+    def iter_elements(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        *,
+        page_size: int = MAX_PAGE_SIZE,
+        max_elements: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream every element matching ``filters`` from ``revit.get_elements_by_type``.
+
+        Pages are fetched lazily with the next page prefetched on a worker
+        thread while the current one is consumed. Closing the iterator (or
+        breaking out of the loop) stops paging.
+        """
+        return iter_elements(
+            self, filters, page_size=page_size, max_elements=max_elements, prefetch=prefetch
+        )
 
     def send_tool(self, tool_name: str, payload: dict) -> dict:
         """Legacy method for backward compatibility."""
         return self.call_tool(tool_name, payload)
 
+    def _http(self) -> httpx.Client:
+        # httpx.Client is safe to share between threads once built; the lock
+        # only guards lazy construction and replacement after close().
+        client = self._client
+        if client is None or client.is_closed:
+            with self._client_lock:
+                client = self._client
+                if client is None or client.is_closed:
+                    client = httpx.Client(
+                        base_url=self.base_url,
+                        timeout=self._http_timeout,
+                        limits=self.limits,
+                        transport=self._transport,
+                    )
+                    self._client = client
+        return client
+
     def _get(self, path: str) -> dict[str, Any]:
-        with httpx.Client() as client:
-            resp = client.get(f"{self.base_url}{path}", timeout=self.timeout)
-            resp.raise_for_status()
-            return resp.json()
+        resp = self._http().get(path)
+        resp.raise_for_status()
+        return resp.json()
 
     def _post(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
-        with httpx.Client() as client:
-            resp = client.post(
-                f"{self.base_url}{path}",
-                json=data,
-                timeout=self.timeout
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = self._http().post(path, json=data)
+        resp.raise_for_status()
+        return resp.json()
 
     def _normalize_element_ids(self, result: dict[str, Any]) -> None:
         """Normalize specific element ID keys to generic element_id for consistency."""
-        # Map specific element type IDs to generic element_id
-        id_keys = [
-            'wall_id', 'floor_id', 'roof_id', 'door_id', 'window_id',
-            'column_id', 'beam_id', 'level_id', 'view_id', 'sheet_id',
-            'room_id', 'grid_id', 'family_instance_id', 'element_id'
-        ]
-
-        for key in id_keys:
-            if key in result and 'element_id' not in result:
-                result['element_id'] = result[key]
-                break
+        normalize_element_ids(result)
@@ -0,0 +1,119 @@
+"""Background ``GET /health`` polling with a cached snapshot.
+
+``Heartbeat`` keeps the latest bridge health (uptime, Revit version, active
+document, recent latency) so ``revit_health`` can be answered without a
+trip through ``/execute`` and the Revit UI thread. Subscribers are called
+whenever liveness, the active document or the Revit version changes.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+Subscriber = Callable[["HealthSnapshot | None", "HealthSnapshot"], None]
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    healthy: bool
+    checked_at: float
+    latency_ms: float
+    health: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    recent_latency_ms: tuple[float, ...] = ()
+
+    @property
+    def state(self) -> tuple[Any, ...]:
+        """Fields whose change is reported to subscribers."""
+        return self.healthy, self.health.get("active_document"), self.health.get("revit_version")
+
+    def age(self, now: float | None = None) -> float:
+        return (time.time() if now is None else now) - self.checked_at
+
+    def as_result(self) -> dict[str, Any]:
+        """``revit_health`` result served from the snapshot."""
+        recent = sorted(self.recent_latency_ms)
+        result = dict(self.health) if self.healthy else {"status": "unreachable", "error": self.error}
+        result.update({
+            "checked_at": datetime.fromtimestamp(self.checked_at, timezone.utc).isoformat(),
+            "age_seconds": round(self.age(), 3),
+            "latency_ms": round(self.latency_ms, 3),
+            "recent_latency_ms": {
+                "p50": round(recent[len(recent) // 2], 3) if recent else None,
+                "max": round(recent[-1], 3) if recent else None,
+            },
+            "source": "heartbeat",
+        })
+        return result
+
+
+class Heartbeat:
+    def __init__(self, client: Any, interval: float = 5.0, *, history: int = 20):
+        self.client = client
+        self.interval = interval
+        self.snapshot: HealthSnapshot | None = None
+        self._latencies: deque[float] = deque(maxlen=history)
+        self._subscribers: list[Subscriber] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Call ``callback(previous, current)`` on state changes; returns an unsubscribe function."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def fresh_snapshot(self) -> HealthSnapshot | None:
+        """The snapshot, unless two intervals have passed without a poll."""
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.age() > 2 * self.interval:
+            return None
+        return snapshot
+
+    async def poll_once(self) -> HealthSnapshot:
+        started = time.perf_counter()
+        try:
+            health = await self.client.fetch_health()
+            healthy, error = health.get("status") == "healthy", None
+        except Exception as exc:  # noqa: BLE001 - any failure means unreachable
+            health, healthy, error = {}, False, str(exc) or type(exc).__name__
+        latency_ms = (time.perf_counter() - started) * 1000
+        if healthy:
+            self._latencies.append(latency_ms)
+        previous = self.snapshot
+        self.snapshot = HealthSnapshot(
+            healthy=healthy,
+            checked_at=time.time(),
+            latency_ms=latency_ms,
+            health=health,
+            error=error,
+            recent_latency_ms=tuple(self._latencies),
+        )
+        if previous is None or previous.state != self.snapshot.state:
+            for callback in list(self._subscribers):
+                try:
+                    callback(previous, self.snapshot)
+                except Exception:  # noqa: BLE001 - a subscriber must not stop the heartbeat
+                    pass
+        return self.snapshot
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="bridge-heartbeat")
+        return self._task
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            await self.poll_once()
+            await asyncio.sleep(self.interval)
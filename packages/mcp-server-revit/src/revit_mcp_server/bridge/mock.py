@@ -2,9 +2,26 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from .model import SimulatedModel
+
 
 class MockBridge:
+    """Bridge stand-in for mock mode.
+
+    Without a model every tool gets a canned ``mock-response``. With a
+    ``SimulatedModel`` the tools it implements run against it and return
+    what the add-in would, as ``BridgeClient.call_tool`` does.
+    """
+
+    def __init__(self, model: SimulatedModel | None = None):
+        self.model = model
+
+    def supports(self, tool_name: str) -> bool:
+        return self.model is not None and tool_name in self.model.tools
+
     def send_tool(self, tool_name: str, payload: dict) -> dict:
+        if self.supports(tool_name):
+            return self.model.execute(tool_name, payload)
         now = datetime.utcnow().isoformat()
         return {
             "tool": tool_name,
@@ -0,0 +1,574 @@
+"""In-memory Revit model for mock mode and the stand-in bridge.
+
+``SimulatedModel`` holds levels, views, sheets, element types and elements,
+and answers a subset of the bridge tools with the result shapes
+``BridgeCommandFactory.cs`` produces. Elements live in column arrays (one
+``array`` per attribute, indexed by row) instead of one object per element.
+That keeps a million-element model at a few tens of megabytes. Element IDs
+are contiguous, so the row of an element is its ID minus ``ELEMENT_ID_BASE``.
+
+``SimulatedModel.generate`` builds a deterministic synthetic model of any
+size from a seed. Units follow the Revit API: lengths in feet.
+"""
+from __future__ import annotations
+
+import math
+import random
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from .batch import BATCH_TOOL, run_batch
+from .paging import MAX_PAGE_SIZE
+
+ELEMENT_ID_BASE = 100000
+TYPE_ID_BASE = 2000
+LEVEL_ID_BASE = 300
+VIEW_ID_BASE = 10000
+SHEET_ID_BASE = 50000
+
+LEVEL_HEIGHT_FT = 12.0
+SITE_EXTENT_FT = 600.0
+
+# Instance parameters every element has, with their default values.
+# Length, Area and Volume are computed from the bounding box and read-only.
+PARAMETERS = {"Mark": "", "Comments": "", "Phase Created": "New Construction"}
+COMPUTED_PARAMETERS = ("Length", "Area", "Volume")
+
+
+@dataclass(frozen=True)
+class CategorySpec:
+    name: str
+    weight: float
+    family: str
+    types: tuple[str, ...]
+    size_ft: tuple[float, float, float]
+
+
+CATEGORIES = (
+    CategorySpec("Walls", 0.20, "Basic Wall", ("Generic - 200mm", "Exterior - Brick on CMU", "Interior - 135mm Partition"), (20.0, 0.7, 11.0)),
+    CategorySpec("Floors", 0.03, "Floor", ("Generic 300mm", "Concrete Slab 200mm"), (40.0, 30.0, 1.0)),
+    CategorySpec("Doors", 0.07, "Single-Flush", ("0915 x 2134mm", "0813 x 2134mm"), (3.0, 0.7, 7.0)),
+    CategorySpec("Windows", 0.08, "Fixed", ("0915 x 1220mm", "1220 x 1830mm"), (4.0, 0.5, 5.0)),
+    CategorySpec("Structural Columns", 0.05, "Concrete-Rectangular-Column", ("300 x 450mm", "450 x 600mm"), (1.5, 1.5, 12.0)),
+    CategorySpec("Structural Framing", 0.10, "W Shapes", ("W310X38.7", "W410X60"), (25.0, 0.7, 1.3)),
+    CategorySpec("Furniture", 0.15, "Desk", ("1525 x 762mm", "1830 x 915mm"), (5.0, 2.5, 2.5)),
+    CategorySpec("Pipes", 0.15, "Pipe Types", ("Standard", "PVC - DWV"), (15.0, 0.3, 0.3)),
+    CategorySpec("Ducts", 0.12, "Rectangular Duct", ("Radius Elbows / Taps", "Mitered Elbows / Taps"), (12.0, 1.5, 1.0)),
+    CategorySpec("Rooms", 0.05, "Room", ("Room",), (20.0, 15.0, 10.0)),
+)
+
+_CATEGORY_KEYS = {spec.name.lower().replace(" ", "_"): index for index, spec in enumerate(CATEGORIES)}
+_CATEGORY_KEYS["beams"] = _CATEGORY_KEYS["structural_framing"]
+_CATEGORY_KEYS["columns"] = _CATEGORY_KEYS["structural_columns"]
+
+
+def _category_index(name: str) -> int:
+    try:
+        return _CATEGORY_KEYS[name.lower().replace(" ", "_")]
+    except KeyError:
+        raise ValueError(
+            f"Unknown category: '{name}'. Supported: {', '.join(sorted(_CATEGORY_KEYS))}"
+        ) from None
+
+
+class SimulatedModel:
+    def __init__(self, title: str = "Simulated Model"):
+        self.title = title
+        self._lock = threading.RLock()
+        self.levels: list[dict[str, Any]] = []
+        self.views: list[dict[str, Any]] = []
+        self.sheets: list[dict[str, Any]] = []
+        # Element types: parallel lists indexed by type row
+        self.type_names: list[str] = []
+        self.type_categories = array("B")
+        self._types_by_category: list[list[int]] = [[] for _ in CATEGORIES]
+        for index, spec in enumerate(CATEGORIES):
+            for name in spec.types:
+                self._types_by_category[index].append(len(self.type_names))
+                self.type_names.append(name)
+                self.type_categories.append(index)
+        # Element columns, indexed by row
+        self.category = array("B")
+        self.type_row = array("H")
+        self.level_row = array("H")
+        self.bbox_min = (array("f"), array("f"), array("f"))
+        self.bbox_size = (array("f"), array("f"), array("f"))
+        # Parameter columns are materialized on first write
+        self._parameters: dict[str, list[Any]] = {}
+        # Rows per category, built on the first category query
+        self._category_rows: list[array] | None = None
+        self._selections: dict[tuple, array] = {}
+        # Old parameter values written during a transactional batch
+        self._undo: list[tuple[str, list[int], list[Any]]] | None = None
+        self.tools: dict[str, Callable[[dict], Any]] = {
+            "revit.get_document_info": self.document_info,
+            "revit.list_levels": self.list_levels,
+            "revit.list_views": self.list_views,
+            "revit.list_sheets": self.list_sheets,
+            "revit.list_elements_by_category": self.list_elements_by_category,
+            "revit.get_elements_by_type": self.get_elements_by_type,
+            "revit.get_element_parameters": self.get_element_parameters,
+            "revit.get_parameter_value": self.get_parameter_value,
+            "revit.set_parameter_value": self.set_parameter_value,
+            "revit.batch_set_parameters_by_filter": self.batch_set_parameters_by_filter,
+            "revit.get_element_bounding_box": self.get_element_bounding_box,
+            "revit.create_level": self.create_level,
+            "revit.create_wall": self.create_wall,
+            "revit.create_floor": self.create_floor,
+            "revit.create_sheet": self.create_sheet,
+            BATCH_TOOL: self.batch_execute,
+        }
+
+    @classmethod
+    def generate(cls, elements: int = 10000, *, levels: int | None = None, seed: int = 0) -> "SimulatedModel":
+        """Deterministic synthetic model: same ``elements``, ``levels`` and ``seed``, same model."""
+        rng = random.Random(seed)
+        model = cls(f"Simulated {elements} elements (seed {seed})")
+        level_count = levels if levels is not None else max(3, min(100, elements // 10000 + 3))
+        for index in range(level_count):
+            model._add_level(f"L{index + 1}", index * LEVEL_HEIGHT_FT)
+        for level in model.levels:
+            model._add_view(f"{level['name']} - Floor Plan", "FloorPlan", 100)
+            model._add_view(f"{level['name']} - Ceiling Plan", "CeilingPlan", 100)
+        model._add_view("{3D}", "ThreeD", 100)
+        for index in range(max(2, elements // 20000)):
+            model._add_view(f"Section {index + 1}", "Section", 50)
+        for index in range(max(5, elements // 2000)):
+            model._add_sheet(f"A{index + 101}", f"Sheet {index + 1}")
+
+        categories = rng.choices(range(len(CATEGORIES)), weights=[spec.weight for spec in CATEGORIES], k=elements)
+        model.category.extend(categories)
+        choices = model._types_by_category
+        model.type_row.extend(choices[c][int(rng.random() * len(choices[c]))] for c in categories)
+        model.level_row.extend(int(rng.random() * level_count) for _ in range(elements))
+        sizes = [CATEGORIES[c].size_ft for c in categories]
+        # Linear elements (walls, framing, pipes, ducts) run along x or y at random
+        sizes = [size if rng.random() < 0.5 else (size[1], size[0], size[2]) for size in sizes]
+        for axis in range(3):
+            model.bbox_size[axis].extend(size[axis] * (0.5 + rng.random()) for size in sizes)
+        model.bbox_min[0].extend(rng.random() * SITE_EXTENT_FT for _ in range(elements))
+        model.bbox_min[1].extend(rng.random() * SITE_EXTENT_FT for _ in range(elements))
+        elevations = [level["elevation"] for level in model.levels]
+        model.bbox_min[2].extend(elevations[row] for row in model.level_row)
+        return model
+
+    @property
+    def element_count(self) -> int:
+        return len(self.category)
+
+    def execute(self, tool: str, payload: dict) -> Any:
+        """Run one bridge tool against the model."""
+        handler = self.tools.get(tool)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {tool}")
+        with self._lock:
+            return handler(payload)
+
+    def batch_execute(self, payload: dict) -> dict[str, Any]:
+        """``revit.batch_execute``; a failed transactional batch leaves the model as it was."""
+        if not payload.get("transaction"):
+            return run_batch(payload, self.execute)
+        with self._lock:
+            mark = self._savepoint()
+            try:
+                result = run_batch(payload, self.execute)
+            except BaseException:
+                self._rollback(mark)
+                raise
+            if result["rolled_back"]:
+                self._rollback(mark)
+            else:
+                self._undo = None
+            return result
+
+    def _savepoint(self) -> tuple:
+        # Everything but parameter values is append-only, so lengths are
+        # enough to undo it; parameter writes are logged by _set.
+        self._undo = []
+        return len(self.levels), len(self.views), len(self.sheets), len(self.category), set(self._parameters)
+
+    def _rollback(self, mark: tuple) -> None:
+        levels, views, sheets, rows, parameters = mark
+        undo, self._undo = self._undo, None
+        for name, written, old in reversed(undo):
+            column = self._parameters[name]
+            for row, value in zip(written, old):
+                column[row] = value
+        for name in set(self._parameters) - parameters:
+            del self._parameters[name]
+        del self.levels[levels:], self.views[views:], self.sheets[sheets:]
+        for column in (self.category, self.type_row, self.level_row, *self.bbox_min, *self.bbox_size):
+            del column[rows:]
+        for column in self._parameters.values():
+            del column[rows:]
+        self._category_rows = None
+        self._selections.clear()
+
+    # -- model building -------------------------------------------------
+
+    def _add_level(self, name: str, elevation: float) -> dict[str, Any]:
+        level = {"id": LEVEL_ID_BASE + len(self.levels), "name": name, "elevation": elevation}
+        self.levels.append(level)
+        self._selections.clear()  # an unknown level name may now filter
+        return level
+
+    def _add_view(self, name: str, view_type: str, scale: int) -> None:
+        self.views.append({
+            "id": VIEW_ID_BASE + len(self.views),
+            "name": name,
+            "type": view_type,
+            "scale": scale,
+            "detail_level": "Medium" if view_type != "ThreeD" else "Fine",
+        })
+
+    def _add_sheet(self, number: str, name: str, placeholder: bool = False) -> dict[str, Any]:
+        sheet = {
+            "id": SHEET_ID_BASE + len(self.sheets),
+            "sheet_number": number,
+            "sheet_name": name,
+            "is_placeholder": placeholder,
+            "titleblock_id": None,
+            "viewport_count": 0,
+        }
+        self.sheets.append(sheet)
+        return sheet
+
+    def _add_element(self, category: int, type_row: int, level_row: int, origin: tuple, size: tuple) -> int:
+        row = len(self.category)
+        self.category.append(category)
+        self.type_row.append(type_row)
+        self.level_row.append(level_row)
+        for axis in range(3):
+            self.bbox_min[axis].append(origin[axis])
+            self.bbox_size[axis].append(size[axis])
+        for column in self._parameters.values():
+            column.append(None)
+        if self._category_rows is not None:
+            self._category_rows[category].append(row)
+        self._selections.clear()
+        return ELEMENT_ID_BASE + row
+
+    # -- lookups --------------------------------------------------------
+
+    def _row(self, element_id: Any) -> int:
+        row = int(element_id) - ELEMENT_ID_BASE
+        if not 0 <= row < len(self.category):
+            raise ValueError(f"Element with ID {element_id} not found")
+        return row
+
+    def _level_row(self, name: str) -> int:
+        for row, level in enumerate(self.levels):
+            if level["name"].lower() == str(name).lower():
+                return row
+        raise ValueError(f"Level '{name}' not found")
+
+    def _parameter(self, row: int, name: str) -> Any:
+        if name in COMPUTED_PARAMETERS:
+            return self._measure(row, name.lower())
+        if name not in PARAMETERS:
+            return None
+        column = self._parameters.get(name)
+        value = column[row] if column is not None else None
+        return PARAMETERS[name] if value is None else value
+
+    def _measure(self, row: int, quantity: str) -> float:
+        dx, dy, dz = (size[row] for size in self.bbox_size)
+        if quantity == "length":
+            value = max(dx, dy)
+        elif quantity == "area":
+            value = dx * dy
+        else:
+            value = dx * dy * dz
+        return round(value, 3)
+
+    def _select(self, criteria: Mapping[str, Any]) -> array:
+        """Rows matching category, type, level and parameter criteria, in ID order."""
+        category = criteria.get("category")
+        type_id = criteria.get("type_id")
+        level = criteria.get("level")
+        parameter_filter = criteria.get("parameter_filter")
+        key = (
+            category,
+            type_id,
+            level,
+            (parameter_filter.get("name"), str(parameter_filter.get("value"))) if parameter_filter else None,
+        )
+        rows = self._selections.get(key)
+        if rows is not None:
+            return rows
+
+        rows: Any = range(len(self.category))
+        if category is not None:
+            rows = self._rows_in_category(_category_index(category))
+        if type_id is not None:
+            wanted = int(type_id) - TYPE_ID_BASE
+            column = self.type_row
+            rows = [row for row in rows if column[row] == wanted]
+        if level is not None:
+            try:
+                wanted = self._level_row(level)
+            except ValueError:
+                wanted = None  # like the add-in, an unknown level does not filter
+            if wanted is not None:
+                column = self.level_row
+                rows = [row for row in rows if column[row] == wanted]
+        if parameter_filter:
+            name, value = key[3]
+            rows = [row for row in rows if _as_string(self._parameter(row, name)) == value]
+        rows = array("I", rows)
+        if len(self._selections) >= 16:
+            self._selections.pop(next(iter(self._selections)))
+        self._selections[key] = rows
+        return rows
+
+    def _rows_in_category(self, category: int) -> array:
+        if self._category_rows is None:
+            index = [array("I") for _ in CATEGORIES]
+            appenders = [rows.append for rows in index]
+            for row, value in enumerate(self.category):
+                appenders[value](row)
+            self._category_rows = index
+        return self._category_rows[category]
+
+    def _element_summary(self, row: int, fields: set[str] | None) -> dict[str, Any]:
+        element: dict[str, Any] = {"id": ELEMENT_ID_BASE + row}
+        want = (lambda field: True) if fields is None else fields.__contains__
+        if want("name"):
+            element["name"] = self.type_names[self.type_row[row]]
+        if want("category"):
+            element["category"] = CATEGORIES[self.category[row]].name
+        if want("type_id"):
+            element["type_id"] = TYPE_ID_BASE + self.type_row[row]
+        if want("level"):
+            element["level"] = self.levels[self.level_row[row]]["name"]
+        for quantity in ("length", "area", "volume"):
+            if want(quantity):
+                element[quantity] = self._measure(row, quantity)
+        return element
+
+    # -- tools ----------------------------------------------------------
+
+    def document_info(self, payload: dict) -> dict[str, Any]:
+        return {
+            "title": self.title,
+            "path": "unsaved",
+            "is_modified": False,
+            "is_family": False,
+            "is_workshared": False,
+            "project_name": self.title,
+            "project_number": "0001",
+            "project_address": None,
+            "project_status": None,
+            # Not in the add-in's reply; tells callers what they are running against
+            "element_count": self.element_count,
+        }
+
+    def list_levels(self, payload: dict) -> dict[str, Any]:
+        levels = [
+            {
+                "id": level["id"],
+                "name": level["name"],
+                "elevation": level["elevation"],
+                "elevation_ft": level["elevation"],
+                "elevation_m": round(level["elevation"] * 0.3048, 4),
+            }
+            for level in sorted(self.levels, key=lambda level: level["elevation"])
+        ]
+        return {"levels": levels, "count": len(levels)}
+
+    def list_views(self, payload: dict) -> dict[str, Any]:
+        views = [dict(view) for view in self.views]
+        return {"views": views, "count": len(views)}
+
+    def list_sheets(self, payload: dict) -> dict[str, Any]:
+        sheets = sorted((dict(sheet) for sheet in self.sheets), key=lambda sheet: sheet["sheet_number"])
+        return {"count": len(sheets), "sheets": sheets}
+
+    def list_elements_by_category(self, payload: dict) -> dict[str, Any]:
+        category = payload.get("category")
+        if not category:
+            raise ValueError("Missing 'category' parameter")
+        elements = [
+            {
+                "id": ELEMENT_ID_BASE + row,
+                "name": self.type_names[self.type_row[row]],
+                "category": CATEGORIES[self.category[row]].name,
+                "type": self.type_names[self.type_row[row]],
+            }
+            for row in self._select({"category": category})
+        ]
+        return {"elements": elements, "count": len(elements), "category": category}
+
+    def get_elements_by_type(self, payload: dict) -> dict[str, Any]:
+        offset = int(payload.get("offset") or 0)
+        limit = min(int(payload.get("limit") or 200), MAX_PAGE_SIZE)
+        fields = payload.get("fields")
+        fields = {field.lower() for field in fields} if fields else None
+        rows = self._select(payload)
+        page = rows[offset:offset + limit]
+        elements = [self._element_summary(row, fields) for row in page]
+        return {
+            "total": len(rows),
+            "returned": len(elements),
+            "offset": offset,
+            "limit": limit,
+            "truncated": len(rows) > offset + limit,
+            "elements": elements,
+        }
+
+    def get_element_parameters(self, payload: dict) -> dict[str, Any]:
+        element_id = payload.get("element_id")
+        row = self._row(element_id)
+        names = list(PARAMETERS) + list(COMPUTED_PARAMETERS)
+        parameters = [
+            {
+                "name": name,
+                "value": _as_string(self._parameter(row, name)),
+                "parameter_type": "Text" if name in PARAMETERS else name,
+                "storage_type": "String" if name in PARAMETERS else "Double",
+                "is_read_only": name in COMPUTED_PARAMETERS,
+                "is_shared": False,
+                "guid": "00000000-0000-0000-0000-000000000000",
+            }
+            for name in names
+        ]
+        return {
+            "element_id": int(element_id),
+            "element_type": CATEGORIES[self.category[row]].family,
+            "element_name": self.type_names[self.type_row[row]],
+            "parameter_count": len(parameters),
+            "parameters": parameters,
+        }
+
+    def get_parameter_value(self, payload: dict) -> dict[str, Any]:
+        element_id, name = payload.get("element_id"), payload.get("parameter_name")
+        row = self._row(element_id)
+        if name not in PARAMETERS and name not in COMPUTED_PARAMETERS:
+            raise ValueError(f"Parameter '{name}' not found on element")
+        return {
+            "element_id": int(element_id),
+            "parameter_name": name,
+            "value": _as_string(self._parameter(row, name)),
+            "storage_type": "String" if name in PARAMETERS else "Double",
+            "parameter_type": "Text" if name in PARAMETERS else name,
+        }
+
+    def set_parameter_value(self, payload: dict) -> dict[str, Any]:
+        element_id, name = payload.get("element_id"), payload.get("parameter_name")
+        row = self._row(element_id)
+        if name in COMPUTED_PARAMETERS:
+            raise ValueError(f"Parameter '{name}' is read-only")
+        if name not in PARAMETERS:
+            raise ValueError(f"Parameter '{name}' not found on element")
+        self._set(name, [row], payload.get("value"))
+        return {
+            "element_id": int(element_id),
+            "parameter_name": name,
+            "new_value": _as_string(self._parameter(row, name)),
+            "status": "success",
+        }
+
+    def batch_set_parameters_by_filter(self, payload: dict) -> dict[str, Any]:
+        criteria = payload.get("filter")
+        if not isinstance(criteria, dict):
+            raise ValueError("Missing or invalid 'filter' object")
+        name = payload.get("parameter_name")
+        rows = self._select(criteria)
+        if name not in PARAMETERS:
+            # Missing or read-only on every element, as LookupParameter would find
+            return {"success": True, "updated": 0, "failed": len(rows), "total": len(rows)}
+        self._set(name, rows, payload.get("value"))
+        return {"success": True, "updated": len(rows), "failed": 0, "total": len(rows)}
+
+    def _set(self, name: str, rows: Any, value: Any) -> None:
+        column = self._parameters.get(name)
+        if column is None:
+            column = self._parameters[name] = [None] * len(self.category)
+        value = _as_string(value)
+        if self._undo is not None:
+            rows = list(rows)
+            self._undo.append((name, rows, [column[row] for row in rows]))
+        for row in rows:
+            column[row] = value
+        # Cached selections may have filtered on this parameter
+        self._selections = {key: rows for key, rows in self._selections.items() if key[3] is None or key[3][0] != name}
+
+    def get_element_bounding_box(self, payload: dict) -> dict[str, Any]:
+        element_id = payload.get("element_id")
+        row = self._row(element_id)
+        low = [round(self.bbox_min[axis][row], 3) for axis in range(3)]
+        high = [round(self.bbox_min[axis][row] + self.bbox_size[axis][row], 3) for axis in range(3)]
+        return {
+            "element_id": int(element_id),
+            "has_bbox": True,
+            "min": dict(zip("xyz", low)),
+            "max": dict(zip("xyz", high)),
+        }
+
+    def create_level(self, payload: dict) -> dict[str, Any]:
+        level = self._add_level(payload.get("name") or f"Level {len(self.levels) + 1}", float(payload.get("elevation", 0)))
+        return {
+            "level_id": level["id"],
+            "name": level["name"],
+            "elevation": level["elevation"],
+            "elevation_ft": level["elevation"],
+            "elevation_m": round(level["elevation"] * 0.3048, 4),
+        }
+
+    def create_wall(self, payload: dict) -> dict[str, Any]:
+        start, end = _point(payload.get("start_point")), _point(payload.get("end_point"))
+        height = float(payload.get("height", 10))
+        level_row = self._level_row(payload.get("level", "L1"))
+        length = math.dist(start[:2], end[:2])
+        category = _CATEGORY_KEYS["walls"]
+        thickness = CATEGORIES[category].size_ft[1]
+        origin = (min(start[0], end[0]), min(start[1], end[1]), self.levels[level_row]["elevation"])
+        size = (max(abs(end[0] - start[0]), thickness), max(abs(end[1] - start[1]), thickness), height)
+        wall_id = self._add_element(category, self._types_by_category[category][0], level_row, origin, size)
+        return {"wall_id": wall_id, "length": length, "length_ft": length, "length_m": length * 0.3048, "height": height}
+
+    def create_floor(self, payload: dict) -> dict[str, Any]:
+        points = [_point(point) for point in payload.get("boundary_points") or ()]
+        if len(points) < 3:
+            raise ValueError("A floor boundary needs at least three points")
+        level_name = payload.get("level", "L1")
+        level_row = self._level_row(level_name)
+        xs, ys = [point[0] for point in points], [point[1] for point in points]
+        # Shoelace formula for the boundary polygon
+        area = abs(sum(xs[i] * ys[i - 1] - xs[i - 1] * ys[i] for i in range(len(points)))) / 2
+        category = _CATEGORY_KEYS["floors"]
+        origin = (min(xs), min(ys), self.levels[level_row]["elevation"])
+        size = (max(xs) - min(xs), max(ys) - min(ys), CATEGORIES[category].size_ft[2])
+        floor_id = self._add_element(category, self._types_by_category[category][0], level_row, origin, size)
+        return {"floor_id": floor_id, "area_sf": area, "area_sm": area * 0.09290304, "level": level_name}
+
+    def create_sheet(self, payload: dict) -> dict[str, Any]:
+        number = payload.get("sheet_number") or payload.get("number") or f"A{len(self.sheets) + 101}"
+        name = payload.get("sheet_name") or payload.get("name") or "Unnamed"
+        if any(sheet["sheet_number"] == number for sheet in self.sheets):
+            raise ValueError(f"Sheet number '{number}' is already in use")
+        placeholder = not (payload.get("titleblock_name") or payload.get("titleblock_id"))
+        sheet = self._add_sheet(number, name, placeholder)
+        return {
+            "sheet_id": sheet["id"],
+            "sheet_number": number,
+            "sheet_name": name,
+            "is_placeholder": placeholder,
+            "status": "success",
+        }
+
+
+def _point(value: Any) -> tuple[float, float, float]:
+    value = value or {}
+    return float(value.get("x", 0)), float(value.get("y", 0)), float(value.get("z", 0))
+
+
+def _as_string(value: Any) -> str:
+    """Parameter values compare as the add-in's ``GetParameterValueAsString`` does."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    return str(value)
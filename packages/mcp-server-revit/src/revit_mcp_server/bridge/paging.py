@@ -0,0 +1,136 @@
+"""Lazy, prefetching iteration over ``revit.get_elements_by_type`` pages.
+
+The bridge caps a page at 500 elements. These helpers drive the
+``offset``/``limit`` loop, fetching the next page in the background while
+the current one is consumed, so at most two pages are held at once and a
+consumer that stops early never requests more than one page ahead.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, Mapping
+
+from ..errors import SchemaValidationError
+
+ELEMENTS_TOOL = "revit.get_elements_by_type"
+MAX_PAGE_SIZE = 500
+FILTER_KEYS = ("type_id", "category", "level", "fields")
+
+
+def _page_payload(filters: Mapping[str, Any], offset: int, limit: int) -> dict[str, Any]:
+    payload = {key: filters.get(key) for key in FILTER_KEYS}
+    payload.update(offset=offset, limit=limit)
+    return payload
+
+
+def _next_offset(page: Mapping[str, Any], offset: int, remaining: int | None) -> int | None:
+    """Offset of the following page, or ``None`` when ``page`` was the last.
+
+    ``remaining`` is how many more elements the caller wants; a page that
+    covers it is treated as the last so nothing beyond it is requested.
+    """
+    returned = page.get("returned", len(page.get("elements") or ()))
+    if not page.get("truncated") or returned <= 0:
+        return None
+    if remaining is not None and len(page.get("elements") or ()) >= remaining:
+        return None
+    return offset + returned
+
+
+def iter_elements(
+    client: Any,
+    filters: Mapping[str, Any] | None = None,
+    *,
+    page_size: int = MAX_PAGE_SIZE,
+    max_elements: int | None = None,
+    prefetch: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield every element matching ``filters`` through a synchronous ``BridgeClient``."""
+    filters = filters or {}
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    fetch = lambda offset: client.call_tool(  # noqa: E731
+        ELEMENTS_TOOL, _page_payload(filters, offset, page_size), cache=False
+    )
+    if max_elements is not None and max_elements <= 0:
+        return
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    yielded = 0
+    offset: int | None = 0
+    try:
+        page = fetch(offset)
+        while True:
+            remaining = max_elements - yielded if max_elements is not None else None
+            offset = _next_offset(page, offset, remaining)
+            pending = executor.submit(fetch, offset) if executor and offset is not None else None
+            for element in page.get("elements") or ():
+                if max_elements is not None and yielded >= max_elements:
+                    return
+                yield element
+                yielded += 1
+            if offset is None:
+                return
+            page = pending.result() if pending is not None else fetch(offset)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_elements(
+    client: Any,
+    filters: Mapping[str, Any] | None = None,
+    *,
+    page_size: int = MAX_PAGE_SIZE,
+    max_elements: int | None = None,
+    prefetch: bool = True,
+) -> AsyncIterator[dict[str, Any]]:
+    """Async counterpart of ``iter_elements`` for ``AsyncBridgeClient``."""
+    filters = filters or {}
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    async def fetch(offset: int) -> dict[str, Any]:
+        return await client.call_tool(ELEMENTS_TOOL, _page_payload(filters, offset, page_size), cache=False)
+
+    yielded = 0
+    offset: int | None = 0
+    pending: asyncio.Task | None = None
+    if max_elements is not None and max_elements <= 0:
+        return
+    try:
+        page = await fetch(offset)
+        while True:
+            remaining = max_elements - yielded if max_elements is not None else None
+            offset = _next_offset(page, offset, remaining)
+            pending = asyncio.ensure_future(fetch(offset)) if prefetch and offset is not None else None
+            for element in page.get("elements") or ():
+                if max_elements is not None and yielded >= max_elements:
+                    return
+                yield element
+                yielded += 1
+            if offset is None:
+                return
+            page = await pending if pending is not None else await fetch(offset)
+            pending = None
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def encode_cursor(filters: Mapping[str, Any], offset: int, limit: int) -> str:
+    """Opaque MCP cursor that resumes a listing at ``offset``."""
+    state = {"f": {key: filters.get(key) for key in FILTER_KEYS if filters.get(key) is not None}, "o": offset, "l": limit}
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[dict[str, Any], int, int]:
+    """Return ``(filters, offset, limit)`` encoded by ``encode_cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+        return dict(state["f"]), int(state["o"]), int(state["l"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise SchemaValidationError(f"Invalid cursor: {cursor!r}") from exc
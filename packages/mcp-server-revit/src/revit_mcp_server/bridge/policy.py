@@ -0,0 +1,102 @@
+"""Classification of bridge tools by their effect on the Revit model.
+
+Caching and request coalescing may only ever apply to pure reads, and any
+call that can change the model has to invalidate what was read before it.
+Tools that are not recognised as reads are treated as mutating, so a new
+bridge command is safe by default.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, replace
+
+import httpx
+
+READ_ONLY_PREFIXES = ("revit.list_", "revit.get_")
+
+READ_ONLY_TOOLS = frozenset({
+    "revit.health",
+    "revit.check_clashes",
+    "revit.calculate_material_quantities",
+    "revit.reflect_get",
+    "revit.baseline_diff",
+    "revit.model_health_summary",
+    "revit.warning_triage_report",
+    "revit.naming_standards_audit",
+    "revit.parameter_compliance_audit",
+    "revit.shared_parameter_binding_audit",
+    "revit.view_template_compliance_check",
+    "revit.tag_coverage_audit",
+    "revit.room_space_completeness_report",
+    "revit.link_monitor_report",
+    "revit.coordinate_sanity_check",
+})
+
+# Reads whose answer changes without any command going through the bridge
+# (UI selection, liveness), so they are never served from a cache.
+VOLATILE_TOOLS = frozenset({
+    "revit.health",
+    "revit.get_selection",
+})
+
+# Tools that write files but leave the model untouched.
+NON_MUTATING_PREFIXES = ("revit.export_", "revit.render_")
+
+NON_MUTATING_TOOLS = frozenset({
+    "revit.save_document",
+    "revit.baseline_export",
+    "revit.publish_package_builder",
+})
+
+
+def is_read_only(tool: str) -> bool:
+    return tool in READ_ONLY_TOOLS or tool.startswith(READ_ONLY_PREFIXES)
+
+
+def is_cacheable(tool: str) -> bool:
+    return is_read_only(tool) and tool not in VOLATILE_TOOLS
+
+
+def is_mutating(tool: str) -> bool:
+    if is_read_only(tool) or tool in NON_MUTATING_TOOLS:
+        return False
+    return not tool.startswith(NON_MUTATING_PREFIXES)
+
+
+# Per-tool caps on bridge attempts.
+TOOL_RETRY_ATTEMPTS = {
+    # A liveness probe should report the bridge's state, not wait it out.
+    "revit.health": 1,
+}
+
+# Transport failures that prove the request never reached the bridge.
+_UNDELIVERED = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempts and full-jitter exponential backoff for transport failures."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int) -> float:
+        """Random wait in ``[0, min(max_delay, base_delay * 2**attempt)]`` seconds."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def for_tool(self, tool: str) -> "RetryPolicy":
+        attempts = TOOL_RETRY_ATTEMPTS.get(tool)
+        if attempts is None or attempts >= self.max_attempts:
+            return self
+        return replace(self, max_attempts=attempts)
+
+
+def retry_is_safe(tool: str, error: Exception) -> bool:
+    """Retrying is safe unless a mutating command may already have run.
+
+    A read-timeout or dropped connection can happen after Revit executed the
+    command, so mutating tools are only retried when the request was never
+    delivered.
+    """
+    return not is_mutating(tool) or isinstance(error, _UNDELIVERED)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse identical concurrent calls into one execution (thread-based).
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight block and receive the same result or exception. Results are shared
+    objects and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def forget_all(self) -> None:
+        """Make later callers start new flights instead of joining current ones."""
+        with self._lock:
+            self._flights.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"executed": self.executed, "shared": self.shared, "in_flight": len(self._flights)}
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of ``SingleFlight``.
+
+    The shared call runs as its own task, so cancelling one waiter never
+    cancels the request the other waiters depend on.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, asyncio.Task] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._flights[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda t, key=key: self._discard(key, t))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _discard(self, key: str, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter has gone away.
+            task.exception()
+
+    def forget_all(self) -> None:
+        """Make later callers start new flights instead of joining current ones."""
+        self._flights.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"executed": self.executed, "shared": self.shared, "in_flight": len(self._flights)}
@@ -0,0 +1,379 @@
+"""Local stand-in for the Revit bridge HTTP server.
+
+``StandInBridge`` speaks the same ``/health``, ``/tools`` and ``/execute``
+protocol as ``BridgeServer.cs`` (including its PascalCase ``CommandResponse``
+fields), so the real ``BridgeClient`` can be exercised without Revit.
+
+Like the add-in, HTTP requests are served concurrently but commands run one
+at a time on a single "UI thread" fed by a FIFO queue, and a caller waiting
+longer than ``timeout_ms`` (30 s by default) gets the ``CommandQueue`` timeout
+response while its command still runs later. ``ToolBehavior`` adds per-tool
+latency, injected failures and dropped connections for load and retry tests:
+
+    python -m revit_mcp_server.bridge.standin --port 3000 --latency-ms 40 --jitter 0.5 --drop-rate 0.01
+
+``--model-elements`` answers from a ``SimulatedModel`` instead of echoing.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import queue
+import random
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from .batch import BATCH_TOOL, run_batch
+from .catalog_store import catalog_etag
+
+Executor = Callable[[str, dict], Any]
+
+COMMAND_TIMEOUT_MS = 30000
+
+
+def echo_executor(tool: str, payload: dict) -> dict:
+    """Default executor: echo the request back, like ``MockBridge``."""
+    return {"tool": tool, "payload": payload}
+
+
+def _default_tools() -> list[str]:
+    from ..tools.registry import TOOL_REGISTRY
+
+    return sorted({spec.bridge_tool for spec in TOOL_REGISTRY.values() if spec.bridge_tool})
+
+
+@dataclass(frozen=True)
+class ToolBehavior:
+    """How the stand-in treats one tool.
+
+    ``latency_ms`` is the median time a command occupies the UI thread;
+    ``jitter`` is the sigma of a log-normal spread around it (``0`` for a
+    fixed latency). ``error_rate`` commands fail as if Revit raised, and
+    ``drop_rate`` connections are closed without a response after the
+    command ran, as when the network drops a reply.
+    """
+
+    latency_ms: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    drop_rate: float = 0.0
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.jitter <= 0:
+            return self.latency_ms / 1000
+        return rng.lognormvariate(math.log(self.latency_ms), self.jitter) / 1000
+
+
+class _Command:
+    __slots__ = ("request_id", "tool", "payload", "enqueued_at", "done", "response", "fail")
+
+    def __init__(self, request_id: str, tool: str, payload: dict, fail: bool):
+        self.request_id = request_id
+        self.tool = tool
+        self.payload = payload
+        self.fail = fail
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.response: dict[str, Any] | None = None
+
+
+_STOP = object()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def do_GET(self) -> None:  # noqa: N802
+        bridge = self.server.bridge
+        if self.path == "/health":
+            self._respond(200, bridge.health())
+        elif self.path == "/tools":
+            etag = f'"{bridge.tools_hash}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._respond(304, None, {"ETag": etag})
+            else:
+                self._respond(200, {"tools": bridge.tools}, {"ETag": etag})
+        else:
+            self._respond(404, {"error": "Not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path != "/execute":
+            self._respond(404, {"error": "Not found"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length))
+        except ValueError as exc:
+            self._respond(500, {"error": str(exc)})
+            return
+        bridge = self.server.bridge
+        response = bridge.submit(
+            request.get("tool", ""), request.get("payload") or {}, request.get("request_id")
+        )
+        if bridge.should_drop(request.get("tool", "")):
+            # Close without a reply; the client sees a protocol error
+            self.close_connection = True
+            return
+        self._respond(200, response)
+
+    def _respond(self, status: int, data: Any, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(data).encode("utf-8") if status != 304 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], bridge: "StandInBridge"):
+        super().__init__(address, _Handler)
+        self.bridge = bridge
+
+
+class StandInBridge:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        executor: Executor | None = None,
+        tools: Iterable[str] | None = None,
+        behavior: ToolBehavior | None = None,
+        tool_behaviors: Mapping[str, ToolBehavior] | None = None,
+        timeout_ms: int = COMMAND_TIMEOUT_MS,
+        seed: int | None = None,
+    ):
+        self.executor = executor or echo_executor
+        # A SimulatedModel runs batches itself, with rollback; other
+        # executors get run_batch's operation-by-operation loop.
+        model_tools = getattr(getattr(self.executor, "__self__", None), "tools", None)
+        self._executor_batches = isinstance(model_tools, Mapping) and BATCH_TOOL in model_tools
+        self.tools = list(tools) if tools is not None else _default_tools()
+        self.behavior = behavior or ToolBehavior()
+        self.tool_behaviors = dict(tool_behaviors or {})
+        self.timeout_ms = timeout_ms
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._address = (host, port)
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+        self._commands: queue.Queue = queue.Queue()
+        self._ui_thread: threading.Thread | None = None
+        self._stats_lock = threading.Lock()
+        self._started = time.monotonic()
+        self.requests = 0
+        self.executed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+
+    @property
+    def tools_hash(self) -> str:
+        return catalog_etag(self.tools)
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Stand-in bridge is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInBridge":
+        self._ui_thread = threading.Thread(target=self._run_commands, name="standin-ui", daemon=True)
+        self._ui_thread.start()
+        self._server = _Server(self._address, self)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="standin-bridge",
+            daemon=True,
+        )
+        self._thread.start()
+        self._started = time.monotonic()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._ui_thread is not None:
+            self._commands.put(_STOP)
+            self._ui_thread.join()
+            self._ui_thread = None
+
+    def __enter__(self) -> "StandInBridge":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def behavior_for(self, tool: str) -> ToolBehavior:
+        return self.tool_behaviors.get(tool, self.behavior)
+
+    def stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "executed": self.executed,
+                "failed": self.failed,
+                "timeouts": self.timeouts,
+                "dropped": self.dropped,
+                "queue_depth": self._commands.qsize(),
+                "max_queue_depth": self.max_queue_depth,
+            }
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "healthy",
+            "version": "stand-in",
+            "uptime_seconds": time.monotonic() - self._started,
+            "revit_version": "stand-in",
+            "active_document": "none",
+            "tools_hash": self.tools_hash,
+        }
+
+    def submit(self, tool: str, payload: dict, request_id: str | None = None) -> dict[str, Any]:
+        """Queue one command for the UI thread and wait for it, like ``HandleExecute``."""
+        behavior = self.behavior_for(tool)
+        command = _Command(request_id or "", tool, payload, self._chance(behavior.error_rate))
+        with self._stats_lock:
+            self.requests += 1
+        if self._ui_thread is None:
+            # Not started (direct use in tests): run on the calling thread
+            self._execute(command)
+            return command.response
+        with self._stats_lock:
+            self._commands.put(command)
+            self.max_queue_depth = max(self.max_queue_depth, self._commands.qsize())
+        if not command.done.wait(self.timeout_ms / 1000):
+            # The command stays queued and still runs; only the caller gives up
+            with self._stats_lock:
+                self.timeouts += 1
+            return {
+                "Status": "error",
+                "Tool": "",
+                "Result": None,
+                "Message": f"Request {command.request_id} timed out after {self.timeout_ms}ms",
+                "StackTrace": None,
+            }
+        return command.response
+
+    def execute(self, tool: str, payload: dict) -> dict[str, Any]:
+        """Run one command and wrap it in a ``CommandResponse``-shaped dict."""
+        return self.submit(tool, payload)
+
+    def should_drop(self, tool: str) -> bool:
+        if self._chance(self.behavior_for(tool).drop_rate):
+            with self._stats_lock:
+                self.dropped += 1
+            return True
+        return False
+
+    def _chance(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < rate
+
+    def _run_commands(self) -> None:
+        while True:
+            command = self._commands.get()
+            if command is _STOP:
+                return
+            self._execute(command)
+
+    def _execute(self, command: _Command) -> None:
+        dequeued = time.perf_counter()
+        with self._rng_lock:
+            delay = self.behavior_for(command.tool).sample_latency(self._rng)
+        tool, payload = command.tool, command.payload
+        try:
+            if delay:
+                time.sleep(delay)
+            if command.fail:
+                raise RuntimeError(f"Injected failure in {tool}")
+            if tool == BATCH_TOOL and not self._executor_batches:
+                result = run_batch(payload, self.executor)
+            else:
+                result = self.executor(tool, payload)
+            response = {"Status": "ok", "Tool": tool, "Result": result, "Message": None, "StackTrace": None}
+        except Exception as exc:  # noqa: BLE001
+            with self._stats_lock:
+                self.failed += 1
+            response = {
+                "Status": "error",
+                "Tool": tool,
+                "Result": None,
+                "Message": str(exc),
+                "StackTrace": traceback.format_exc(),
+            }
+        finished = time.perf_counter()
+        response["QueueMs"] = (dequeued - command.enqueued_at) * 1000
+        response["ExecuteMs"] = (finished - dequeued) * 1000
+        with self._stats_lock:
+            self.executed += 1
+        command.response = response
+        command.done.set()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m revit_mcp_server.bridge.standin", description="Serve a stand-in Revit bridge"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median UI-thread time per command")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Log-normal sigma around the median")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-ms", type=int, default=COMMAND_TIMEOUT_MS)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--model-elements", type=int, default=0, help="Answer from a simulated model of this many elements"
+    )
+    parser.add_argument("--model-seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    executor = None
+    if args.model_elements:
+        from .model import SimulatedModel
+
+        executor = SimulatedModel.generate(args.model_elements, seed=args.model_seed).execute
+    behavior = ToolBehavior(args.latency_ms, args.jitter, args.error_rate, args.drop_rate)
+    with StandInBridge(
+        args.host, args.port, executor=executor, behavior=behavior, timeout_ms=args.timeout_ms, seed=args.seed
+    ) as bridge:
+        print(f"Stand-in bridge listening on {bridge.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            pass
+        print(json.dumps(bridge.stats()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
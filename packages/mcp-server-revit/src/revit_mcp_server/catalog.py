@@ -0,0 +1,68 @@
+"""Cached ``tools/list`` catalog built from ``TOOL_REGISTRY``."""
+from __future__ import annotations
+
+import threading
+from typing import Collection, Mapping
+
+from mcp.types import Tool
+
+from .bridge.policy import is_read_only
+from .formatting import RESPONSE_FORMAT_PROPERTY
+from .tools.registry import TOOL_REGISTRY, ToolSpec
+
+
+def _input_schema(spec: ToolSpec) -> dict:
+    schema = dict(spec.input_schema)
+    # Reads are where large results come from, so they advertise the
+    # per-call response encoding.
+    if spec.bridge_tool is None or is_read_only(spec.bridge_tool):
+        schema["properties"] = {**schema.get("properties", {}), "response_format": RESPONSE_FORMAT_PROPERTY}
+    return schema
+
+
+class ToolCatalog:
+    """Builds the MCP ``Tool`` objects once and serves them from a cache.
+
+    ``available`` is the bridge's advertised tool list (``/tools``). When it is
+    known, only tools whose bridge command is advertised are listed; tools
+    served by the MCP server itself are always listed. The cache
+    is rebuilt only when that set actually changes, not when the bridge merely
+    hands back a fresh list object with the same contents.
+    """
+
+    def __init__(self, specs: Mapping[str, ToolSpec] = TOOL_REGISTRY):
+        self._specs = specs
+        self._lock = threading.Lock()
+        self._source: Collection[str] | None = None
+        self._key: frozenset[str] | None = None
+        self._tools: tuple[Tool, ...] | None = None
+        self.builds = 0
+
+    def tools(self, available: Collection[str] | None = None) -> list[Tool]:
+        cached = self._tools
+        if cached is None or available is not self._source:
+            cached = self._refresh(available)
+        return list(cached)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._tools = None
+            self._source = None
+            self._key = None
+
+    def _refresh(self, available: Collection[str] | None) -> tuple[Tool, ...]:
+        key = frozenset(available) if available else None
+        with self._lock:
+            if self._tools is None or key != self._key:
+                self._tools = self._build(key)
+                self._key = key
+                self.builds += 1
+            self._source = available
+            return self._tools
+
+    def _build(self, available: frozenset[str] | None) -> tuple[Tool, ...]:
+        return tuple(
+            Tool(name=spec.name, description=spec.description, inputSchema=_input_schema(spec))
+            for spec in self._specs.values()
+            if available is None or spec.bridge_tool is None or spec.bridge_tool in available
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from enum import Enum
+from functools import lru_cache
 from json import JSONDecodeError
 from pathlib import Path
 from typing import List
@@ -11,24 +12,26 @@ from pydantic import DirectoryPath, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic_settings.sources.providers import env as env_source
 
-# Load .env file - search in multiple locations
+from .enums import AuditDurability, ResponseEncoding
+
+
+# .env search order, first existing file wins:
 # 1. Repository root (when running from source)
 # 2. Current working directory
 # 3. Package directory
-_possible_locations = [
-    Path(__file__).parent.parent.parent.parent.parent / ".env",  # repo root from package
-    Path.cwd() / ".env",  # current directory
-    Path(__file__).parent.parent.parent / ".env",  # package root
-]
-
-_env_loaded = False
-for _env_file in _possible_locations:
-    if _env_file.exists():
-        load_dotenv(_env_file)
-        _env_loaded = True
-        break
-
-if not _env_loaded:
+def _env_locations() -> list[Path]:
+    return [
+        Path(__file__).parent.parent.parent.parent.parent / ".env",  # repo root from package
+        Path.cwd() / ".env",  # current directory
+        Path(__file__).parent.parent.parent / ".env",  # package root
+    ]
+
+
+def load_env() -> None:
+    for env_file in _env_locations():
+        if env_file.exists():
+            load_dotenv(env_file)
+            return
     # Last resort: try loading from current directory without checking existence
     load_dotenv()
 
@@ -50,9 +53,47 @@ class Config(BaseSettings):
     workspace_dir: Path = Field(...)
     allowed_directories: List[DirectoryPath] = Field(...)
     bridge_url: str | None = Field(default=None)
+    bridge_timeout: float = Field(30.0, gt=0)
+    bridge_connect_timeout: float | None = Field(default=None, gt=0)
+    bridge_max_connections: int = Field(10, ge=1)
+    bridge_max_keepalive_connections: int = Field(5, ge=0)
+    bridge_keepalive_expiry: float = Field(30.0, ge=0)
+    bridge_coalesce_reads: bool = Field(True)
+    tool_catalog_cache: bool = Field(True)
+    bridge_retry_attempts: int = Field(3, ge=1)
+    bridge_retry_base_delay: float = Field(0.5, ge=0)
+    bridge_retry_max_delay: float = Field(8.0, ge=0)
+    breaker_failure_threshold: int = Field(5, ge=0)
+    breaker_reset_timeout: float = Field(10.0, gt=0)
+    heartbeat_interval: float = Field(5.0, ge=0)
+    result_cache_max_entries: int = Field(256, ge=0)
+    result_cache_ttl: float = Field(15.0, gt=0)
     mode: BridgeMode = Field(default=BridgeMode.mock)
+    mock_model_elements: int = Field(0, ge=0)
+    mock_model_seed: int = Field(0)
+    server_workers: int = Field(1, ge=1)
+    server_max_in_flight: int = Field(32, ge=1)
+    server_ordered_responses: bool = Field(False)
     audit_log: Path = Field(default_factory=lambda: Path("audit.log"))
+    audit_durability: AuditDurability = Field(default=AuditDurability.batched)
+    audit_flush_interval: float = Field(1.0, gt=0)
+    audit_batch_size: int = Field(256, ge=1)
+    audit_max_queue: int = Field(10000, ge=1)
+    audit_max_field_bytes: int = Field(65536, ge=0)
+    audit_blobs: bool = Field(True)
+    audit_rotate_bytes: int = Field(64 * 1024 * 1024, ge=0)
+    audit_rotate_interval: float = Field(86400.0, ge=0)
+    audit_redact_keys: List[str] = Field(default_factory=lambda: ["password", "token", "api_key", "secret"])
     log_level: str = Field("INFO")
+    response_encoding: ResponseEncoding = Field(default=ResponseEncoding.auto)
+    response_compact_threshold: int = Field(16384, ge=0)
+    result_inline_limit: int = Field(262144, ge=0)
+    result_store_memory_budget: int = Field(64 * 1024 * 1024, ge=0)
+    result_store_max_entries: int = Field(128, ge=1)
+    metrics_file: Path | None = Field(default=None)
+    metrics_dump_interval: float = Field(15.0, gt=0)
+    trace_file: Path | None = Field(default=None)
+    trace_sample_rate: float = Field(1.0, ge=0, le=1)
 
     model_config = SettingsConfigDict(
         env_prefix="MCP_REVIT_",
@@ -66,6 +107,12 @@ class Config(BaseSettings):
             return [Path(p.strip()) for p in value.split(";") if p.strip()]
         return value
 
+    @field_validator("audit_redact_keys", mode="before")
+    def split_redact_keys(cls, value):
+        if isinstance(value, str):
+            return [key.strip() for key in value.split(";") if key.strip()]
+        return value
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -92,4 +139,15 @@ class Config(BaseSettings):
         return any(path.is_relative_to(allowed.resolve()) for allowed in self.allowed_directories)
 
 
-config = Config()
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Load ``.env`` and build the process-wide ``Config`` on first use."""
+    load_env()
+    return Config()
+
+
+def __getattr__(name: str):
+    # ``config`` used to be built at import time; keep it importable lazily.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
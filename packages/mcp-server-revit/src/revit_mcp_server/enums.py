@@ -0,0 +1,21 @@
+"""Setting values shared by ``Config`` and the modules that act on them.
+
+Kept free of imports from the rest of the package, so loading ``Config``
+does not pull in the audit recorder or the result formatters.
+"""
+from __future__ import annotations
+
+from enum import Enum
+
+
+class AuditDurability(str, Enum):
+    sync = "sync"
+    batched = "batched"
+    fsync = "fsync"
+
+
+class ResponseEncoding(str, Enum):
+    auto = "auto"
+    pretty = "pretty"
+    compact = "compact"
+    table = "table"
@@ -12,3 +12,11 @@ class SchemaValidationError(RevitMCPError):
 
 class BridgeError(RevitMCPError):
     """Signals communication or response issues with the bridge."""
+
+
+class BridgeUnavailable(BridgeError):
+    """Raised without contacting the bridge while its circuit breaker is open."""
+
+
+class ResultExpired(RevitMCPError):
+    """Raised when a stored result handle is unknown or has been evicted."""
@@ -0,0 +1,60 @@
+"""Text encodings for tool results returned to MCP clients."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from .enums import ResponseEncoding
+
+
+RESPONSE_FORMAT_PROPERTY = {
+    "type": "string",
+    "enum": [encoding.value for encoding in ResponseEncoding],
+    "description": "Result encoding: pretty or compact JSON, or table (columns + rows for record lists). Default auto.",
+}
+
+# Lists shorter than this are left as records; the header would not pay off.
+MIN_TABLE_ROWS = 2
+
+
+def tabulate(value: Any) -> Any:
+    """Rewrite lists of records as ``{"columns": [...], "rows": [[...], ...]}``.
+
+    Applies recursively. Columns are the union of the record keys in first-seen
+    order; a record missing a column gets ``null`` in that cell.
+    """
+    if isinstance(value, dict):
+        return {key: tabulate(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if len(value) >= MIN_TABLE_ROWS and all(isinstance(item, dict) for item in value):
+            columns: dict[str, None] = {}
+            for record in value:
+                columns.update(dict.fromkeys(record))
+            return {
+                "columns": list(columns),
+                "rows": [[tabulate(record.get(column)) for column in columns] for record in value],
+            }
+        return [tabulate(item) for item in value]
+    return value
+
+
+def encode_result(
+    result: Any,
+    encoding: ResponseEncoding | str = ResponseEncoding.auto,
+    *,
+    compact_threshold: int = 16384,
+) -> str:
+    """Serialize ``result`` in the requested encoding.
+
+    ``auto`` keeps the indented form for small results and switches to compact
+    JSON once the compact encoding exceeds ``compact_threshold`` characters.
+    """
+    encoding = ResponseEncoding(encoding)
+    if encoding is ResponseEncoding.pretty:
+        return json.dumps(result, indent=2)
+    if encoding is ResponseEncoding.table:
+        result = tabulate(result)
+    compact = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+    if encoding is ResponseEncoding.auto and len(compact) <= compact_threshold:
+        return json.dumps(result, indent=2)
+    return compact
@@ -5,1024 +5,210 @@ from __future__ import annotations
 
 import asyncio
 import json
+import sys
+import time
+from pathlib import Path
 from typing import Any
 
+import httpx
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from .bridge.client import BridgeClient
-from .config import config
+from .bridge.batch import BATCH_TOOL
+from .bridge.heartbeat import Heartbeat
+from .catalog import ToolCatalog
+from .config import get_config
 from .errors import BridgeError
+from .formatting import encode_result
+from .metrics import METRICS
+from .results import ResultStore, summarize
+from .tracing import TRACER
+from .tools.registry import TOOL_REGISTRY
 
 # Initialize the MCP server
 app = Server("revit-mcp")
 
-# Initialize bridge client
-bridge = BridgeClient(config.bridge_url) if config.bridge_url else None
+_UNSET: Any = object()
+
+# Bridge client, created on first use; one pooled async client is shared by
+# every tool call so a slow bridge request never blocks other MCP requests
+bridge = _UNSET
+
+# The bridge whose health check and tool catalog fetch succeeded (see ready_bridge)
+initialized_bridge: Any = None
+
+# tools/list is served from a cache built once from TOOL_REGISTRY
+catalog = ToolCatalog()
+
+# Oversized results are parked here and fetched page by page; created on first use
+results = _UNSET
+
+# Polls GET /health in the background while the server runs (see main)
+heartbeat: Heartbeat | None = None
+
+
+def get_bridge():
+    global bridge
+    if bridge is _UNSET:
+        config = get_config()
+        if config.bridge_url:
+            from .bridge.async_client import AsyncBridgeClient
+
+            bridge = AsyncBridgeClient.from_config(config)
+        else:
+            bridge = None
+    return bridge
+
+
+async def ready_bridge():
+    """Return the bridge, initializing it on first use.
+
+    Revit may not be running yet when the MCP server starts, so a failed
+    initialization is not fatal: the call is still forwarded (the bridge
+    reports its own errors) and initialization is retried on the next call.
+    """
+    global initialized_bridge
+    bridge = get_bridge()
+    if bridge is not None and bridge is not initialized_bridge:
+        initialize = getattr(bridge, "initialize", None)
+        if initialize is not None:
+            try:
+                await initialize()
+            except (BridgeError, httpx.HTTPError):
+                return bridge
+        initialized_bridge = bridge
+    return bridge
+
+
+def get_results() -> ResultStore:
+    global results
+    if results is _UNSET:
+        config = get_config()
+        results = ResultStore(
+            config.workspace_dir / ".revit-mcp-results",
+            memory_budget=config.result_store_memory_budget,
+            max_entries=config.result_store_max_entries,
+        )
+    return results
+
+
+async def _fetch_result(payload: dict) -> Any:
+    # Spilled results are read from disk, off the event loop
+    return await asyncio.to_thread(
+        get_results().fetch,
+        payload["handle"], path=payload["path"], offset=payload["offset"], limit=payload["limit"],
+    )
+
+
+async def _server_stats(payload: dict) -> Any:
+    stats: dict[str, Any] = {"tools": METRICS.snapshot()}
+    bridge = get_bridge()
+    for key, attribute, report in (
+        ("result_cache", "result_cache", "stats"),
+        ("single_flight", "single_flight", "stats"),
+        ("breaker", "breaker", "snapshot"),
+    ):
+        component = getattr(bridge, attribute, None)
+        if component is not None:
+            stats[key] = getattr(component, report)()
+    if results is not _UNSET:
+        stats["result_store"] = results.stats()
+    snapshot = heartbeat.snapshot if heartbeat is not None else None
+    if snapshot is not None:
+        stats["heartbeat"] = snapshot.as_result()
+    return stats
+
+
+# Tools answered by this server without a bridge round trip
+LOCAL_TOOLS = {
+    "revit_fetch_result": _fetch_result,
+    "revit_server_stats": _server_stats,
+}
 
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List all available Revit tools."""
-    return [
-        Tool(
-            name="revit_health",
-            description="Check if Revit is running and get status information",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="revit_create_wall",
-            description="Create a wall in Revit between two points",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_x": {"type": "number", "description": "Start point X coordinate in feet"},
-                    "start_y": {"type": "number", "description": "Start point Y coordinate in feet"},
-                    "start_z": {"type": "number", "description": "Start point Z coordinate in feet", "default": 0},
-                    "end_x": {"type": "number", "description": "End point X coordinate in feet"},
-                    "end_y": {"type": "number", "description": "End point Y coordinate in feet"},
-                    "end_z": {"type": "number", "description": "End point Z coordinate in feet", "default": 0},
-                    "height": {"type": "number", "description": "Wall height in feet", "default": 10},
-                    "level": {"type": "string", "description": "Level name (e.g., 'L1', 'L2')", "default": "L1"}
-                },
-                "required": ["start_x", "start_y", "end_x", "end_y"]
-            }
-        ),
-        Tool(
-            name="revit_create_floor",
-            description="Create a floor in Revit with a rectangular or custom boundary",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "points": {
-                        "type": "array",
-                        "description": "Array of boundary points [{x, y, z}]. Minimum 3 points for a closed boundary.",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "x": {"type": "number"},
-                                "y": {"type": "number"},
-                                "z": {"type": "number", "default": 0}
-                            },
-                            "required": ["x", "y"]
-                        }
-                    },
-                    "level": {"type": "string", "description": "Level name", "default": "L1"}
-                },
-                "required": ["points"]
-            }
-        ),
-        Tool(
-            name="revit_create_roof",
-            description="Create a roof in Revit",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "points": {
-                        "type": "array",
-                        "description": "Array of boundary points for the roof",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "x": {"type": "number"},
-                                "y": {"type": "number"},
-                                "z": {"type": "number"}
-                            }
-                        }
-                    },
-                    "level": {"type": "string", "description": "Level name"},
-                    "slope": {"type": "number", "description": "Roof slope", "default": 0.5}
-                },
-                "required": ["points", "level"]
-            }
-        ),
-        Tool(
-            name="revit_list_levels",
-            description="List all levels in the Revit project",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="revit_list_views",
-            description="List all views in the Revit project",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="revit_list_elements",
-            description="List elements by category (Walls, Floors, Roofs, Doors, Windows, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {"type": "string", "description": "Category name (e.g., 'Walls', 'Floors', 'Doors')"}
-                },
-                "required": ["category"]
-            }
-        ),
-        Tool(
-            name="revit_get_document_info",
-            description="Get information about the active Revit document",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="revit_create_level",
-            description="Create a new level in Revit",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Level name"},
-                    "elevation": {"type": "number", "description": "Elevation in feet"}
-                },
-                "required": ["name", "elevation"]
-            }
-        ),
-        Tool(
-            name="revit_save_document",
-            description="Save the current Revit document",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "File path to save to (optional for existing files)"}
-                }
-            }
-        ),
-        Tool(
-            name="revit_create_grid",
-            description="Create a grid line in Revit",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number", "default": 0},
-                    "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number", "default": 0},
-                    "name": {"type": "string"}
-                },
-                "required": ["start_x", "start_y", "end_x", "end_y"]
-            }
-        ),
-        Tool(
-            name="revit_create_room",
-            description="Create a room at a specific point on a level",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "level": {"type": "string"},
-                    "x": {"type": "number"}, "y": {"type": "number"},
-                    "name": {"type": "string", "default": "Room"},
-                    "number": {"type": "string"}
-                },
-                "required": ["level", "x", "y"]
-            }
-        ),
-        Tool(
-            name="revit_delete_element",
-            description="Delete an element by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {"element_id": {"type": "integer"}},
-                "required": ["element_id"]
-            }
-        ),
-        Tool(
-            name="revit_place_family_instance",
-            description="Place a family instance (e.g., furniture, equipment)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "family_name": {"type": "string"}, "type_name": {"type": "string"},
-                    "level": {"type": "string"},
-                    "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}
-                },
-                "required": ["family_name", "type_name", "level", "x", "y"]
-            }
-        ),
-        Tool(
-            name="revit_place_door",
-            description="Place a door in a wall",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wall_id": {"type": "integer"},
-                    "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0},
-                    "family_name": {"type": "string"}, "type_name": {"type": "string"}
-                },
-                "required": ["wall_id", "x", "y"]
-            }
-        ),
-        Tool(
-            name="revit_place_window",
-            description="Place a window in a wall",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "wall_id": {"type": "integer"},
-                    "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0},
-                    "family_name": {"type": "string"}, "type_name": {"type": "string"}
-                },
-                "required": ["wall_id", "x", "y"]
-            }
-        ),
-        Tool(
-            name="revit_list_families",
-            description="List all loaded families and their types",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="revit_create_floor_plan_view",
-            description="Create a floor plan view for a level",
-            inputSchema={
-                "type": "object",
-                "properties": {"level_name": {"type": "string"}, "view_name": {"type": "string"}},
-                "required": ["level_name"]
-            }
-        ),
-        Tool(
-            name="revit_create_3d_view",
-            description="Create a new 3D view",
-            inputSchema={
-                "type": "object",
-                "properties": {"view_name": {"type": "string"}},
-                "required": ["view_name"]
-            }
-        ),
-        Tool(
-            name="revit_create_section_view",
-            description="Create a section view",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_name": {"type": "string"},
-                    "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number"},
-                    "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number"},
-                    "height": {"type": "number", "default": 10}
-                },
-                "required": ["start_x", "start_y", "end_x", "end_y"]
-            }
-        ),
-        Tool(
-            name="revit_get_element_parameters",
-            description="Get all parameters of an element",
-            inputSchema={
-                "type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]
-            }
-        ),
-        Tool(
-            name="revit_set_parameter_value",
-            description="Set a parameter value for an element",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_id": {"type": "integer"},
-                    "parameter_name": {"type": "string"},
-                    "value": {"type": ["string", "number", "boolean"]}
-                },
-                "required": ["element_id", "parameter_name", "value"]
-            }
-        ),
-        Tool(
-            name="revit_get_parameter_value",
-            description="Get a specific parameter value",
-            inputSchema={
-                "type": "object",
-                "properties": {"element_id": {"type": "integer"}, "parameter_name": {"type": "string"}},
-                "required": ["element_id", "parameter_name"]
-            }
-        ),
-        Tool(
-            name="revit_list_shared_parameters",
-            description="List shared parameters in the document",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="revit_create_shared_parameter",
-            description="Create a new shared parameter",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"}, "group": {"type": "string"},
-                    "type": {"type": "string"}, "visible": {"type": "boolean"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="revit_list_project_parameters",
-            description="List project parameters",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="revit_create_project_parameter",
-            description="Create a new project parameter",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"}, "category": {"type": "string"},
-                    "group": {"type": "string"}, "type": {"type": "string"}
-                },
-                "required": ["name", "category"]
-            }
-        ),
-        Tool(
-            name="revit_batch_set_parameters",
-            description="Set a parameter value for multiple elements",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_ids": {"type": "array", "items": {"type": "integer"}},
-                    "parameter_name": {"type": "string"}, "value": {"type": ["string", "number"]}
-                },
-                "required": ["element_ids", "parameter_name", "value"]
-            }
-        ),
-        Tool(
-            name="revit_get_type_parameters",
-            description="Get type parameters for an element",
-            inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}
-        ),
-        Tool(
-            name="revit_set_type_parameter",
-            description="Set a type parameter value",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_id": {"type": "integer"},
-                    "parameter_name": {"type": "string"}, "value": {"type": ["string", "number"]}
-                },
-                "required": ["element_id", "parameter_name", "value"]
-            }
-        ),
-        Tool(
-            name="revit_list_sheets",
-            description="List all sheets",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="revit_create_sheet",
-            description="Create a new sheet",
-            inputSchema={
-                "type": "object",
-                "properties": {"name": {"type": "string"}, "number": {"type": "string"}, "titleblock_id": {"type": "integer"}},
-                "required": ["name", "number"]
-            }
-        ),
-        Tool(
-            name="revit_delete_sheet",
-            description="Delete a sheet",
-            inputSchema={"type": "object", "properties": {"sheet_id": {"type": "integer"}}, "required": ["sheet_id"]}
-        ),
-        Tool(
-            name="revit_place_viewport_on_sheet",
-            description="Place a view on a sheet",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sheet_id": {"type": "integer"}, "view_id": {"type": "integer"},
-                    "x": {"type": "number"}, "y": {"type": "number"}
-                },
-                "required": ["sheet_id", "view_id", "x", "y"]
-            }
-        ),
-        Tool(
-            name="revit_batch_create_sheets_from_csv",
-            description="Create multiple sheets from a CSV file",
-            inputSchema={
-                "type": "object", "properties": {"csv_path": {"type": "string"}, "titleblock_name": {"type": "string"}},
-                "required": ["csv_path"]
-            }
-        ),
-        Tool(
-            name="revit_populate_titleblock",
-            description="Populate titleblock parameters",
-            inputSchema={
-                "type": "object", "properties": {"sheet_id": {"type": "integer"}, "parameters": {"type": "object"}},
-                "required": ["sheet_id", "parameters"]
-            }
-        ),
-        Tool(
-            name="revit_list_titleblocks",
-            description="List available titleblocks",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="revit_get_sheet_info",
-            description="Get detailed information about a sheet",
-            inputSchema={"type": "object", "properties": {"sheet_id": {"type": "integer"}}, "required": ["sheet_id"]}
-        ),
-        Tool(
-            name="revit_duplicate_sheet",
-            description="Duplicate a sheet",
-            inputSchema={
-                "type": "object",
-                "properties": {"sheet_id": {"type": "integer"}, "with_views": {"type": "boolean"}, "duplicate_option": {"type": "string"}},
-                "required": ["sheet_id"]
-            }
-        ),
-        Tool(
-            name="revit_renumber_sheets",
-            description="Batch renumber sheets",
-            inputSchema={
-                "type": "object", "properties": {"prefix": {"type": "string"}, "start_number": {"type": "integer"}},
-                "required": ["start_number"]
-            }
-        ),
-        # Batch 2: Selection
-        Tool(name="revit_get_selection", description="Get currently selected element IDs", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_set_selection", description="Set selection by element IDs", inputSchema={"type": "object", "properties": {"element_ids": {"type": "array", "items": {"type": "integer"}}}, "required": ["element_ids"]}),
-        # Batch 2: Annotation
-        Tool(name="revit_create_text_note", description="Create a text note", inputSchema={"type": "object", "properties": {"text": {"type": "string"}, "x": {"type": "number"}, "y": {"type": "number"}, "view_id": {"type": "integer"}}, "required": ["text", "x", "y"]}),
-        Tool(name="revit_create_tag", description="Tag an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}, "x": {"type": "number"}, "y": {"type": "number"}, "view_id": {"type": "integer"}}, "required": ["element_id", "x", "y"]}),
-        # Batch 2: Structure
-        Tool(name="revit_create_column", description="Create structural column", inputSchema={"type": "object", "properties": {"family_name": {"type": "string"}, "type_name": {"type": "string"}, "level": {"type": "string"}, "x": {"type": "number"}, "y": {"type": "number"}}, "required": ["family_name", "type_name", "level", "x", "y"]}),
-        Tool(name="revit_create_beam", description="Create structural beam", inputSchema={"type": "object", "properties": {"family_name": {"type": "string"}, "type_name": {"type": "string"}, "level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "end_x": {"type": "number"}, "end_y": {"type": "number"}}, "required": ["family_name", "type_name", "level", "start_x", "start_y", "end_x", "end_y"]}),
-        Tool(name="revit_create_foundation", description="Create foundation", inputSchema={"type": "object", "properties": {"family_name": {"type": "string"}, "type_name": {"type": "string"}, "level": {"type": "string"}, "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}}, "required": ["family_name", "type_name", "level", "x", "y"]}),
-        # Batch 2: MEP
-        Tool(name="revit_create_duct", description="Create duct", inputSchema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "z": {"type": "number", "default": 10}, "system_type": {"type": "string"}, "duct_type": {"type": "string"}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]}),
-        Tool(name="revit_create_pipe", description="Create pipe", inputSchema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "z": {"type": "number", "default": 0}, "system_type": {"type": "string"}, "pipe_type": {"type": "string"}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]}),
-        # Batch 2: Helpers
-        Tool(name="revit_get_categories", description="List Revit categories", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_get_element_type", description="Find element types/families", inputSchema={"type": "object", "properties": {"category_name": {"type": "string"}, "family_name": {"type": "string"}}, "required": ["category_name"]}),
-        # Batch 2: Remaining Existing
-        Tool(name="revit_close_document", description="Close active document", inputSchema={"type": "object", "properties": {"save_changes": {"type": "boolean", "default": False}}}),
-        Tool(name="revit_create_new_document", description="Create new project", inputSchema={"type": "object", "properties": {"template_path": {"type": "string"}}}),
-        Tool(name="revit_export_dwg", description="Export view to DWG", inputSchema={"type": "object", "properties": {"view_id": {"type": "integer"}, "output_path": {"type": "string"}}, "required": ["view_id", "output_path"]}),
-        Tool(name="revit_export_ifc", description="Export to IFC", inputSchema={"type": "object", "properties": {"output_path": {"type": "string"}}, "required": ["output_path"]}),
-        Tool(name="revit_export_navisworks", description="Export to NWC", inputSchema={"type": "object", "properties": {"output_path": {"type": "string"}}, "required": ["output_path"]}),
-        Tool(name="revit_export_image", description="Export view to Image", inputSchema={"type": "object", "properties": {"view_id": {"type": "integer"}, "output_path": {"type": "string"}, "width": {"type": "integer"}, "height": {"type": "integer"}}, "required": ["view_id", "output_path"]}),
-        Tool(name="revit_render_3d", description="Render 3D view to image", inputSchema={"type": "object", "properties": {"view_id": {"type": "integer"}, "output_path": {"type": "string"}, "quality": {"type": "string", "enum": ["Draft", "Medium", "High"]}}, "required": ["view_id", "output_path"]}),
-        # Batch 3: Editing
-        Tool(name="revit_move_element", description="Move an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}, "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}}, "required": ["element_id", "x", "y"]}),
-        Tool(name="revit_copy_element", description="Copy an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}, "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}}, "required": ["element_id", "x", "y"]}),
-        Tool(name="revit_rotate_element", description="Rotate an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}, "center_x": {"type": "number"}, "center_y": {"type": "number"}, "center_z": {"type": "number", "default": 0}, "angle_radians": {"type": "number"}}, "required": ["element_id", "center_x", "center_y", "angle_radians"]}),
-        Tool(name="revit_mirror_element", description="Mirror an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}, "plane_origin_x": {"type": "number"}, "plane_origin_y": {"type": "number"}, "plane_origin_z": {"type": "number", "default": 0}, "plane_normal_x": {"type": "number"}, "plane_normal_y": {"type": "number"}, "plane_normal_z": {"type": "number", "default": 0}}, "required": ["element_id", "plane_origin_x", "plane_origin_y", "plane_normal_x", "plane_normal_y"]}),
-        Tool(name="revit_pin_element", description="Pin an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}),
-        Tool(name="revit_unpin_element", description="Unpin an element", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}),
-        # Batch 3: Worksharing
-        Tool(name="revit_sync_to_central", description="Sync to central model", inputSchema={"type": "object", "properties": {"comment": {"type": "string"}, "relinquish": {"type": "boolean", "default": True}}}),
-        Tool(name="revit_relinquish_all", description="Relinquish all elements and worksets", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_get_worksets", description="Get all worksets", inputSchema={"type": "object", "properties": {}}),
-        # Batch 3: Schedules & Geo
-        Tool(name="revit_create_schedule", description="Create a schedule", inputSchema={"type": "object", "properties": {"category_name": {"type": "string"}, "name": {"type": "string"}}, "required": ["category_name", "name"]}),
-        Tool(name="revit_get_schedule_data", description="Get schedule data", inputSchema={"type": "object", "properties": {"schedule_id": {"type": "integer"}}, "required": ["schedule_id"]}),
-        Tool(name="revit_get_element_bounding_box", description="Get element bounding box", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}),
-        # Batch 4: Phasing
-        Tool(name="revit_get_phases", description="Get project phases", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_get_phase_filters", description="Get phase filters", inputSchema={"type": "object", "properties": {}}),
-        # Batch 4: Design Options
-        Tool(name="revit_get_design_options", description="Get design options", inputSchema={"type": "object", "properties": {}}),
-        # Batch 4: Groups
-        Tool(name="revit_create_group", description="Create a group", inputSchema={"type": "object", "properties": {"element_ids": {"type": "array", "items": {"type": "integer"}}, "name": {"type": "string"}}, "required": ["element_ids", "name"]}),
-        Tool(name="revit_ungroup", description="Ungroup a group", inputSchema={"type": "object", "properties": {"group_id": {"type": "integer"}}, "required": ["group_id"]}),
-        Tool(name="revit_get_group_members", description="Get group members", inputSchema={"type": "object", "properties": {"group_id": {"type": "integer"}}, "required": ["group_id"]}),
-        # Batch 4: Links
-        Tool(name="revit_get_rvt_links", description="Get RVT links", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_get_link_instances", description="Get link instances", inputSchema={"type": "object", "properties": {}}),
-        # Batch 5: Advanced MEP & Engineering
-        Tool(name="revit_create_cable_tray", description="Create cable tray run", inputSchema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number", "default": 10}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number", "default": 10}, "width": {"type": "number", "default": 1.0}, "height": {"type": "number", "default": 0.33}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]}),
-        Tool(name="revit_create_conduit", description="Create electrical conduit", inputSchema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number", "default": 10}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number", "default": 10}, "diameter": {"type": "number", "default": 0.0625}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]}),
-        Tool(name="revit_get_mep_systems", description="Get MEP systems info", inputSchema={"type": "object", "properties": {"system_type": {"type": "string", "default": "all"}}}),
-        Tool(name="revit_check_clashes", description="Check clashes between categories", inputSchema={"type": "object", "properties": {"category1": {"type": "string"}, "category2": {"type": "string"}, "tolerance": {"type": "number", "default": 0.01}}, "required": ["category1", "category2"]}),
-        # Batch 6: Materials & Visuals
-        Tool(name="revit_create_material", description="Create a new material with color and properties", inputSchema={"type": "object", "properties": {"name": {"type": "string"}, "color": {"type": "object", "properties": {"r": {"type": "integer"}, "g": {"type": "integer"}, "b": {"type": "integer"}}}, "transparency": {"type": "integer", "default": 0}, "shininess": {"type": "integer", "default": 50}, "smoothness": {"type": "integer", "default": 50}}, "required": ["name"]}),
-        Tool(name="revit_set_element_material", description="Set material for an element or specific face", inputSchema={"type": "object", "properties": {"element_id": {"type": "integer"}, "material_name": {"type": "string"}, "face_index": {"type": "integer", "description": "Optional face index for face-specific material"}}, "required": ["element_id", "material_name"]}),
-        Tool(name="revit_get_render_settings", description="Get rendering settings from document", inputSchema={"type": "object", "properties": {}}),
-        # Batch 7: Family Management
-        Tool(name="revit_convert_to_group", description="Convert elements into a group", inputSchema={"type": "object", "properties": {"element_ids": {"type": "array", "items": {"type": "integer"}}, "name": {"type": "string"}}, "required": ["element_ids"]}),
-        Tool(name="revit_edit_family", description="Open a family for editing", inputSchema={"type": "object", "properties": {"family_name": {"type": "string"}, "family_symbol_id": {"type": "integer"}, "family_instance_id": {"type": "integer"}}, "required": []}),
-        # Batch 8: High-Value Documentation & Analysis
-        Tool(name="revit_create_dimension", description="Create linear dimension between elements", inputSchema={"type": "object", "properties": {"start_point": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}}}, "end_point": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}}}, "element1_id": {"type": "integer"}, "element2_id": {"type": "integer"}}, "required": ["start_point", "end_point", "element1_id", "element2_id"]}),
-        Tool(name="revit_create_revision_cloud", description="Create revision cloud defined by points", inputSchema={"type": "object", "properties": {"view_id": {"type": "integer"}, "points": {"type": "array", "items": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}}}}, "revision_id": {"type": "integer"}}, "required": ["view_id", "points"]}),
-        Tool(name="revit_get_revision_sequences", description="Get list of revision sequences", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_tag_all_in_view", description="Tag all elements of a category in view", inputSchema={"type": "object", "properties": {"category": {"type": "string"}}, "required": ["category"]}),
-        Tool(name="revit_create_text_type", description="Create or duplicate a text type", inputSchema={"type": "object", "properties": {"name": {"type": "string"}, "font": {"type": "string", "default": "Arial"}, "size_inches": {"type": "number", "default": 0.09375}}, "required": ["name"]}),
-        Tool(name="revit_get_view_templates", description="Get list of view templates", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_apply_view_template", description="Apply view template to a view", inputSchema={"type": "object", "properties": {"view_id": {"type": "integer"}, "template_id": {"type": "integer"}}, "required": ["view_id", "template_id"]}),
-        Tool(name="revit_calculate_material_quantities", description="Calculate material volumes for a category", inputSchema={"type": "object", "properties": {"category": {"type": "string"}}, "required": ["category"]}),
-        Tool(name="revit_get_room_boundary", description="Get room geometric boundary loops", inputSchema={"type": "object", "properties": {"room_id": {"type": "integer"}}, "required": ["room_id"]}),
-        Tool(name="revit_get_project_location", description="Get project base and survey points", inputSchema={"type": "object", "properties": {}}),
-        Tool(name="revit_get_warnings", description="Get current project warnings", inputSchema={"type": "object", "properties": {}}),
-        # Batch 9: Universal Reflection Bridge (10k+ Tools)
-        Tool(name="revit_invoke_method", description="Invoke any Revit API method dynamically using Reflection", inputSchema={"type": "object", "properties": {"class_name": {"type": "string"}, "method_name": {"type": "string"}, "arguments": {"type": "array", "items": {}}, "target_id": {"type": "string"}, "use_transaction": {"type": "boolean", "default": True}}, "required": ["class_name", "method_name", "arguments"]}),
-        Tool(name="revit_reflect_get", description="Get any Revit property value dynamically", inputSchema={"type": "object", "properties": {"target_id": {"type": "string"}, "property_name": {"type": "string"}}, "required": ["target_id", "property_name"]}),
-        Tool(name="revit_reflect_set", description="Set any Revit property value dynamically", inputSchema={"type": "object", "properties": {"target_id": {"type": "string"}, "property_name": {"type": "string"}, "value": {}}, "required": ["target_id", "property_name", "value"]}),
-        # Batch 10: LLM Power Tools
-        Tool(
-            name="revit_execute_python",
-            description=(
-                "Execute arbitrary Python/IronPython code inside Revit with full Revit API access. "
-                "Variables pre-injected: doc (Document), uidoc (UIDocument), uiapp (UIApplication), app (Application). "
-                "Write output to stdout (print) or set __output__ = 'result string'. "
-                "Use 'from Autodesk.Revit.DB import *' for API access."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {"type": "string", "description": "Python script to execute"},
-                    "timeout_ms": {"type": "integer", "description": "Execution timeout in milliseconds", "default": 10000}
-                },
-                "required": ["script"]
-            }
-        ),
-        Tool(
-            name="revit_change_element_type",
-            description=(
-                "Swap all instances of one element type to another type. "
-                "Works for Walls, Doors, Windows, Floors, Roofs, Columns, Furniture, etc. "
-                "Use revit_get_element_type or revit_list_elements first to find type IDs."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_type_id": {"type": "integer", "description": "Element type ID to replace (all instances)"},
-                    "target_type_id": {"type": "integer", "description": "Element type ID to change to"},
-                    "category": {"type": "string", "description": "Optional category filter (e.g. 'Walls', 'Doors') to limit scope"}
-                },
-                "required": ["source_type_id", "target_type_id"]
-            }
-        ),
-        Tool(
-            name="revit_get_elements_by_type",
-            description=(
-                "Get element IDs and key parameters, filtered by type, category, and/or level. "
-                "Paginated — default 200 per call, max 500. Use offset for pagination. "
-                "Specify 'fields' to limit returned data. Never crashes on large models."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type_id":  {"type": "integer", "description": "Filter by element type ID (optional)"},
-                    "category": {"type": "string",  "description": "Filter by category name, e.g. 'Walls', 'Doors' (optional)"},
-                    "level":    {"type": "string",  "description": "Filter by level name, e.g. 'BG', 'L1' (optional)"},
-                    "fields":   {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Fields to return: id always included. Options: name, category, type_id, level, length, area, volume"
-                    },
-                    "offset": {"type": "integer", "description": "Pagination offset (default 0)", "default": 0},
-                    "limit":  {"type": "integer", "description": "Max results to return (default 200, max 500)", "default": 200}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="revit_batch_set_parameters_by_filter",
-            description=(
-                "Set a parameter value on all elements matching a filter (category, type, level, or parameter value). "
-                "More powerful than revit_batch_set_parameters because you don't need to know element IDs first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filter": {
-                        "type": "object",
-                        "description": "Filter criteria to select elements",
-                        "properties": {
-                            "category": {"type": "string", "description": "Category name, e.g. 'Walls'"},
-                            "type_id":  {"type": "integer", "description": "Element type ID filter"},
-                            "level":    {"type": "string",  "description": "Level name filter"},
-                            "parameter_filter": {
-                                "type": "object",
-                                "description": "Only include elements where this parameter equals this value",
-                                "properties": {
-                                    "name":  {"type": "string"},
-                                    "value": {}
-                                },
-                                "required": ["name", "value"]
-                            }
-                        }
-                    },
-                    "parameter_name": {"type": "string", "description": "Name of the parameter to set"},
-                    "value": {"description": "Value to set (string, number, or boolean)"}
-                },
-                "required": ["filter", "parameter_name", "value"]
-            }
-        ),
-        Tool(
-            name="revit_replace_family_type",
-            description=(
-                "Replace all instances of one family/type combination with another, identified by name. "
-                "Use this for doors, windows, furniture etc. when you know the family and type names."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "old_family": {"type": "string", "description": "Current family name (exact match, case-insensitive)"},
-                    "old_type":   {"type": "string", "description": "Current type name"},
-                    "new_family": {"type": "string", "description": "Replacement family name"},
-                    "new_type":   {"type": "string", "description": "Replacement type name"}
-                },
-                "required": ["old_family", "old_type", "new_family", "new_type"]
-            }
-        ),
-        Tool(
-            name="revit_get_element_geometry",
-            description=(
-                "Get geometric data for an element: location point or curve endpoints, bounding box, "
-                "level, area, volume, and length. Coordinates are in Revit internal units (feet)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_id": {"type": "integer", "description": "Element ID"}
-                },
-                "required": ["element_id"]
-            }
-        ),
-    ]
+    bridge = await ready_bridge()
+    return catalog.tools(bridge.tool_catalog if bridge else None)
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Execute a Revit tool."""
+    with TRACER.span("mcp.call_tool", tool=name) as span:
+        return await _call_tool(name, arguments, span)
+
 
-    if not bridge:
+async def _call_tool(name: str, arguments: Any, span: Any) -> list[TextContent]:
+    config = get_config()
+    bridge = await ready_bridge()
+    spec = TOOL_REGISTRY.get(name)
+    if not bridge and (spec is None or spec.bridge_tool is not None):
         return [TextContent(
             type="text",
             text="Error: Bridge not configured. Set MCP_REVIT_BRIDGE_URL in your .env file."
         )]
 
+    # Unknown names are not recorded, so callers cannot grow the metrics table
+    tool_metrics = METRICS.tool("mcp", name) if spec is not None else None
+    started = time.perf_counter()
+    failed = True
     try:
-        # Map MCP tool names to Revit bridge tools
-        tool_mapping = {
-            # Existing Core Tools
-            "revit_health": ("revit.health", {}),
-            "revit_list_levels": ("revit.list_levels", {}),
-            "revit_list_views": ("revit.list_views", {}),
-            "revit_get_document_info": ("revit.get_document_info", {}),
-            "revit_list_elements": ("revit.list_elements_by_category", {
-                "category": arguments.get("category", "Walls")
-            }),
-            "revit_create_wall": ("revit.create_wall", {
-                "start_point": {
-                    "x": arguments.get("start_x", 0),
-                    "y": arguments.get("start_y", 0),
-                    "z": arguments.get("start_z", 0)
-                },
-                "end_point": {
-                    "x": arguments.get("end_x", 0),
-                    "y": arguments.get("end_y", 0),
-                    "z": arguments.get("end_z", 0)
-                },
-                "height": arguments.get("height", 10),
-                "level": arguments.get("level", "L1")
-            }),
-            "revit_create_floor": ("revit.create_floor", {
-                "boundary_points": [
-                    {"x": p.get("x", 0), "y": p.get("y", 0), "z": p.get("z", 0)}
-                    for p in arguments.get("points", [])
-                ],
-                "level": arguments.get("level", "L1")
-            }),
-            "revit_create_roof": ("revit.create_roof", {
-                "boundary_points": [
-                    {"x": p.get("x", 0), "y": p.get("y", 0), "z": p.get("z", 0)}
-                    for p in arguments.get("points", [])
-                ],
-                "level": arguments.get("level", "Level 2"),
-                "slope": arguments.get("slope", 0.5)
-            }),
-            "revit_create_level": ("revit.create_level", {
-                "name": arguments.get("name", "New Level"),
-                "elevation": arguments.get("elevation", 10)
-            }),
-            "revit_save_document": ("revit.save_document", {
-                "path": arguments.get("path", "")
-            }),
-            # Geometry (New)
-            "revit_create_grid": ("revit.create_grid", {
-                "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z")},
-                "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z")},
-                "name": arguments.get("name")
-            }),
-            "revit_create_room": ("revit.create_room", {
-                "level": arguments.get("level"),
-                "location_point": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0},
-                "name": arguments.get("name"),
-                "number": arguments.get("number")
-            }),
-            "revit_delete_element": ("revit.delete_element", {
-                "element_id": arguments.get("element_id")
-            }),
-            # Placement (New)
-            "revit_place_family_instance": ("revit.place_family_instance", {
-                "family_name": arguments.get("family_name"),
-                "type_name": arguments.get("type_name"),
-                "level": arguments.get("level"),
-                "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z")}
-            }),
-            "revit_place_door": ("revit.place_door", {
-                "wall_id": arguments.get("wall_id"),
-                "family_name": arguments.get("family_name"),
-                "type_name": arguments.get("type_name"),
-                "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z")}
-            }),
-            "revit_place_window": ("revit.place_window", {
-                "wall_id": arguments.get("wall_id"),
-                "family_name": arguments.get("family_name"),
-                "type_name": arguments.get("type_name"),
-                "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z")}
-            }),
-            "revit_list_families": ("revit.list_families", {}),
-            # Views (New)
-            "revit_create_floor_plan_view": ("revit.create_floor_plan_view", {
-                "level_name": arguments.get("level_name"),
-                "view_name": arguments.get("view_name")
-            }),
-            "revit_create_3d_view": ("revit.create_3d_view", {
-                "view_name": arguments.get("view_name")
-            }),
-            "revit_create_section_view": ("revit.create_section_view", {
-                "view_name": arguments.get("view_name"),
-                "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z")},
-                "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z")},
-                "height": arguments.get("height")
-            }),
-            # Parameters (New)
-            "revit_get_element_parameters": ("revit.get_element_parameters", {
-                "element_id": arguments.get("element_id")
-            }),
-            "revit_set_parameter_value": ("revit.set_parameter_value", {
-                "element_id": arguments.get("element_id"),
-                "parameter_name": arguments.get("parameter_name"),
-                "value": arguments.get("value")
-            }),
-            "revit_get_parameter_value": ("revit.get_parameter_value", {
-                "element_id": arguments.get("element_id"),
-                "parameter_name": arguments.get("parameter_name")
-            }),
-            "revit_list_shared_parameters": ("revit.list_shared_parameters", {}),
-            "revit_create_shared_parameter": ("revit.create_shared_parameter", {
-                "name": arguments.get("name"),
-                "group": arguments.get("group", "General"),
-                "type": arguments.get("type", "Text"),
-                "visible": arguments.get("visible", True)
-            }),
-            "revit_list_project_parameters": ("revit.list_project_parameters", {}),
-            "revit_create_project_parameter": ("revit.create_project_parameter", {
-                "name": arguments.get("name"),
-                "group": arguments.get("group", "General"),
-                "type": arguments.get("type", "Text"),
-                "category": arguments.get("category"),
-                "visible": arguments.get("visible", True)
-            }),
-            "revit_batch_set_parameters": ("revit.batch_set_parameters", {
-                "element_ids": arguments.get("element_ids"),
-                "parameter_name": arguments.get("parameter_name"),
-                "value": arguments.get("value")
-            }),
-            "revit_get_type_parameters": ("revit.get_type_parameters", {
-                "element_id": arguments.get("element_id")
-            }),
-            "revit_set_type_parameter": ("revit.set_type_parameter", {
-                "element_id": arguments.get("element_id"),
-                "parameter_name": arguments.get("parameter_name"),
-                "value": arguments.get("value")
-            }),
-            # Sheets (New)
-            "revit_list_sheets": ("revit.list_sheets", {}),
-            "revit_create_sheet": ("revit.create_sheet", {
-                "name": arguments.get("name"),
-                "number": arguments.get("number"),
-                "titleblock_id": arguments.get("titleblock_id")
-            }),
-            "revit_delete_sheet": ("revit.delete_sheet", {
-                "sheet_id": arguments.get("sheet_id")
-            }),
-            "revit_place_viewport_on_sheet": ("revit.place_viewport_on_sheet", {
-                "sheet_id": arguments.get("sheet_id"),
-                "view_id": arguments.get("view_id"),
-                "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}
-            }),
-            "revit_batch_create_sheets_from_csv": ("revit.batch_create_sheets_from_csv", {
-                "csv_path": arguments.get("csv_path"),
-                "titleblock_name": arguments.get("titleblock_name")
-            }),
-            "revit_populate_titleblock": ("revit.populate_titleblock", {
-                "sheet_id": arguments.get("sheet_id"),
-                "parameters": arguments.get("parameters")
-            }),
-            "revit_list_titleblocks": ("revit.list_titleblocks", {}),
-            "revit_get_sheet_info": ("revit.get_sheet_info", {
-                "sheet_id": arguments.get("sheet_id")
-            }),
-            "revit_duplicate_sheet": ("revit.duplicate_sheet", {
-                "sheet_id": arguments.get("sheet_id"),
-                "with_views": arguments.get("with_views", False),
-                "duplicate_option": arguments.get("duplicate_option", "Duplicate")
-            }),
-            "revit_renumber_sheets": ("revit.renumber_sheets", {
-                "prefix": arguments.get("prefix"),
-                "start_number": arguments.get("start_number")
-            }),
-            # Batch 2: Selection
-            "revit_get_selection": ("revit.get_selection", {}),
-            "revit_set_selection": ("revit.set_selection", {"element_ids": arguments.get("element_ids")}),
-            # Batch 2: Annotation
-            "revit_create_text_note": ("revit.create_text_note", {"text": arguments.get("text"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}, "view_id": arguments.get("view_id")}),
-            "revit_create_tag": ("revit.create_tag", {"element_id": arguments.get("element_id"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}, "view_id": arguments.get("view_id")}),
-            # Batch 2: Structure
-            "revit_create_column": ("revit.create_column", {"family_name": arguments.get("family_name"), "type_name": arguments.get("type_name"), "level": arguments.get("level"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}}),
-            "revit_create_beam": ("revit.create_beam", {"family_name": arguments.get("family_name"), "type_name": arguments.get("type_name"), "level": arguments.get("level"), "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": 0}, "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": 0}}),
-            "revit_create_foundation": ("revit.create_foundation", {"family_name": arguments.get("family_name"), "type_name": arguments.get("type_name"), "level": arguments.get("level"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z", 0)}}),
-            # Batch 2: MEP
-            "revit_create_duct": ("revit.create_duct", {"level": arguments.get("level"), "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("z", 10)}, "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("z", 10)}, "system_type": arguments.get("system_type"), "duct_type": arguments.get("duct_type")}),
-            "revit_create_pipe": ("revit.create_pipe", {"level": arguments.get("level"), "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("z", 0)}, "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("z", 0)}, "system_type": arguments.get("system_type"), "pipe_type": arguments.get("pipe_type")}),
-            # Batch 2: Helpers
-            "revit_get_categories": ("revit.get_categories", {}),
-            "revit_get_element_type": ("revit.get_element_type", {"category_name": arguments.get("category_name"), "family_name": arguments.get("family_name")}),
-            # Batch 2: Remaining Existing
-            "revit_close_document": ("revit.close_document", {"save_changes": arguments.get("save_changes", False)}),
-            "revit_create_new_document": ("revit.create_new_document", {"template_path": arguments.get("template_path")}),
-            "revit_export_dwg": ("revit.export_dwg_by_view", {"view_id": arguments.get("view_id"), "output_path": arguments.get("output_path")}),
-            "revit_export_ifc": ("revit.export_ifc_with_settings", {"output_path": arguments.get("output_path")}),
-            "revit_export_navisworks": ("revit.export_navisworks", {"output_path": arguments.get("output_path")}),
-            "revit_export_image": ("revit.export_image", {"view_id": arguments.get("view_id"), "output_path": arguments.get("output_path"), "width": arguments.get("width"), "height": arguments.get("height")}),
-            "revit_render_3d": ("revit.render_3d_view", {"view_id": arguments.get("view_id"), "output_path": arguments.get("output_path"), "quality": arguments.get("quality", "Medium")}),
-            # Batch 3: Editing
-            "revit_move_element": ("revit.move_element", {"element_id": arguments.get("element_id"), "vector": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z", 0)}}),
-            "revit_copy_element": ("revit.copy_element", {"element_id": arguments.get("element_id"), "vector": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z", 0)}}),
-            "revit_rotate_element": ("revit.rotate_element", {"element_id": arguments.get("element_id"), "axis_point": {"x": arguments.get("center_x"), "y": arguments.get("center_y"), "z": arguments.get("center_z", 0)}, "angle_radians": arguments.get("angle_radians")}),
-            "revit_mirror_element": ("revit.mirror_element", {"element_id": arguments.get("element_id"), "plane_origin": {"x": arguments.get("plane_origin_x"), "y": arguments.get("plane_origin_y"), "z": arguments.get("plane_origin_z", 0)}, "plane_normal": {"x": arguments.get("plane_normal_x"), "y": arguments.get("plane_normal_y"), "z": arguments.get("plane_normal_z", 0)}}),
-            "revit_pin_element": ("revit.pin_element", {"element_id": arguments.get("element_id")}),
-            "revit_unpin_element": ("revit.unpin_element", {"element_id": arguments.get("element_id")}),
-            # Batch 3: Worksharing
-            "revit_sync_to_central": ("revit.sync_to_central", {"comment": arguments.get("comment", "Sync via MCP"), "relinquish": arguments.get("relinquish", True)}),
-            "revit_relinquish_all": ("revit.relinquish_all", {}),
-            "revit_get_worksets": ("revit.get_worksets", {}),
-            # Batch 3: Schedules & Geo
-            "revit_create_schedule": ("revit.create_schedule", {"category_name": arguments.get("category_name"), "name": arguments.get("name")}),
-            "revit_get_schedule_data": ("revit.get_schedule_data", {"schedule_id": arguments.get("schedule_id")}),
-            "revit_get_element_bounding_box": ("revit.get_element_bounding_box", {"element_id": arguments.get("element_id")}),
-            # Batch 4: Phasing
-            "revit_get_phases": ("revit.get_phases", {}),
-            "revit_get_phase_filters": ("revit.get_phase_filters", {}),
-            # Batch 4: Design Options
-            "revit_get_design_options": ("revit.get_design_options", {}),
-            # Batch 4: Groups
-            "revit_create_group": ("revit.create_group", {"element_ids": arguments.get("element_ids"), "name": arguments.get("name")}),
-            "revit_ungroup": ("revit.ungroup", {"group_id": arguments.get("group_id")}),
-            "revit_get_group_members": ("revit.get_group_members", {"group_id": arguments.get("group_id")}),
-            # Batch 4: Links
-            "revit_get_rvt_links": ("revit.get_rvt_links", {}),
-            "revit_get_link_instances": ("revit.get_link_instances", {}),
-            # Batch 5: Advanced MEP & Engineering
-            "revit_create_cable_tray": ("revit.create_cable_tray", {
-                "level": arguments.get("level"),
-                "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z", 10)},
-                "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z", 10)},
-                "width": arguments.get("width", 1.0),
-                "height": arguments.get("height", 0.33),
-                "cable_tray_type": arguments.get("cable_tray_type")
-            }),
-            "revit_create_conduit": ("revit.create_conduit", {
-                "level": arguments.get("level"),
-                "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z", 10)},
-                "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z", 10)},
-                "diameter": arguments.get("diameter", 0.0625),
-                "conduit_type": arguments.get("conduit_type")
-            }),
-            "revit_get_mep_systems": ("revit.get_mep_systems", {
-                "system_type": arguments.get("system_type", "all")
-            }),
-            "revit_check_clashes": ("revit.check_clashes", {
-                "category1": arguments.get("category1"),
-                "category2": arguments.get("category2"),
-                "tolerance": arguments.get("tolerance", 0.01)
-            }),
-            # Batch 6: Materials & Visuals
-            "revit_create_material": ("revit.create_material", {
-                "name": arguments.get("name"),
-                "color": arguments.get("color"),
-                "transparency": arguments.get("transparency", 0),
-                "shininess": arguments.get("shininess", 50),
-                "smoothness": arguments.get("smoothness", 50)
-            }),
-            "revit_set_element_material": ("revit.set_element_material", {
-                "element_id": arguments.get("element_id"),
-                "material_name": arguments.get("material_name"),
-                "face_index": arguments.get("face_index")
-            }),
-            "revit_get_render_settings": ("revit.get_render_settings", {}),
-            # Batch 7: Family Management
-            "revit_convert_to_group": ("revit.convert_to_group", {
-                "element_ids": arguments.get("element_ids"),
-                "name": arguments.get("name")
-            }),
-            "revit_edit_family": ("revit.edit_family", {
-                "family_name": arguments.get("family_name"),
-                "family_symbol_id": arguments.get("family_symbol_id"),
-                "family_instance_id": arguments.get("family_instance_id")
-            }),
-            # Batch 8: High-Value Documentation & Analysis
-            "revit_create_dimension": ("revit.create_dimension", {
-                "start_point": arguments.get("start_point"),
-                "end_point": arguments.get("end_point"),
-                "element1_id": arguments.get("element1_id"),
-                "element2_id": arguments.get("element2_id")
-            }),
-            "revit_create_revision_cloud": ("revit.create_revision_cloud", {
-                "view_id": arguments.get("view_id"),
-                "points": arguments.get("points"),
-                "revision_id": arguments.get("revision_id")
-            }),
-            "revit_get_revision_sequences": ("revit.get_revision_sequences", {}),
-            "revit_tag_all_in_view": ("revit.tag_all_in_view", {"category": arguments.get("category")}),
-            "revit_create_text_type": ("revit.create_text_type", {
-                "name": arguments.get("name"),
-                "font": arguments.get("font"),
-                "size_inches": arguments.get("size_inches")
-            }),
-            "revit_get_view_templates": ("revit.get_view_templates", {}),
-            "revit_apply_view_template": ("revit.apply_view_template", {
-                "view_id": arguments.get("view_id"),
-                "template_id": arguments.get("template_id")
-            }),
-            "revit_calculate_material_quantities": ("revit.calculate_material_quantities", {"category": arguments.get("category")}),
-            "revit_get_room_boundary": ("revit.get_room_boundary", {"room_id": arguments.get("room_id")}),
-            "revit_get_project_location": ("revit.get_project_location", {}),
-            "revit_get_warnings": ("revit.get_warnings", {}),
-            # Batch 9: Universal Reflection Bridge
-            "revit_invoke_method": ("revit.invoke_method", {
-                "class_name": arguments.get("class_name"),
-                "method_name": arguments.get("method_name"),
-                "arguments": arguments.get("arguments"),
-                "target_id": arguments.get("target_id"),
-                "use_transaction": arguments.get("use_transaction", True)
-            }),
-            "revit_reflect_get": ("revit.reflect_get", {
-                "target_id": arguments.get("target_id"),
-                "property_name": arguments.get("property_name")
-            }),
-            "revit_reflect_set": ("revit.reflect_set", {
-                "target_id": arguments.get("target_id"),
-                "property_name": arguments.get("property_name"),
-                "value": arguments.get("value")
-            }),
-            # Batch 10: LLM Power Tools
-            "revit_execute_python": ("revit.execute_python", {
-                "script": arguments.get("script"),
-                "timeout_ms": arguments.get("timeout_ms", 10000)
-            }),
-            "revit_change_element_type": ("revit.change_element_type", {
-                "source_type_id": arguments.get("source_type_id"),
-                "target_type_id": arguments.get("target_type_id"),
-                "category": arguments.get("category")
-            }),
-            "revit_get_elements_by_type": ("revit.get_elements_by_type", {
-                "type_id":  arguments.get("type_id"),
-                "category": arguments.get("category"),
-                "level":    arguments.get("level"),
-                "fields":   arguments.get("fields"),
-                "offset":   arguments.get("offset", 0),
-                "limit":    arguments.get("limit", 200)
-            }),
-            "revit_batch_set_parameters_by_filter": ("revit.batch_set_parameters_by_filter", {
-                "filter":         arguments.get("filter"),
-                "parameter_name": arguments.get("parameter_name"),
-                "value":          arguments.get("value")
-            }),
-            "revit_replace_family_type": ("revit.replace_family_type", {
-                "old_family": arguments.get("old_family"),
-                "old_type":   arguments.get("old_type"),
-                "new_family": arguments.get("new_family"),
-                "new_type":   arguments.get("new_type")
-            }),
-            "revit_get_element_geometry": ("revit.get_element_geometry", {
-                "element_id": arguments.get("element_id")
-            }),
-        }
-
-        if name not in tool_mapping:
+        if spec is None:
             return [TextContent(
                 type="text",
                 text=f"Error: Unknown tool '{name}'"
             )]
 
-        bridge_tool, payload = tool_mapping[name]
+        with TRACER.span("mcp.build_payload"):
+            payload = spec.build_payload(arguments)
 
-        # Call the bridge
-        result = bridge.call_tool(bridge_tool, payload)
+        snapshot = heartbeat.fresh_snapshot() if heartbeat is not None else None
+        if spec.bridge_tool is None:
+            result = await LOCAL_TOOLS[name](payload)
+        elif spec.bridge_tool == "revit.health" and snapshot is not None:
+            # Answered from the heartbeat instead of the Revit UI thread
+            result = snapshot.as_result()
+        elif spec.bridge_tool == BATCH_TOOL:
+            # call_batch also normalizes element IDs in each operation's result
+            result = await bridge.call_batch(
+                payload["operations"],
+                transaction=payload["transaction"],
+                stop_on_error=payload["stop_on_error"],
+            )
+        else:
+            # Call the bridge
+            result = await bridge.call_tool(spec.bridge_tool, payload)
+        if spec.transform_result is not None:
+            result = spec.transform_result(arguments, result)
 
         # Format the response
-        response_text = f"✓ {name} executed successfully\n\n"
-        response_text += f"Result:\n{json.dumps(result, indent=2)}"
+        formatting_started = time.perf_counter()
+        with TRACER.span("mcp.format") as format_span:
+            encoding = arguments.get("response_format") or config.response_encoding
+            body = encode_result(result, encoding, compact_threshold=config.response_compact_threshold)
+            response_text = f"✓ {name} executed successfully\n\n"
+            if config.result_inline_limit and len(body) > config.result_inline_limit and spec.bridge_tool is not None:
+                # Storing may spill older results to disk; keep that off the event loop
+                handle = await asyncio.to_thread(get_results().put, name, result, len(body))
+                format_span.set("result_handle", handle)
+                response_text += (
+                    f"Result too large to return inline ({len(body)} characters); stored as result_handle '{handle}'.\n"
+                    f"Use revit_fetch_result with this handle, an optional JSON path and offset/limit to read it.\n\n"
+                    "Summary:\n" + json.dumps({"result_handle": handle, "summary": summarize(result)}, indent=2)
+                )
+            else:
+                response_text += "Result:\n" + body
+            format_span.set("characters", len(body))
+        tool_metrics.observe("format", time.perf_counter() - formatting_started)
 
+        failed = False
         return [TextContent(type="text", text=response_text)]
 
     except BridgeError as e:
+        span.set("error", f"BridgeError: {e}")
         error_msg = f"Revit Bridge Error: {str(e)}\n\n"
         error_msg += "Make sure:\n"
         error_msg += "1. Revit is running\n"
@@ -1033,24 +219,64 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         return [TextContent(type="text", text=error_msg)]
 
     except Exception as e:
+        span.set("error", f"{type(e).__name__}: {e}")
         return [TextContent(
             type="text",
             text=f"Error: {str(e)}"
         )]
 
+    finally:
+        if tool_metrics is not None:
+            tool_metrics.observe("total", time.perf_counter() - started)
+            tool_metrics.record(error=failed)
+
+
+async def _dump_metrics(path: Path, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(METRICS.dump, path)
+
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    global heartbeat
+    config = get_config()
+    bridge = get_bridge()
+    if bridge is not None and config.heartbeat_interval > 0:
+        heartbeat = Heartbeat(bridge, config.heartbeat_interval)
+        heartbeat.subscribe(bridge.observe_health)
+        heartbeat.start()
+    if config.trace_file is not None:
+        TRACER.configure(config.trace_file, config.trace_sample_rate)
+    metrics_task = None
+    if config.metrics_file is not None:
+        metrics_task = asyncio.create_task(_dump_metrics(config.metrics_file, config.metrics_dump_interval))
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        if metrics_task is not None:
+            metrics_task.cancel()
+            METRICS.dump(config.metrics_file)
+        if heartbeat is not None:
+            await heartbeat.stop()
+        if bridge is not None:
+            await bridge.aclose()
+        if results is not _UNSET:
+            results.close()
+        TRACER.close()
 
 
 def run_mcp_server():
     """Entry point for running the MCP server."""
+    if sys.argv[1:2] == ["audit"]:
+        from .security.audit_query import main as audit_main
+
+        sys.exit(audit_main(sys.argv[2:]))
     asyncio.run(main())
 
 
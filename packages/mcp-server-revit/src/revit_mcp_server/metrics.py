@@ -0,0 +1,170 @@
+"""Per-tool call metrics and their Prometheus text exposition.
+
+Each instrumented layer records under its own label: ``mcp`` for
+``mcp_server.call_tool`` (MCP tool names), ``server`` for
+``MCPServer.handle_tool`` and ``bridge`` for the bridge clients (bridge tool
+names). Latencies are kept per phase:
+
+- ``total``: the whole call at that layer
+- ``queue``: time the command waited for the Revit UI thread (reported by the bridge)
+- ``bridge``: time Revit spent executing the command (reported by the bridge)
+- ``network``: HTTP round trip minus ``queue`` and ``bridge``
+- ``format``: encoding the result for the MCP response
+
+Percentiles are computed over the most recent ``reservoir`` samples, while
+counts and sums cover the whole process lifetime.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencySummary:
+    def __init__(self, reservoir: int = 1024):
+        self.samples: deque[float] = deque(maxlen=reservoir)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+        self.sum += seconds
+
+    def quantiles(self) -> dict[float, float]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {}
+        return {q: ordered[min(int(q * len(ordered)), len(ordered) - 1)] for q in QUANTILES}
+
+
+class ToolMetrics:
+    def __init__(self, reservoir: int = 1024):
+        self._reservoir = reservoir
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.phases: dict[str, LatencySummary] = {}
+
+    def observe(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            summary = self.phases.get(phase)
+            if summary is None:
+                summary = self.phases[phase] = LatencySummary(self._reservoir)
+            summary.observe(seconds)
+
+    def record(self, *, error: bool = False, request_bytes: int = 0, response_bytes: int = 0) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += error
+            self.request_bytes += request_bytes
+            self.response_bytes += response_bytes
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "error_rate": round(self.errors / self.calls, 4) if self.calls else 0.0,
+                "retries": self.retries,
+                "request_bytes": self.request_bytes,
+                "response_bytes": self.response_bytes,
+                "latency_ms": {
+                    phase: {
+                        "count": summary.count,
+                        "mean": round(summary.sum / summary.count * 1000, 3),
+                        **{f"p{int(q * 100)}": round(value * 1000, 3) for q, value in summary.quantiles().items()},
+                    }
+                    for phase, summary in self.phases.items()
+                },
+            }
+
+
+class Metrics:
+    def __init__(self, reservoir: int = 1024):
+        self.reservoir = reservoir
+        self._lock = threading.Lock()
+        self._tools: dict[tuple[str, str], ToolMetrics] = {}
+
+    def tool(self, layer: str, tool: str) -> ToolMetrics:
+        key = (layer, tool)
+        metrics = self._tools.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._tools.setdefault(key, ToolMetrics(self.reservoir))
+        return metrics
+
+    @contextmanager
+    def timed(self, layer: str, tool: str, phase: str = "total") -> Iterator[ToolMetrics]:
+        metrics = self.tool(layer, tool)
+        started = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.observe(phase, time.perf_counter() - started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            items = sorted(self._tools.items())
+        snapshot: dict[str, dict[str, Any]] = {}
+        for (layer, tool), metrics in items:
+            snapshot.setdefault(layer, {})[tool] = metrics.snapshot()
+        return snapshot
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            items = sorted(self._tools.items())
+        counters = (
+            ("revit_mcp_calls_total", "Tool calls", "calls"),
+            ("revit_mcp_errors_total", "Tool calls that failed", "errors"),
+            ("revit_mcp_retries_total", "Bridge request retries", "retries"),
+            ("revit_mcp_request_bytes_total", "Bytes sent to the bridge", "request_bytes"),
+            ("revit_mcp_response_bytes_total", "Bytes received from the bridge", "response_bytes"),
+        )
+        lines = []
+        for name, help_text, attribute in counters:
+            lines += [f"# HELP {name} {help_text}.", f"# TYPE {name} counter"]
+            for (layer, tool), metrics in items:
+                lines.append(f'{name}{{layer="{layer}",tool="{tool}"}} {getattr(metrics, attribute)}')
+        name = "revit_mcp_latency_seconds"
+        lines += [f"# HELP {name} Tool call latency by phase.", f"# TYPE {name} summary"]
+        for (layer, tool), metrics in items:
+            with metrics._lock:
+                phases = [(phase, summary.quantiles(), summary.sum, summary.count) for phase, summary in metrics.phases.items()]
+            for phase, quantiles, total, count in phases:
+                labels = f'layer="{layer}",tool="{tool}",phase="{phase}"'
+                for q, value in quantiles.items():
+                    lines.append(f'{name}{{{labels},quantile="{q}"}} {value:.6f}')
+                lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Path) -> None:
+        """Atomically write the Prometheus text, e.g. for a node_exporter textfile collector."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        partial.write_text(self.prometheus(), encoding="utf-8")
+        os.replace(partial, path)
+
+
+# Process-wide registry shared by every instrumented layer.
+METRICS = Metrics()
@@ -0,0 +1,332 @@
+"""Replay audit-log traffic as a load test (``revit-mcp-replay``).
+
+Every call ``MCPServer.handle_tool`` served is in the audit log with its
+tool, payload and timestamp. ``load_calls`` reads them back, including
+rotated segments and out-of-line payload blobs, and ``replay`` sends them
+through ``MCPServer.handle_tool`` again, in mock mode or against a bridge
+URL such as the stand-in bridge:
+
+    revit-mcp-replay --log audit.log --speed 1                  # original timing
+    revit-mcp-replay --log audit.log --speed 10 --concurrency 8
+    revit-mcp-replay --log audit.log --speed 0 --bridge-url http://127.0.0.1:3000
+
+``--speed 0`` sends calls as fast as the workers take them. Otherwise each
+call is released at its original offset divided by the speed, and latency
+is counted from that scheduled time, so a slow server shows up as growing
+latency rather than a silently stretched schedule. The report holds
+throughput, latency percentiles and error rates, overall and per tool.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+from .security.audit import index_path, load_blob, rotated_segments
+from .security.audit_query import parse_time, query_audit
+
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+Target = Callable[[str, dict], Any]
+
+
+@dataclass(frozen=True)
+class ReplayCall:
+    offset: float  # seconds after the first call in the trace
+    tool: str
+    payload: dict
+    request_id: str
+
+
+def _entries(log: Path, **filters: Any) -> Iterator[dict]:
+    if index_path(log).exists() or rotated_segments(log):
+        yield from query_audit(log, **filters)
+        return
+    # A copied log without its index: scan it, honouring the same filters
+    since, until = parse_time(filters.get("since")), parse_time(filters.get("until"))
+    returned = 0
+    with log.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if filters.get("tool") is not None and entry.get("tool") != filters["tool"]:
+                continue
+            moment = parse_time(entry["timestamp"])
+            if (since is not None and moment < since) or (until is not None and moment > until):
+                continue
+            yield entry
+            returned += 1
+            if filters.get("limit") is not None and returned >= filters["limit"]:
+                return
+
+
+def load_calls(
+    log: Path,
+    *,
+    tool: str | None = None,
+    since: str | datetime | None = None,
+    until: str | datetime | None = None,
+    limit: int | None = None,
+    blob_dir: Path | None = None,
+) -> tuple[list[ReplayCall], int]:
+    """Replayable calls from ``log`` in time order, and how many entries were skipped.
+
+    Payloads stored out of line are read from ``blob_dir`` (``audit-blobs``
+    next to the log by default). Truncated payloads cannot be replayed and
+    are skipped, as are blobs that no longer exist.
+    """
+    blob_dir = blob_dir if blob_dir is not None else log.parent / "audit-blobs"
+    calls: list[tuple[datetime, str, dict, str]] = []
+    skipped = 0
+    for entry in _entries(log, tool=tool, since=since, until=until, limit=limit):
+        payload = entry.get("payload")
+        if isinstance(payload, dict) and "$blob" in payload:
+            digest = payload["$blob"]
+            try:
+                payload = load_blob(blob_dir, digest)
+            except OSError:
+                payload = None
+        if not isinstance(payload, dict) or "$truncated" in payload:
+            skipped += 1
+            continue
+        calls.append((parse_time(entry["timestamp"]), entry["tool"], payload, entry.get("request_id", "")))
+    if not calls:
+        return [], skipped
+    calls.sort(key=lambda call: call[0])
+    start = calls[0][0]
+    return [
+        ReplayCall((moment - start).total_seconds(), tool, payload, request_id)
+        for moment, tool, payload, request_id in calls
+    ], skipped
+
+
+def _summary(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    calls = len(ordered)
+    summary: dict[str, Any] = {
+        "calls": calls,
+        "errors": errors,
+        "error_rate": round(errors / calls, 4) if calls else 0.0,
+        "throughput_per_s": round(calls / elapsed, 3) if elapsed > 0 else 0.0,
+    }
+    if ordered:
+        summary["latency_ms"] = {
+            "mean": round(sum(ordered) / calls * 1000, 3),
+            **{f"p{int(q * 100)}": round(ordered[min(int(q * calls), calls - 1)] * 1000, 3) for q in QUANTILES},
+            "max": round(ordered[-1] * 1000, 3),
+        }
+    return summary
+
+
+def replay(
+    calls: Sequence[ReplayCall],
+    target: Target,
+    *,
+    speed: float = 1.0,
+    concurrency: int = 1,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, Any]:
+    """Send ``calls`` to ``target`` and report throughput, latency and errors.
+
+    With ``speed > 0`` call *n* is released at ``offset / speed`` seconds
+    after the start; a call that cannot start on time because all
+    ``concurrency`` workers are busy waits, and that wait counts as latency.
+    With ``speed == 0`` calls are released back to back.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if speed < 0:
+        raise ValueError("speed must be 0 (as fast as possible) or positive")
+    lock = threading.Lock()
+    latencies: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    messages: dict[str, int] = {}
+    slots = threading.Semaphore(concurrency)
+    lag: list[float] = []
+
+    def run(call: ReplayCall, scheduled: float) -> None:
+        try:
+            failed, message = False, None
+            started = clock()
+            try:
+                target(call.tool, call.payload)
+            except Exception as exc:  # noqa: BLE001
+                failed, message = True, f"{type(exc).__name__}: {exc}"
+            finished = clock()
+            with lock:
+                latencies.setdefault(call.tool, []).append(finished - scheduled)
+                lag.append(started - scheduled)
+                errors[call.tool] = errors.get(call.tool, 0) + failed
+                if message is not None:
+                    messages[message] = messages.get(message, 0) + 1
+        finally:
+            slots.release()
+
+    started = clock()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="replay") as pool:
+        for call in calls:
+            if speed:
+                scheduled = started + call.offset / speed
+                delay = scheduled - clock()
+                if delay > 0:
+                    sleep(delay)
+            slots.acquire()
+            if not speed:
+                scheduled = clock()
+            pool.submit(run, call, scheduled)
+    elapsed = clock() - started
+
+    every = [value for values in latencies.values() for value in values]
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "speed": speed,
+            "concurrency": concurrency,
+            "trace_seconds": calls[-1].offset if calls else 0.0,
+            "elapsed_seconds": round(elapsed, 3),
+            "max_start_lag_ms": round(max(lag, default=0.0) * 1000, 3),
+        },
+        "overall": _summary(every, sum(errors.values()), elapsed),
+        "tools": {
+            tool: _summary(values, errors[tool], elapsed) for tool, values in sorted(latencies.items())
+        },
+        "top_errors": [
+            {"message": message, "count": count}
+            for message, count in sorted(messages.items(), key=lambda item: -item[1])[:10]
+        ],
+    }
+    return report
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Per-tool throughput, p95 latency and error rate of ``current`` next to ``baseline``."""
+    rows = []
+    sections = [("overall", baseline.get("overall"), current["overall"])]
+    sections += [(tool, baseline.get("tools", {}).get(tool), now) for tool, now in current["tools"].items()]
+    for name, before, now in sections:
+        if not before or "latency_ms" not in before or "latency_ms" not in now:
+            continue
+        rows.append({
+            "tool": name,
+            "baseline_throughput_per_s": before["throughput_per_s"],
+            "current_throughput_per_s": now["throughput_per_s"],
+            "baseline_p95_ms": before["latency_ms"]["p95"],
+            "current_p95_ms": now["latency_ms"]["p95"],
+            "baseline_error_rate": before["error_rate"],
+            "current_error_rate": now["error_rate"],
+        })
+    return rows
+
+
+def server_target(
+    *,
+    workspace: Path,
+    bridge_url: str | None = None,
+    model_elements: int = 0,
+    model_seed: int = 0,
+) -> tuple[Target, Callable[[], None]]:
+    """``MCPServer.handle_tool`` in mock mode, or in bridge mode against ``bridge_url``.
+
+    The server writes its own audit log under ``workspace``, never into the
+    log being replayed. Returns the target and a function that closes it.
+    """
+    from .config import BridgeMode, Config
+    from .server import MCPServer
+
+    config = Config(
+        workspace_dir=workspace,
+        allowed_directories=[workspace],
+        audit_log=workspace / "replay-audit.log",
+        mode=BridgeMode.bridge if bridge_url else BridgeMode.mock,
+        bridge_url=bridge_url,
+        mock_model_elements=model_elements,
+        mock_model_seed=model_seed,
+        metrics_file=None,
+        trace_file=None,
+    )
+    server = MCPServer(config)
+    return server.handle_tool, server.close
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="revit-mcp-replay", description=__doc__.splitlines()[0])
+    parser.add_argument("--log", type=Path, help="Audit log to replay (defaults to MCP_REVIT_AUDIT_LOG)")
+    parser.add_argument("--tool", help="Only replay this tool, e.g. revit.create_wall")
+    parser.add_argument("--since", help="ISO 8601 time; naive values are UTC")
+    parser.add_argument("--until", help="ISO 8601 time; naive values are UTC")
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--speed", type=float, default=1.0, help="Timing multiplier: 1 = original, 10 = ten times faster, 0 = no waits")
+    parser.add_argument("--concurrency", type=int, default=4, help="Calls in flight at once")
+    parser.add_argument("--bridge-url", help="Replay in bridge mode against this URL (default: mock mode)")
+    parser.add_argument("--model-elements", type=int, default=0, help="In mock mode, back tools with a simulated model")
+    parser.add_argument("--model-seed", type=int, default=0)
+    parser.add_argument("--workspace", type=Path, help="Workspace for the replaying server (default: a temporary directory)")
+    parser.add_argument("--output", type=Path, help="Write the report as JSON to this path")
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare against")
+    args = parser.parse_args(argv)
+
+    log = args.log
+    if log is None:
+        from .config import get_config
+
+        log = get_config().audit_log
+    calls, skipped = load_calls(log, tool=args.tool, since=args.since, until=args.until, limit=args.limit)
+    print(f"Replaying {len(calls)} calls over {calls[-1].offset if calls else 0:.1f}s of trace ({skipped} skipped)")
+    if not calls:
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="revit-mcp-replay-") as tmp:
+        target, close = server_target(
+            workspace=args.workspace or Path(tmp),
+            bridge_url=args.bridge_url,
+            model_elements=args.model_elements,
+            model_seed=args.model_seed,
+        )
+        try:
+            report = replay(calls, target, speed=args.speed, concurrency=args.concurrency)
+        finally:
+            close()
+    report["meta"].update({"log": os.fspath(log), "skipped": skipped})
+
+    def line(name: str, summary: dict[str, Any]) -> str:
+        latency = summary.get("latency_ms", {})
+        return (
+            f"{name:<40} {summary['calls']:>7} calls {summary['throughput_per_s']:>9.1f}/s "
+            f"p50 {latency.get('p50', 0):>9.2f} p95 {latency.get('p95', 0):>9.2f} p99 {latency.get('p99', 0):>9.2f} ms "
+            f"errors {summary['error_rate']:.1%}"
+        )
+
+    for tool, summary in report["tools"].items():
+        print(line(tool, summary))
+    print(line("overall", report["overall"]))
+    for error in report["top_errors"]:
+        print(f"  {error['count']:>6} x {error['message']}")
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.baseline is not None:
+        print()
+        for row in compare(json.loads(args.baseline.read_text(encoding="utf-8")), report):
+            print(
+                f"{row['tool']:<40} {row['baseline_throughput_per_s']:>9.1f} -> {row['current_throughput_per_s']:>9.1f}/s  "
+                f"p95 {row['baseline_p95_ms']:>9.2f} -> {row['current_p95_ms']:>9.2f} ms  "
+                f"errors {row['baseline_error_rate']:.1%} -> {row['current_error_rate']:.1%}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
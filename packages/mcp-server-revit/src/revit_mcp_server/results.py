@@ -0,0 +1,189 @@
+"""Server-side store for oversized tool results.
+
+Results too large to return inline are kept here and replaced by a summary
+plus a handle. Clients page through them with ``revit_fetch_result``. Entries
+live in memory up to a byte budget; beyond it the least recently used ones
+are spilled as JSON files under the workspace directory.
+"""
+from __future__ import annotations
+
+import json
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .errors import ResultExpired, SchemaValidationError
+
+_PATH_TOKEN = re.compile(r"\[(\d+)\]|\.?([^.\[\]]+)")
+
+
+def resolve_path(value: Any, path: str | None) -> Any:
+    """Resolve a simple JSON path such as ``$.elements[10].name`` or ``elements.10``."""
+    if not path or path == "$":
+        return value
+    if path.startswith("$"):
+        path = path[1:]
+    position = 0
+    while position < len(path):
+        match = _PATH_TOKEN.match(path, position)
+        if match is None:
+            raise SchemaValidationError(f"Invalid path near {path[position:]!r}")
+        index, key = match.groups()
+        try:
+            if index is not None:
+                value = value[int(index)]
+            elif isinstance(value, list):
+                value = value[int(key)]
+            else:
+                value = value[key]
+        except (KeyError, IndexError, TypeError, ValueError) as exc:
+            raise SchemaValidationError(f"Path {path!r} does not exist in the stored result") from exc
+        position = match.end()
+    return value
+
+
+def summarize(value: Any, depth: int = 2) -> Any:
+    """Shape of ``value``: containers become ``list[n]``/``object{n}`` past ``depth``."""
+    if isinstance(value, dict):
+        if depth <= 0:
+            return f"object{{{len(value)}}}"
+        return {key: summarize(item, depth - 1) for key, item in value.items()}
+    if isinstance(value, list):
+        return f"list[{len(value)}]"
+    if isinstance(value, str) and len(value) > 80:
+        return value[:77] + "..."
+    return value
+
+
+@dataclass
+class _Entry:
+    tool: str
+    size: int
+    value: Any = None
+    spill_path: Path | None = None
+
+
+class ResultStore:
+    def __init__(
+        self,
+        spill_dir: Path,
+        *,
+        memory_budget: int = 64 * 1024 * 1024,
+        max_entries: int = 128,
+    ):
+        self.spill_dir = spill_dir
+        self.memory_budget = memory_budget
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+
+    def put(self, tool: str, value: Any, size: int) -> str:
+        """Store ``value`` (about ``size`` bytes of JSON) and return its handle."""
+        handle = f"res-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._entries[handle] = _Entry(tool=tool, size=size, value=value)
+            self._memory_used += size
+            self._enforce_limits()
+        return handle
+
+    def get(self, handle: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                raise ResultExpired(f"Result handle '{handle}' is unknown or has expired")
+            self._entries.move_to_end(handle)
+            if entry.spill_path is None:
+                return entry.value
+            spill_path = entry.spill_path
+        try:
+            # Read outside the lock; a concurrent put may evict and unlink it.
+            text = spill_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise ResultExpired(f"Result handle '{handle}' is unknown or has expired") from None
+        return json.loads(text)
+
+    def fetch(
+        self,
+        handle: str,
+        *,
+        path: str | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Return one page of the value at ``path`` inside a stored result."""
+        if offset < 0:
+            # A negative offset would silently page from the end of the list
+            raise SchemaValidationError(f"offset must be >= 0, got {offset}")
+        if limit < 1:
+            raise SchemaValidationError(f"limit must be >= 1, got {limit}")
+        value = resolve_path(self.get(handle), path)
+        page: dict[str, Any] = {"handle": handle, "path": path or "$"}
+        if isinstance(value, list):
+            items = value[offset:offset + limit]
+            total = len(value)
+            page.update(total=total, offset=offset, returned=len(items), items=items)
+        elif isinstance(value, dict):
+            keys = list(value)[offset:offset + limit]
+            total = len(value)
+            page.update(total=total, offset=offset, returned=len(keys), items={key: value[key] for key in keys})
+        else:
+            return {**page, "value": value}
+        if offset + limit < total:
+            page["next_offset"] = offset + limit
+        return page
+
+    def close(self) -> None:
+        """Forget every entry and delete spilled files, plus the spill directory if left empty."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                self._discard(entry)
+        try:
+            self.spill_dir.rmdir()
+        except OSError:
+            # Missing, or holding files this store did not write.
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            spilled = sum(1 for entry in self._entries.values() if entry.spill_path is not None)
+            return {
+                "entries": len(self._entries),
+                "spilled": spilled,
+                "memory_bytes": self._memory_used,
+                "memory_budget": self.memory_budget,
+            }
+
+    def _enforce_limits(self) -> None:
+        while len(self._entries) > self.max_entries:
+            _, entry = self._entries.popitem(last=False)
+            self._discard(entry)
+        if self._memory_used <= self.memory_budget:
+            return
+        # Spill least recently used in-memory entries, keeping the newest one
+        # in memory even if it alone exceeds the budget.
+        for handle, entry in list(self._entries.items())[:-1]:
+            if self._memory_used <= self.memory_budget:
+                break
+            if entry.spill_path is None:
+                self._spill(handle, entry)
+
+    def _spill(self, handle: str, entry: _Entry) -> None:
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        spill_path = self.spill_dir / f"{handle}.json"
+        spill_path.write_text(json.dumps(entry.value, separators=(",", ":")), encoding="utf-8")
+        entry.spill_path = spill_path
+        entry.value = None
+        self._memory_used -= entry.size
+
+    def _discard(self, entry: _Entry) -> None:
+        if entry.spill_path is None:
+            self._memory_used -= entry.size
+        else:
+            entry.spill_path.unlink(missing_ok=True)
@@ -104,6 +104,34 @@ class ExportResult(BaseModel):
     status: str
 
 
+class BatchOperation(BaseModel):
+    tool: str
+    payload: dict = Field(default_factory=dict)
+
+
+class BatchExecuteInput(RequestPayload):
+    operations: List[BatchOperation] = Field(..., min_length=1)
+    transaction: bool = False
+    stop_on_error: Optional[bool] = None
+
+
+class BatchOperationResult(BaseModel):
+    index: int
+    tool: str
+    status: str
+    result: Optional[dict] = None
+    message: Optional[str] = None
+
+
+class BatchExecuteOutput(BaseModel):
+    results: List[BatchOperationResult]
+    succeeded: int
+    failed: int
+    skipped: int
+    transaction: bool
+    rolled_back: bool
+
+
 class GenericAuditInput(RequestPayload):
     document_id: Optional[str] = None
 
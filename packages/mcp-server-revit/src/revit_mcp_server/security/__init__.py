@@ -1,4 +1,5 @@
-from .audit import AuditRecorder
+from .audit import AuditDurability, AuditRecorder
+from .audit_query import query_audit
 from .workspace import WorkspaceMonitor
 
-__all__ = ["AuditRecorder", "WorkspaceMonitor"]
+__all__ = ["AuditDurability", "AuditRecorder", "query_audit", "WorkspaceMonitor"]
@@ -1,23 +1,351 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, Any, Iterable
+
+from ..enums import AuditDurability
+from ..tracing import TRACER
+
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+# Index fields, the serialized log line and (digest, body) blobs of one entry
+_Record = tuple[dict, str, list[tuple[str, str]]]
+_AUDITED_FIELDS = ("payload", "response")
+REDACTED = "***"
+SEGMENT_STAMP = "%Y%m%dT%H%M%S%f"
+
+
+def index_path(segment: Path) -> Path:
+    """Sidecar index of ``segment``: ``audit.log.idx`` for ``audit.log`` and ``audit.log.gz``."""
+    name = segment.name[:-3] if segment.name.endswith(".gz") else segment.name
+    return segment.with_name(f"{name}.idx")
+
+
+def blob_path(blob_dir: Path, digest: str) -> Path:
+    """Where a body stored out of line under ``digest`` lives: ``<hash[:2]>/<hash>.json.gz``."""
+    return blob_dir / digest[:2] / f"{digest}.json.gz"
+
+
+def load_blob(blob_dir: Path, digest: str) -> Any:
+    """Return the body stored out of line under ``digest`` in ``blob_dir``."""
+    with gzip.open(blob_path(blob_dir, digest), "rt", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def rotated_segments(path: Path) -> list[Path]:
+    """Compressed segments rotated out of ``path``, oldest first."""
+    return sorted(path.parent.glob(f"{path.stem}-*{path.suffix}.gz"))
+
+
+def redact(value: Any, keys: frozenset[str]) -> Any:
+    """Copy of ``value`` with every dict entry whose key is in ``keys`` masked."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key.lower() in keys else redact(item, keys)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item, keys) for item in value]
+    return value
 
-from ..schemas import HealthOutput
 
 class AuditRecorder:
-    def __init__(self, path: Path):
+    """Appends one JSON line per tool call to the audit log.
+
+    ``record`` serializes the entry on the calling thread, so later changes
+    to the payload or response dicts do not reach the log. In ``batched`` and
+    ``fsync`` durability it then only enqueues the line; a writer thread
+    stores any blobs and appends batches through one open file handle, flushing every ``flush_interval`` seconds, once ``batch_size``
+    entries are pending, and on ``close``. ``fsync`` additionally syncs each
+    batch to disk. When ``max_queue`` entries are waiting, ``record`` blocks
+    until the writer catches up. ``sync`` writes on the calling thread.
+    ``record`` may be called from several threads at once, and raises
+    ``RuntimeError`` once the recorder is closed.
+    Values JSON cannot encode, such as ``Path``, are written as strings. An
+    entry that still cannot be serialized or written is logged, counted in
+    ``dropped`` and skipped, so it cannot stall ``record``, ``flush`` or
+    ``close``.
+
+    Before writing, keys in ``redact_keys`` are masked in the payload and
+    response and each gets a ``<field>_sha256`` content hash. A field whose
+    JSON is longer than ``max_field_bytes`` is replaced by a reference: with
+    ``blob_dir`` set the full body is stored once per hash as
+    ``<blob_dir>/<hash[:2]>/<hash>.json.gz``, otherwise a truncated preview is
+    kept.
+
+    The active log is rotated once it reaches ``rotate_bytes`` or has been
+    open for ``rotate_interval`` seconds: it is renamed to
+    ``<stem>-<UTC stamp><suffix>.gz`` and gzip-compressed. Every segment has
+    an uncompressed ``.idx`` sidecar with one ``{request_id, tool, timestamp,
+    offset}`` line per entry, which ``audit_query`` uses to find entries
+    without scanning the segments themselves.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        durability: AuditDurability = AuditDurability.batched,
+        flush_interval: float = 1.0,
+        batch_size: int = 256,
+        max_queue: int = 10000,
+        max_field_bytes: int = 0,
+        blob_dir: Path | None = None,
+        redact_keys: Iterable[str] = (),
+        rotate_bytes: int = 0,
+        rotate_interval: float = 0,
+    ):
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.durability = AuditDurability(durability)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        # Held while checking for close and enqueueing, so no entry is queued behind _STOP
+        self._enqueue_lock = threading.Lock()
+        self._fh: IO[bytes] | None = None
+        self._index: IO[str] | None = None
+        self._offset = 0
+        self._opened_at = 0.0
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        # Entries the writer thread could not serialize or write
+        self.dropped = 0
+        self.max_field_bytes = max_field_bytes
+        self.blob_dir = blob_dir
+        self.redact_keys = frozenset(key.lower() for key in redact_keys)
+        self.rotate_bytes = rotate_bytes
+        self.rotate_interval = rotate_interval
+
+    @classmethod
+    def from_config(cls, config_obj) -> "AuditRecorder":
+        return cls(
+            config_obj.audit_log,
+            durability=config_obj.audit_durability,
+            flush_interval=config_obj.audit_flush_interval,
+            batch_size=config_obj.audit_batch_size,
+            max_queue=config_obj.audit_max_queue,
+            max_field_bytes=config_obj.audit_max_field_bytes,
+            blob_dir=config_obj.audit_log.parent / "audit-blobs" if config_obj.audit_blobs else None,
+            redact_keys=config_obj.audit_redact_keys,
+            rotate_bytes=config_obj.audit_rotate_bytes,
+            rotate_interval=config_obj.audit_rotate_interval,
+        )
 
     def record(self, tool: str, request_id: str, payload: dict, response: dict) -> None:
-        entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "tool": tool,
-            "request_id": request_id,
-            "payload": payload,
-            "response": response,
-        }
-        with self.path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(entry) + "\n")
+        with TRACER.span("audit.record", durability=self.durability.value) as span:
+            entry = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "tool": tool,
+                "request_id": request_id,
+                "payload": payload,
+                "response": response,
+            }
+            if span.trace_id is not None:
+                entry["trace_id"] = span.trace_id
+            if self._closed:
+                raise RuntimeError("AuditRecorder is closed")
+            try:
+                record = self._serialize(entry)
+            except Exception:  # noqa: BLE001
+                self._drop(1, "serialize")
+                return
+            if self.durability == AuditDurability.sync:
+                self._write([record])
+                self._sync()
+                return
+            with self._enqueue_lock:
+                if self._closed:
+                    raise RuntimeError("AuditRecorder is closed")
+                self._ensure_writer()
+                self._queue.put(record)
+
+    def load_blob(self, digest: str) -> Any:
+        """Return the body stored out of line under ``digest``."""
+        if self.blob_dir is None:
+            raise FileNotFoundError("Audit blob storage is disabled")
+        return load_blob(self.blob_dir, digest)
+
+    def flush(self) -> None:
+        """Block until every entry recorded so far has been written."""
+        if self._writer is not None:
+            self._queue.join()
+        self._sync()
+
+    def close(self) -> None:
+        with self._enqueue_lock:
+            with self._lock:
+                if self._closed:
+                    return
+                self._closed = True
+                writer = self._writer
+            if writer is not None:
+                self._queue.put(_STOP)
+        if writer is not None:
+            writer.join()
+        with self._lock:
+            self._close_files()
+
+    def __enter__(self) -> "AuditRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _open(self) -> IO[bytes]:
+        if self._fh is None:
+            self._fh = self.path.open("ab")
+            self._index = index_path(self.path).open("a", encoding="utf-8")
+            self._offset = self._fh.tell()
+            self._opened_at = self._first_entry_time() if self._offset else time.time()
+        return self._fh
+
+    def _first_entry_time(self) -> float:
+        # The log survived a restart: its rotate_interval runs from its first
+        # entry, not from when this process reopened it.
+        try:
+            with index_path(self.path).open(encoding="utf-8") as fh:
+                first = json.loads(fh.readline())
+            return datetime.fromisoformat(first["timestamp"]).timestamp()
+        except (OSError, ValueError, KeyError, TypeError):
+            return time.time()
+
+    def _close_files(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._index.close()
+            self._fh = self._index = None
+
+    def _should_rotate(self) -> bool:
+        if not self._offset:
+            return False
+        if self.rotate_bytes and self._offset >= self.rotate_bytes:
+            return True
+        return bool(self.rotate_interval) and time.time() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        self._close_files()
+        stamp = datetime.now(timezone.utc).strftime(SEGMENT_STAMP)
+        segment = self.path.with_name(f"{self.path.stem}-{stamp}{self.path.suffix}")
+        os.replace(self.path, segment)
+        os.replace(index_path(self.path), index_path(segment))
+        compressed = segment.with_name(f"{segment.name}.gz")
+        partial = compressed.with_name(f"{compressed.name}.tmp")
+        with segment.open("rb") as src, gzip.open(partial, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(partial, compressed)
+        segment.unlink()
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AuditRecorder is closed")
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._writer.start()
+
+    def _run(self) -> None:
+        batch: list[_Record] = []
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stopping = True
+            elif item is not None:
+                batch.append(item)
+            if batch and (stopping or item is None or len(batch) >= self.batch_size or self._queue.empty()):
+                try:
+                    self._write(batch)
+                except Exception:  # noqa: BLE001
+                    self._drop(len(batch), "write")
+                for _ in batch:
+                    self._queue.task_done()
+                batch = []
+            if item is _STOP:
+                self._queue.task_done()
+            if item is None or time.monotonic() >= deadline:
+                try:
+                    self._sync()
+                except OSError:
+                    logger.exception("Audit log flush failed")
+                deadline = time.monotonic() + self.flush_interval
+
+    def _drop(self, count: int, stage: str) -> None:
+        # The writer thread must survive a bad entry or a failing disk, or
+        # record() would block forever once the queue fills.
+        with self._lock:
+            self.dropped += count
+        logger.exception("Dropped %d audit entr%s: %s failed", count, "y" if count == 1 else "ies", stage)
+
+    def _serialize(self, entry: dict) -> "_Record":
+        blobs = []
+        for field in _AUDITED_FIELDS:
+            value = entry[field]
+            if self.redact_keys:
+                value = redact(value, self.redact_keys)
+            body = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+            digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+            entry[f"{field}_sha256"] = digest
+            if self.max_field_bytes and len(body) > self.max_field_bytes:
+                if self.blob_dir is not None:
+                    blobs.append((digest, body))
+                    value = {"$blob": digest, "bytes": len(body)}
+                else:
+                    value = {"$truncated": body[:self.max_field_bytes], "bytes": len(body)}
+            entry[field] = value
+        index = {key: entry[key] for key in ("request_id", "tool", "timestamp")}
+        return index, json.dumps(entry, default=str) + "\n", blobs
+
+    def _store_blob(self, digest: str, body: str) -> None:
+        path = blob_path(self.blob_dir, digest)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with gzip.open(partial, "wt", encoding="utf-8") as fh:
+            fh.write(body)
+        os.replace(partial, path)
+
+    def _write(self, records: list["_Record"]) -> None:
+        for _, _, blobs in records:
+            for digest, body in blobs:
+                self._store_blob(digest, body)
+        with self._lock:
+            fh = self._open()
+            if self._should_rotate():
+                self._rotate()
+                fh = self._open()
+            for index, line, _ in records:
+                data = line.encode("utf-8")
+                self._index.write(json.dumps({**index, "offset": self._offset}) + "\n")
+                fh.write(data)
+                self._offset += len(data)
+            if self.durability == AuditDurability.fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
+
+    def _sync(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                # Data before index, so an indexed offset is always readable.
+                self._fh.flush()
+                self._index.flush()
@@ -0,0 +1,121 @@
+"""Indexed lookups over the rotated audit log.
+
+Only the ``.idx`` sidecars are scanned; a segment is opened, and for rotated
+segments decompressed, only when its index has a matching entry.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Iterator, Sequence
+
+from .audit import SEGMENT_STAMP, index_path, rotated_segments
+
+
+def parse_time(value: str | datetime | None) -> datetime | None:
+    """Audit timestamp or ``--since``/``--until`` value as an aware datetime; naive means UTC."""
+    if value is None:
+        return None
+    moment = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _rotated_at(segment: Path, stem: str) -> datetime | None:
+    stamp = segment.name[len(stem) + 1:].split(".", 1)[0]
+    try:
+        return datetime.strptime(stamp, SEGMENT_STAMP).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def query_audit(
+    path: Path,
+    *,
+    request_id: str | None = None,
+    tool: str | None = None,
+    since: str | datetime | None = None,
+    until: str | datetime | None = None,
+    limit: int | None = None,
+) -> Iterator[dict]:
+    """Yield audit entries matching every given filter, oldest first."""
+    since, until = parse_time(since), parse_time(until)
+    segments = rotated_segments(path) + [path]
+    returned = 0
+    for segment in segments:
+        if since is not None and segment != path:
+            # A segment only holds entries written before it was rotated.
+            rotated_at = _rotated_at(segment, path.stem)
+            if rotated_at is not None and rotated_at < since:
+                continue
+        offsets = []
+        sidecar = index_path(segment)
+        if not sidecar.exists():
+            continue
+        with sidecar.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if request_id is not None and record["request_id"] != request_id:
+                    continue
+                if tool is not None and record["tool"] != tool:
+                    continue
+                if since is not None or until is not None:
+                    moment = parse_time(record["timestamp"])
+                    if (since is not None and moment < since) or (until is not None and moment > until):
+                        continue
+                offsets.append(record["offset"])
+        if not offsets or not segment.exists():
+            continue
+        opener = gzip.open if segment.suffix == ".gz" else open
+        with opener(segment, "rb") as data:
+            for entry in _read_at(data, sorted(offsets)):
+                yield entry
+                returned += 1
+                if limit is not None and returned >= limit:
+                    return
+
+
+def _read_at(data: IO[bytes], offsets: Sequence[int]) -> Iterator[dict]:
+    for offset in offsets:
+        data.seek(offset)
+        try:
+            yield json.loads(data.readline())
+        except json.JSONDecodeError:
+            # The writer has indexed the entry but not flushed it yet.
+            continue
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """``revit-mcp-server audit query`` command line."""
+    parser = argparse.ArgumentParser(prog="revit-mcp-server audit", description="Inspect the audit log")
+    commands = parser.add_subparsers(dest="command", required=True)
+    query = commands.add_parser("query", help="Print matching audit entries as JSON lines")
+    query.add_argument("--log", type=Path, help="Audit log path (defaults to MCP_REVIT_AUDIT_LOG)")
+    query.add_argument("--request-id")
+    query.add_argument("--tool", help="Bridge tool name, e.g. revit.create_wall")
+    query.add_argument("--since", help="ISO 8601 time; naive values are UTC")
+    query.add_argument("--until", help="ISO 8601 time; naive values are UTC")
+    query.add_argument("--limit", type=int)
+    args = parser.parse_args(argv)
+
+    log = args.log
+    if log is None:
+        from ..config import get_config
+
+        log = get_config().audit_log
+    for entry in query_audit(
+        log,
+        request_id=args.request_id,
+        tool=args.tool,
+        since=args.since,
+        until=args.until,
+        limit=args.limit,
+    ):
+        sys.stdout.write(json.dumps(entry) + "\n")
+    return 0
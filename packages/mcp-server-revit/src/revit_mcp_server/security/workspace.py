@@ -1,17 +1,81 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Sequence
 
 from ..errors import WorkspaceViolation
 
+_ROOT = object()
+
 
 class WorkspaceMonitor:
-    def __init__(self, allowed_directories: Sequence[Path]):
+    """Checks that tool paths stay inside the allowed directories.
+
+    Allowed roots are indexed in a trie of path components, so a check costs
+    one walk over the candidate's parts instead of a comparison per root.
+    Resolved candidates and their verdicts are kept in an LRU cache for
+    ``ttl`` seconds; the TTL bounds how long a symlink retargeted after a
+    check can go unnoticed.
+    """
+
+    def __init__(
+        self,
+        allowed_directories: Sequence[Path],
+        *,
+        cache_size: int = 1024,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.allowed_directories = [directory.resolve() for directory in allowed_directories]
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self._clock = clock
+        self._cache: OrderedDict[tuple[str, Path], tuple[float, Path, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._trie: dict = {}
+        for directory in self.allowed_directories:
+            node = self._trie
+            for part in directory.parts:
+                node = node.setdefault(part, {})
+            node[_ROOT] = True
 
     def assert_in_workspace(self, candidate: Path) -> Path:
-        candidate = candidate.resolve()
-        if not any(candidate.is_relative_to(directory) for directory in self.allowed_directories):
-            raise WorkspaceViolation(f"{candidate} is outside the allowed workspace directories")
-        return candidate
+        resolved, allowed = self._check(candidate)
+        if not allowed:
+            raise WorkspaceViolation(f"{resolved} is outside the allowed workspace directories")
+        return resolved
+
+    def _check(self, candidate: Path) -> tuple[Path, bool]:
+        # Relative paths resolve against the working directory, so it is part of the key.
+        key = ("" if candidate.is_absolute() else os.getcwd(), candidate)
+        now = self._clock()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > now:
+                self._cache.move_to_end(key)
+                return cached[1], cached[2]
+        resolved = candidate.resolve()
+        allowed = self._is_allowed(resolved)
+        if self.cache_size:
+            with self._lock:
+                self._cache[key] = (now + self.ttl, resolved, allowed)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return resolved, allowed
+
+    def _is_allowed(self, resolved: Path) -> bool:
+        node = self._trie
+        if _ROOT in node:
+            return True
+        for part in resolved.parts:
+            node = node.get(part)
+            if node is None:
+                return False
+            if _ROOT in node:
+                return True
+        return False
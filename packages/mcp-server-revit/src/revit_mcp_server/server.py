@@ -2,17 +2,25 @@ from __future__ import annotations
 
 import io
 import json
+import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Protocol
 
 from .bridge import BridgeClient, MockBridge
-from .config import BridgeMode, Config, config
+from .config import BridgeMode, Config, get_config
+from .metrics import METRICS
 from .security.audit import AuditRecorder
 from .security.workspace import WorkspaceMonitor
-from .tools import TOOL_HANDLERS
+from .tools import TOOL_HANDLERS, TOOL_VALIDATORS
+from .tracing import TRACER
+
+logger = logging.getLogger(__name__)
 
 
 class BridgeTransport(Protocol):
+    # Called from several worker threads at once when ``run`` has more than one worker
     def send_tool(self, tool_name: str, payload: dict) -> dict:
         ...
 
@@ -31,9 +39,11 @@ class MCPServer:
         if kwargs:
             unexpected = ", ".join(kwargs)
             raise TypeError(f"Unexpected keyword argument(s): {unexpected}")
-        self.config = config_obj if config_obj is not None else config
+        self.config = config_obj if config_obj is not None else get_config()
         self.workspace = WorkspaceMonitor(self.config.allowed_directories)
-        self.audit = AuditRecorder(self.config.audit_log)
+        self.audit = AuditRecorder.from_config(self.config)
+        if self.config.trace_file is not None:
+            TRACER.configure(self.config.trace_file, self.config.trace_sample_rate)
         self.handlers: Dict[str, Callable[[dict, WorkspaceMonitor], dict]] = TOOL_HANDLERS
         self.bridge = self._build_bridge(bridge_factory)
 
@@ -44,26 +54,61 @@ class MCPServer:
         if self.config.mode == BridgeMode.bridge:
             if not self.config.bridge_url:
                 raise ValueError("Bridge mode requires MCP_REVIT_BRIDGE_URL")
-            bridge_factory = factory or (lambda url: BridgeClient(url))
+            bridge_factory = factory or (lambda url: BridgeClient.from_config(self.config, url))
             bridge = bridge_factory(self.config.bridge_url)
             # Initialize bridge connection and fetch tool catalog
             if hasattr(bridge, 'initialize'):
                 bridge.initialize()
             return bridge
+        if self.config.mock_model_elements:
+            from .bridge.model import SimulatedModel
+
+            return MockBridge(SimulatedModel.generate(
+                self.config.mock_model_elements, seed=self.config.mock_model_seed
+            ))
         return MockBridge()
 
+    def close(self) -> None:
+        close = getattr(self.bridge, "close", None)
+        if close is not None:
+            close()
+        self.audit.close()
+        if self.config.metrics_file is not None:
+            METRICS.dump(self.config.metrics_file)
+        if self.config.trace_file is not None:
+            TRACER.close()
+
+    def __enter__(self) -> "MCPServer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def handle_tool(self, tool_name: str, payload: dict) -> dict:
         handler = self.handlers.get(tool_name)
-        if handler is None:
+        # Mock mode with a simulated model answers the tools it implements
+        simulated = isinstance(self.bridge, MockBridge) and self.bridge.supports(tool_name)
+        if handler is None and not simulated:
             raise ValueError(f"Unknown tool {tool_name}")
+        forward = simulated or self.config.mode == BridgeMode.bridge
 
-        if self.config.mode == BridgeMode.bridge:
-            handler(payload, self.workspace)
-            response = self.bridge.send_tool(tool_name, payload)
-        else:
-            response = handler(payload, self.workspace)
+        with TRACER.span("server.handle_tool", tool=tool_name, mode=self.config.mode.value), \
+                METRICS.timed("server", tool_name) as tool_metrics:
+            failed = True
+            try:
+                if forward:
+                    validate = TOOL_VALIDATORS.get(tool_name, handler)
+                    if validate is not None:
+                        with TRACER.span("server.validate"):
+                            validate(payload, self.workspace)
+                    response = self.bridge.send_tool(tool_name, payload)
+                else:
+                    response = handler(payload, self.workspace)
+                failed = False
+            finally:
+                tool_metrics.record(error=failed)
 
-        self.audit.record(tool_name, payload.get("request_id", ""), payload, response)
+            self.audit.record(tool_name, payload.get("request_id", ""), payload, response)
         return response
 
     def run(
@@ -71,27 +116,123 @@ class MCPServer:
         *,
         stdin: io.TextIOBase | None = None,
         stdout: io.TextIOBase | None = None,
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+        ordered: bool | None = None,
     ) -> None:
+        """Serve JSON-lines requests from ``stdin`` until EOF.
+
+        With one worker (the default) each request is handled before the
+        next line is read. With more, up to ``workers`` requests run at once
+        and at most ``max_in_flight`` are read but not yet answered; reading
+        pauses at that limit. Responses are written as they complete, tagged
+        with the request's ``request_id``, unless ``ordered`` holds them back
+        to input order. At EOF every request already read is answered before
+        ``run`` returns.
+        """
         stdin = stdin or sys.stdin
         stdout = stdout or sys.stdout
+        workers = workers or self.config.server_workers
+        max_in_flight = max_in_flight or self.config.server_max_in_flight
+        ordered = self.config.server_ordered_responses if ordered is None else ordered
         stdout.write("Revit MCP server started. Awaiting JSON requests.\n")
         stdout.flush()
 
-        while line := stdin.readline():
-            line = line.strip()
-            if not line:
-                continue
+        if workers == 1:
+            while line := stdin.readline():
+                line = line.strip()
+                if line:
+                    stdout.write(self._respond(line) + "\n")
+                    stdout.flush()
+            return
+
+        slots = threading.Semaphore(max_in_flight)
+        write_lock = threading.Lock()
+        # Ordered mode: responses that finished ahead of an earlier request
+        held: dict[int, str] = {}
+        next_to_write = 0
+
+        def complete(sequence: int, line: str) -> None:
+            nonlocal next_to_write
+            text = None
             try:
-                request = json.loads(line)
-                tool = request.get("tool")
-                payload = request.get("payload", {})
-                response = self.handle_tool(tool, payload)
+                text = self._respond(line)
             except Exception as exc:  # noqa: BLE001
-                response = {"status": "error", "message": str(exc)}
-            stdout.write(json.dumps({"tool": tool, "response": response}) + "\n")
-            stdout.flush()
+                logger.exception("Request failed without a response")
+                text = self._failure_line(line, exc)
+            finally:
+                # Every request gives up its slot and, in ordered mode, its
+                # place in line, even if it ends with no response to write.
+                with write_lock:
+                    if not ordered:
+                        ready = [text]
+                    else:
+                        held[sequence] = text
+                        ready = []
+                        while next_to_write in held:
+                            ready.append(held.pop(next_to_write))
+                            next_to_write += 1
+                    try:
+                        for item in ready:
+                            if item is not None:
+                                stdout.write(item + "\n")
+                        stdout.flush()
+                    finally:
+                        for _ in ready:
+                            slots.release()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-worker") as pool:
+            sequence = 0
+            while line := stdin.readline():
+                line = line.strip()
+                if not line:
+                    continue
+                slots.acquire()
+                pool.submit(complete, sequence, line)
+                sequence += 1
+        # Leaving the executor waited for every submitted request: drained
+
+    def _respond(self, line: str) -> str:
+        """Handle one request line and return its JSON response line."""
+        tool = request_id = None
+        try:
+            tool, payload, request_id = self._parse_request(line)
+            response = self.handle_tool(tool, payload)
+        except Exception as exc:  # noqa: BLE001
+            response = {"status": "error", "message": str(exc)}
+        try:
+            return self._response_line(tool, request_id, response)
+        except (TypeError, ValueError) as exc:
+            logger.exception("Response to %s could not be serialized", tool)
+            return self._response_line(tool, request_id, {
+                "status": "error", "message": f"Response could not be serialized: {exc}",
+            })
+
+    @staticmethod
+    def _response_line(tool: str | None, request_id: str | None, response: dict) -> str:
+        message = {"tool": tool, "response": response}
+        if request_id is not None:
+            message["request_id"] = request_id
+        return json.dumps(message)
+
+    @staticmethod
+    def _parse_request(line: str) -> tuple[str | None, dict, str | None]:
+        request = json.loads(line)
+        payload = request.get("payload", {})
+        request_id = request.get("request_id")
+        if request_id is None and isinstance(payload, dict):
+            request_id = payload.get("request_id")
+        return request.get("tool"), payload, request_id
+
+    def _failure_line(self, line: str, exc: Exception) -> str:
+        """Error response for a request that failed outside ``_respond``'s own handling."""
+        try:
+            tool, _, request_id = self._parse_request(line)
+        except (ValueError, AttributeError):
+            tool = request_id = None
+        return self._response_line(tool, request_id, {"status": "error", "message": str(exc)})
 
 
 def run_server() -> None:
-    server = MCPServer()
-    server.run()
+    with MCPServer() as server:
+        server.run()
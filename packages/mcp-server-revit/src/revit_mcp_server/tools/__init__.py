@@ -1,3 +1,13 @@
-from .handlers import TOOL_HANDLERS
+from .registry import TOOL_REGISTRY, ToolSpec
 
-__all__ = ["TOOL_HANDLERS"]
+__all__ = ["TOOL_HANDLERS", "TOOL_REGISTRY", "TOOL_VALIDATORS", "ToolSpec"]
+
+
+def __getattr__(name: str):
+    # The mock handlers and their pydantic schemas are only needed by the
+    # stdio server, not to list or dispatch bridge tools.
+    if name in ("TOOL_HANDLERS", "TOOL_VALIDATORS"):
+        from . import handlers
+
+        return getattr(handlers, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict
+from typing import Callable, Dict, Tuple, Type
 
+from ..bridge.batch import BATCH_TOOL, run_batch
+from ..errors import SchemaValidationError
 from ..schemas import (
     BaselineDiffInput,
     BaselineDiffOutput,
     BaselineExportInput,
     BaselineExportOutput,
+    BatchExecuteInput,
+    BatchExecuteOutput,
     ExportQuantitiesInput,
     ExportQuantitiesOutput,
     ExportResult,
@@ -32,16 +36,32 @@ from ..security.workspace import WorkspaceMonitor
 ToolHandler = Callable[[dict, WorkspaceMonitor], dict]
 
 
+def _accepts(input_type: Type[RequestPayload], *path_fields: str) -> Callable[[ToolHandler], ToolHandler]:
+    """Declare a handler's input schema and the payload fields that must stay in the workspace.
+
+    ``validate_batch`` uses them to check batch operations without running
+    their handlers.
+    """
+    def register(handler: ToolHandler) -> ToolHandler:
+        handler.input_type = input_type  # type: ignore[attr-defined]
+        handler.path_fields = path_fields  # type: ignore[attr-defined]
+        return handler
+
+    return register
+
+
 def _record_request(payload: RequestPayload) -> None:
     payload.request_id  # type: ignore
 
 
+@_accepts(HealthInput)
 def revit_health(payload: dict, _: WorkspaceMonitor) -> dict:
     input_model = HealthInput(**payload)
     _record_request(input_model)
     return HealthOutput(status=HealthStatus.healthy, requests_handled=1, message="Bridge ready").model_dump()
 
 
+@_accepts(OpenDocumentInput, "file_path")
 def open_document(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = OpenDocumentInput(**payload)
     resolved = workspace.assert_in_workspace(Path(input_model.file_path))
@@ -52,6 +72,7 @@ def open_document(payload: dict, workspace: WorkspaceMonitor) -> dict:
     ).model_dump()
 
 
+@_accepts(ListViewsInput)
 def list_views(payload: dict, _: WorkspaceMonitor) -> dict:
     _record_request(ListViewsInput(**payload))
     views = [
@@ -61,38 +82,42 @@ def list_views(payload: dict, _: WorkspaceMonitor) -> dict:
     return ListViewsOutput(views=views).model_dump()
 
 
+@_accepts(ExportSchedulesInput, "output_path")
 def export_schedules(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = ExportSchedulesInput(**payload)
-    output_marker = WorkspaceMonitor(workspace.allowed_directories).assert_in_workspace(
-        Path(input_model.output_path)
-    )
+    output_marker = workspace.assert_in_workspace(Path(input_model.output_path))
     data = ["Schedule A", "Schedule B"]
     return ExportSchedulesOutput(schedules=data, output_path=str(output_marker)).model_dump()
 
 
+@_accepts(ExportQuantitiesInput, "output_path")
 def export_quantities(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = ExportQuantitiesInput(**payload)
     output_marker = workspace.assert_in_workspace(Path(input_model.output_path))
     return ExportQuantitiesOutput(categories_exported=5, output_path=str(output_marker)).model_dump()
 
 
+@_accepts(BaselineExportInput, "output_path")
 def baseline_export(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = BaselineExportInput(**payload)
     path = workspace.assert_in_workspace(Path(input_model.output_path))
     return BaselineExportOutput(snapshot_id=f"baseline-{datetime.utcnow().isoformat()}", output_path=str(path)).model_dump()
 
 
+@_accepts(BaselineDiffInput)
 def baseline_diff(payload: dict, _: WorkspaceMonitor) -> dict:
     input_model = BaselineDiffInput(**payload)
     return BaselineDiffOutput(differences=[f"diff between {input_model.baseline_a} and {input_model.baseline_b}"]).model_dump()
 
 
+@_accepts(SheetBatchInput, "csv_path")
 def sheet_batch_from_csv(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = SheetBatchInput(**payload)
     workspace.assert_in_workspace(Path(input_model.csv_path))
     return SheetBatchOutput(sheets_created=3).model_dump()
 
 
+@_accepts(SheetBatchInput, "csv_path")
 def export_pdf_by_sheet(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = SheetBatchInput(**payload)
     workspace.assert_in_workspace(Path(input_model.csv_path))
@@ -102,6 +127,7 @@ def export_pdf_by_sheet(payload: dict, workspace: WorkspaceMonitor) -> dict:
     ).model_dump()
 
 
+@_accepts(SheetBatchInput, "csv_path")
 def export_dwg_by_sheet(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = SheetBatchInput(**payload)
     workspace.assert_in_workspace(Path(input_model.csv_path))
@@ -111,6 +137,7 @@ def export_dwg_by_sheet(payload: dict, workspace: WorkspaceMonitor) -> dict:
     ).model_dump()
 
 
+@_accepts(SheetBatchInput, "csv_path")
 def export_ifc_named_setup(payload: dict, workspace: WorkspaceMonitor) -> dict:
     input_model = SheetBatchInput(**payload)
     workspace.assert_in_workspace(Path(input_model.csv_path))
@@ -120,11 +147,45 @@ def export_ifc_named_setup(payload: dict, workspace: WorkspaceMonitor) -> dict:
     ).model_dump()
 
 
+@_accepts(GenericAuditInput)
 def generic_audit(payload: dict, _: WorkspaceMonitor) -> dict:
     input_model = GenericAuditInput(**payload)
     return GenericAuditOutput(issues_found=0).model_dump()
 
 
+def batch_execute(payload: dict, workspace: WorkspaceMonitor) -> dict:
+    input_model = BatchExecuteInput(**payload)
+
+    def execute(tool: str, op_payload: dict) -> dict:
+        handler = TOOL_HANDLERS.get(tool)
+        if handler is None:
+            raise ValueError(f"Unknown tool {tool}")
+        op_payload.setdefault("request_id", input_model.request_id)
+        return handler(op_payload, workspace)
+
+    result = run_batch(input_model.model_dump(), execute)
+    return BatchExecuteOutput(**result).model_dump()
+
+
+def validate_batch(payload: dict, workspace: WorkspaceMonitor) -> None:
+    """Check a batch and each operation's payload as forward mode would, without running them."""
+    input_model = BatchExecuteInput(**payload)
+    for index, operation in enumerate(input_model.operations):
+        if operation.tool == BATCH_TOOL:
+            raise SchemaValidationError("Nested batches are not supported")
+        schema = TOOL_INPUTS.get(operation.tool)
+        if schema is None:
+            # Bridge-only tool: the bridge validates its payload
+            continue
+        input_type, path_fields = schema
+        try:
+            operation_input = input_type(**{"request_id": input_model.request_id, **operation.payload})
+            for field in path_fields:
+                workspace.assert_in_workspace(Path(getattr(operation_input, field)))
+        except Exception as exc:  # noqa: BLE001
+            raise SchemaValidationError(f"Batch operation {index} ({operation.tool}): {exc}") from exc
+
+
 TOOL_HANDLERS: Dict[str, ToolHandler] = {
     "revit.health": revit_health,
     "revit.open_document": open_document,
@@ -152,4 +213,19 @@ TOOL_HANDLERS: Dict[str, ToolHandler] = {
     "revit.export_ifc_named_setup": export_ifc_named_setup,
     "revit.publish_package_builder": generic_audit,
     "revit.export_report": generic_audit,
+    "revit.batch_execute": batch_execute,
+}
+
+# Input schema and workspace-bound path fields of each handler's payload,
+# taken from its @_accepts declaration
+TOOL_INPUTS: Dict[str, Tuple[Type[RequestPayload], Tuple[str, ...]]] = {
+    tool: (handler.input_type, handler.path_fields)  # type: ignore[attr-defined]
+    for tool, handler in TOOL_HANDLERS.items()
+    if tool != BATCH_TOOL
+}
+
+# Forward mode checks payloads with these instead of the handler itself,
+# where running the handler would execute the request in mock mode
+TOOL_VALIDATORS: Dict[str, Callable[[dict, WorkspaceMonitor], None]] = {
+    BATCH_TOOL: validate_batch,
 }
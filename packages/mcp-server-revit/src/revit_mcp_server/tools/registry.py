@@ -0,0 +1,1158 @@
+"""Declarative table of the MCP-facing Revit tools.
+
+Each ``ToolSpec`` pairs an MCP tool name with the bridge command it maps to,
+the description and JSON schema advertised by ``tools/list``, and a payload
+builder. This is the single source of truth for both ``list_tools`` and
+``call_tool`` in ``mcp_server.py``. The table is built once at import time so
+dispatching a call is a single dictionary lookup that only evaluates the
+payload for the requested tool.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from ..bridge.batch import batch_payload
+from ..bridge.paging import decode_cursor, encode_cursor
+from ..errors import SchemaValidationError
+
+PayloadBuilder = Callable[[Dict[str, Any]], Dict[str, Any]]
+ResultTransform = Callable[[Dict[str, Any], Any], Any]
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    name: str
+    # ``None`` marks a tool served by the MCP server itself, not the bridge.
+    bridge_tool: Optional[str]
+    description: str
+    input_schema: Mapping[str, Any]
+    build_payload: PayloadBuilder
+    transform_result: Optional[ResultTransform] = None
+
+
+def _batch_payload(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate MCP-level batch operations into bridge ``{tool, payload}`` pairs."""
+    operations = []
+    for index, operation in enumerate(arguments.get("operations", [])):
+        spec = TOOL_REGISTRY.get(operation.get("tool"))
+        if spec is None or spec.bridge_tool is None or spec.build_payload is _batch_payload:
+            raise SchemaValidationError(
+                f"Batch operation {index}: unknown or unsupported tool '{operation.get('tool')}'"
+            )
+        operations.append({
+            "tool": spec.bridge_tool,
+            "payload": spec.build_payload(operation.get("arguments") or {}),
+        })
+    return batch_payload(
+        operations,
+        transaction=arguments.get("transaction", False),
+        stop_on_error=arguments.get("stop_on_error"),
+    )
+
+
+def _elements_page_payload(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    cursor = arguments.get("cursor")
+    if cursor:
+        filters, offset, limit = decode_cursor(cursor)
+    else:
+        filters, offset, limit = arguments, arguments.get("offset", 0), arguments.get("limit", 200)
+    return {
+        "type_id":  filters.get("type_id"),
+        "category": filters.get("category"),
+        "level":    filters.get("level"),
+        "fields":   filters.get("fields"),
+        "offset":   offset,
+        "limit":    limit
+    }
+
+
+def _elements_page_result(arguments: Dict[str, Any], result: Any) -> Any:
+    """Attach ``next_cursor`` so clients can resume instead of tracking offsets."""
+    if not isinstance(result, dict) or not result.get("truncated"):
+        return result
+    payload = _elements_page_payload(arguments)
+    offset = payload["offset"] + result.get("returned", len(result.get("elements") or ()))
+    return {**result, "next_cursor": encode_cursor(payload, offset, payload["limit"])}
+
+
+_SPECS = (
+    ToolSpec(
+        name="revit_health",
+        bridge_tool="revit.health",
+        description="Check if Revit is running and get status information",
+        input_schema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_create_wall",
+        bridge_tool="revit.create_wall",
+        description="Create a wall in Revit between two points",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "start_x": {"type": "number", "description": "Start point X coordinate in feet"},
+                "start_y": {"type": "number", "description": "Start point Y coordinate in feet"},
+                "start_z": {"type": "number", "description": "Start point Z coordinate in feet", "default": 0},
+                "end_x": {"type": "number", "description": "End point X coordinate in feet"},
+                "end_y": {"type": "number", "description": "End point Y coordinate in feet"},
+                "end_z": {"type": "number", "description": "End point Z coordinate in feet", "default": 0},
+                "height": {"type": "number", "description": "Wall height in feet", "default": 10},
+                "level": {"type": "string", "description": "Level name (e.g., 'L1', 'L2')", "default": "L1"}
+            },
+            "required": ["start_x", "start_y", "end_x", "end_y"]
+        },
+        build_payload=lambda arguments: {
+            "start_point": {
+                "x": arguments.get("start_x", 0),
+                "y": arguments.get("start_y", 0),
+                "z": arguments.get("start_z", 0)
+            },
+            "end_point": {
+                "x": arguments.get("end_x", 0),
+                "y": arguments.get("end_y", 0),
+                "z": arguments.get("end_z", 0)
+            },
+            "height": arguments.get("height", 10),
+            "level": arguments.get("level", "L1")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_floor",
+        bridge_tool="revit.create_floor",
+        description="Create a floor in Revit with a rectangular or custom boundary",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "points": {
+                    "type": "array",
+                    "description": "Array of boundary points [{x, y, z}]. Minimum 3 points for a closed boundary.",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "x": {"type": "number"},
+                            "y": {"type": "number"},
+                            "z": {"type": "number", "default": 0}
+                        },
+                        "required": ["x", "y"]
+                    }
+                },
+                "level": {"type": "string", "description": "Level name", "default": "L1"}
+            },
+            "required": ["points"]
+        },
+        build_payload=lambda arguments: {
+            "boundary_points": [
+                {"x": p.get("x", 0), "y": p.get("y", 0), "z": p.get("z", 0)}
+                for p in arguments.get("points", [])
+            ],
+            "level": arguments.get("level", "L1")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_roof",
+        bridge_tool="revit.create_roof",
+        description="Create a roof in Revit",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "points": {
+                    "type": "array",
+                    "description": "Array of boundary points for the roof",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "x": {"type": "number"},
+                            "y": {"type": "number"},
+                            "z": {"type": "number"}
+                        }
+                    }
+                },
+                "level": {"type": "string", "description": "Level name"},
+                "slope": {"type": "number", "description": "Roof slope", "default": 0.5}
+            },
+            "required": ["points", "level"]
+        },
+        build_payload=lambda arguments: {
+            "boundary_points": [
+                {"x": p.get("x", 0), "y": p.get("y", 0), "z": p.get("z", 0)}
+                for p in arguments.get("points", [])
+            ],
+            "level": arguments.get("level", "Level 2"),
+            "slope": arguments.get("slope", 0.5)
+        },
+    ),
+    ToolSpec(
+        name="revit_list_levels",
+        bridge_tool="revit.list_levels",
+        description="List all levels in the Revit project",
+        input_schema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_list_views",
+        bridge_tool="revit.list_views",
+        description="List all views in the Revit project",
+        input_schema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_list_elements",
+        bridge_tool="revit.list_elements_by_category",
+        description="List elements by category (Walls, Floors, Roofs, Doors, Windows, etc.)",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "category": {"type": "string", "description": "Category name (e.g., 'Walls', 'Floors', 'Doors')"}
+            },
+            "required": ["category"]
+        },
+        build_payload=lambda arguments: {
+            "category": arguments.get("category", "Walls")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_document_info",
+        bridge_tool="revit.get_document_info",
+        description="Get information about the active Revit document",
+        input_schema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_create_level",
+        bridge_tool="revit.create_level",
+        description="Create a new level in Revit",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Level name"},
+                "elevation": {"type": "number", "description": "Elevation in feet"}
+            },
+            "required": ["name", "elevation"]
+        },
+        build_payload=lambda arguments: {
+            "name": arguments.get("name", "New Level"),
+            "elevation": arguments.get("elevation", 10)
+        },
+    ),
+    ToolSpec(
+        name="revit_save_document",
+        bridge_tool="revit.save_document",
+        description="Save the current Revit document",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "File path to save to (optional for existing files)"}
+            }
+        },
+        build_payload=lambda arguments: {
+            "path": arguments.get("path", "")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_grid",
+        bridge_tool="revit.create_grid",
+        description="Create a grid line in Revit",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number", "default": 0},
+                "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number", "default": 0},
+                "name": {"type": "string"}
+            },
+            "required": ["start_x", "start_y", "end_x", "end_y"]
+        },
+        build_payload=lambda arguments: {
+            "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z")},
+            "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z")},
+            "name": arguments.get("name")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_room",
+        bridge_tool="revit.create_room",
+        description="Create a room at a specific point on a level",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "level": {"type": "string"},
+                "x": {"type": "number"}, "y": {"type": "number"},
+                "name": {"type": "string", "default": "Room"},
+                "number": {"type": "string"}
+            },
+            "required": ["level", "x", "y"]
+        },
+        build_payload=lambda arguments: {
+            "level": arguments.get("level"),
+            "location_point": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0},
+            "name": arguments.get("name"),
+            "number": arguments.get("number")
+        },
+    ),
+    ToolSpec(
+        name="revit_delete_element",
+        bridge_tool="revit.delete_element",
+        description="Delete an element by ID",
+        input_schema={
+            "type": "object",
+            "properties": {"element_id": {"type": "integer"}},
+            "required": ["element_id"]
+        },
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_place_family_instance",
+        bridge_tool="revit.place_family_instance",
+        description="Place a family instance (e.g., furniture, equipment)",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "family_name": {"type": "string"}, "type_name": {"type": "string"},
+                "level": {"type": "string"},
+                "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}
+            },
+            "required": ["family_name", "type_name", "level", "x", "y"]
+        },
+        build_payload=lambda arguments: {
+            "family_name": arguments.get("family_name"),
+            "type_name": arguments.get("type_name"),
+            "level": arguments.get("level"),
+            "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z")}
+        },
+    ),
+    ToolSpec(
+        name="revit_place_door",
+        bridge_tool="revit.place_door",
+        description="Place a door in a wall",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "wall_id": {"type": "integer"},
+                "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0},
+                "family_name": {"type": "string"}, "type_name": {"type": "string"}
+            },
+            "required": ["wall_id", "x", "y"]
+        },
+        build_payload=lambda arguments: {
+            "wall_id": arguments.get("wall_id"),
+            "family_name": arguments.get("family_name"),
+            "type_name": arguments.get("type_name"),
+            "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z")}
+        },
+    ),
+    ToolSpec(
+        name="revit_place_window",
+        bridge_tool="revit.place_window",
+        description="Place a window in a wall",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "wall_id": {"type": "integer"},
+                "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0},
+                "family_name": {"type": "string"}, "type_name": {"type": "string"}
+            },
+            "required": ["wall_id", "x", "y"]
+        },
+        build_payload=lambda arguments: {
+            "wall_id": arguments.get("wall_id"),
+            "family_name": arguments.get("family_name"),
+            "type_name": arguments.get("type_name"),
+            "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z")}
+        },
+    ),
+    ToolSpec(
+        name="revit_list_families",
+        bridge_tool="revit.list_families",
+        description="List all loaded families and their types",
+        input_schema={"type": "object", "properties": {}},
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_create_floor_plan_view",
+        bridge_tool="revit.create_floor_plan_view",
+        description="Create a floor plan view for a level",
+        input_schema={
+            "type": "object",
+            "properties": {"level_name": {"type": "string"}, "view_name": {"type": "string"}},
+            "required": ["level_name"]
+        },
+        build_payload=lambda arguments: {
+            "level_name": arguments.get("level_name"),
+            "view_name": arguments.get("view_name")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_3d_view",
+        bridge_tool="revit.create_3d_view",
+        description="Create a new 3D view",
+        input_schema={
+            "type": "object",
+            "properties": {"view_name": {"type": "string"}},
+            "required": ["view_name"]
+        },
+        build_payload=lambda arguments: {
+            "view_name": arguments.get("view_name")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_section_view",
+        bridge_tool="revit.create_section_view",
+        description="Create a section view",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "view_name": {"type": "string"},
+                "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number"},
+                "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number"},
+                "height": {"type": "number", "default": 10}
+            },
+            "required": ["start_x", "start_y", "end_x", "end_y"]
+        },
+        build_payload=lambda arguments: {
+            "view_name": arguments.get("view_name"),
+            "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z")},
+            "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z")},
+            "height": arguments.get("height")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_element_parameters",
+        bridge_tool="revit.get_element_parameters",
+        description="Get all parameters of an element",
+        input_schema={
+            "type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]
+        },
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_set_parameter_value",
+        bridge_tool="revit.set_parameter_value",
+        description="Set a parameter value for an element",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "element_id": {"type": "integer"},
+                "parameter_name": {"type": "string"},
+                "value": {"type": ["string", "number", "boolean"]}
+            },
+            "required": ["element_id", "parameter_name", "value"]
+        },
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id"),
+            "parameter_name": arguments.get("parameter_name"),
+            "value": arguments.get("value")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_parameter_value",
+        bridge_tool="revit.get_parameter_value",
+        description="Get a specific parameter value",
+        input_schema={
+            "type": "object",
+            "properties": {"element_id": {"type": "integer"}, "parameter_name": {"type": "string"}},
+            "required": ["element_id", "parameter_name"]
+        },
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id"),
+            "parameter_name": arguments.get("parameter_name")
+        },
+    ),
+    ToolSpec(
+        name="revit_list_shared_parameters",
+        bridge_tool="revit.list_shared_parameters",
+        description="List shared parameters in the document",
+        input_schema={"type": "object", "properties": {}},
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_create_shared_parameter",
+        bridge_tool="revit.create_shared_parameter",
+        description="Create a new shared parameter",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"}, "group": {"type": "string"},
+                "type": {"type": "string"}, "visible": {"type": "boolean"}
+            },
+            "required": ["name"]
+        },
+        build_payload=lambda arguments: {
+            "name": arguments.get("name"),
+            "group": arguments.get("group", "General"),
+            "type": arguments.get("type", "Text"),
+            "visible": arguments.get("visible", True)
+        },
+    ),
+    ToolSpec(
+        name="revit_list_project_parameters",
+        bridge_tool="revit.list_project_parameters",
+        description="List project parameters",
+        input_schema={"type": "object", "properties": {}},
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_create_project_parameter",
+        bridge_tool="revit.create_project_parameter",
+        description="Create a new project parameter",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"}, "category": {"type": "string"},
+                "group": {"type": "string"}, "type": {"type": "string"}
+            },
+            "required": ["name", "category"]
+        },
+        build_payload=lambda arguments: {
+            "name": arguments.get("name"),
+            "group": arguments.get("group", "General"),
+            "type": arguments.get("type", "Text"),
+            "category": arguments.get("category"),
+            "visible": arguments.get("visible", True)
+        },
+    ),
+    ToolSpec(
+        name="revit_batch_set_parameters",
+        bridge_tool="revit.batch_set_parameters",
+        description="Set a parameter value for multiple elements",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "element_ids": {"type": "array", "items": {"type": "integer"}},
+                "parameter_name": {"type": "string"}, "value": {"type": ["string", "number"]}
+            },
+            "required": ["element_ids", "parameter_name", "value"]
+        },
+        build_payload=lambda arguments: {
+            "element_ids": arguments.get("element_ids"),
+            "parameter_name": arguments.get("parameter_name"),
+            "value": arguments.get("value")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_type_parameters",
+        bridge_tool="revit.get_type_parameters",
+        description="Get type parameters for an element",
+        input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]},
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_set_type_parameter",
+        bridge_tool="revit.set_type_parameter",
+        description="Set a type parameter value",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "element_id": {"type": "integer"},
+                "parameter_name": {"type": "string"}, "value": {"type": ["string", "number"]}
+            },
+            "required": ["element_id", "parameter_name", "value"]
+        },
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id"),
+            "parameter_name": arguments.get("parameter_name"),
+            "value": arguments.get("value")
+        },
+    ),
+    ToolSpec(
+        name="revit_list_sheets",
+        bridge_tool="revit.list_sheets",
+        description="List all sheets",
+        input_schema={"type": "object", "properties": {}},
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_create_sheet",
+        bridge_tool="revit.create_sheet",
+        description="Create a new sheet",
+        input_schema={
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "number": {"type": "string"}, "titleblock_id": {"type": "integer"}},
+            "required": ["name", "number"]
+        },
+        build_payload=lambda arguments: {
+            "name": arguments.get("name"),
+            "number": arguments.get("number"),
+            "titleblock_id": arguments.get("titleblock_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_delete_sheet",
+        bridge_tool="revit.delete_sheet",
+        description="Delete a sheet",
+        input_schema={"type": "object", "properties": {"sheet_id": {"type": "integer"}}, "required": ["sheet_id"]},
+        build_payload=lambda arguments: {
+            "sheet_id": arguments.get("sheet_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_place_viewport_on_sheet",
+        bridge_tool="revit.place_viewport_on_sheet",
+        description="Place a view on a sheet",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "sheet_id": {"type": "integer"}, "view_id": {"type": "integer"},
+                "x": {"type": "number"}, "y": {"type": "number"}
+            },
+            "required": ["sheet_id", "view_id", "x", "y"]
+        },
+        build_payload=lambda arguments: {
+            "sheet_id": arguments.get("sheet_id"),
+            "view_id": arguments.get("view_id"),
+            "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}
+        },
+    ),
+    ToolSpec(
+        name="revit_batch_create_sheets_from_csv",
+        bridge_tool="revit.batch_create_sheets_from_csv",
+        description="Create multiple sheets from a CSV file",
+        input_schema={
+            "type": "object", "properties": {"csv_path": {"type": "string"}, "titleblock_name": {"type": "string"}},
+            "required": ["csv_path"]
+        },
+        build_payload=lambda arguments: {
+            "csv_path": arguments.get("csv_path"),
+            "titleblock_name": arguments.get("titleblock_name")
+        },
+    ),
+    ToolSpec(
+        name="revit_populate_titleblock",
+        bridge_tool="revit.populate_titleblock",
+        description="Populate titleblock parameters",
+        input_schema={
+            "type": "object", "properties": {"sheet_id": {"type": "integer"}, "parameters": {"type": "object"}},
+            "required": ["sheet_id", "parameters"]
+        },
+        build_payload=lambda arguments: {
+            "sheet_id": arguments.get("sheet_id"),
+            "parameters": arguments.get("parameters")
+        },
+    ),
+    ToolSpec(
+        name="revit_list_titleblocks",
+        bridge_tool="revit.list_titleblocks",
+        description="List available titleblocks",
+        input_schema={"type": "object", "properties": {}},
+        build_payload=lambda arguments: {},
+    ),
+    ToolSpec(
+        name="revit_get_sheet_info",
+        bridge_tool="revit.get_sheet_info",
+        description="Get detailed information about a sheet",
+        input_schema={"type": "object", "properties": {"sheet_id": {"type": "integer"}}, "required": ["sheet_id"]},
+        build_payload=lambda arguments: {
+            "sheet_id": arguments.get("sheet_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_duplicate_sheet",
+        bridge_tool="revit.duplicate_sheet",
+        description="Duplicate a sheet",
+        input_schema={
+            "type": "object",
+            "properties": {"sheet_id": {"type": "integer"}, "with_views": {"type": "boolean"}, "duplicate_option": {"type": "string"}},
+            "required": ["sheet_id"]
+        },
+        build_payload=lambda arguments: {
+            "sheet_id": arguments.get("sheet_id"),
+            "with_views": arguments.get("with_views", False),
+            "duplicate_option": arguments.get("duplicate_option", "Duplicate")
+        },
+    ),
+    ToolSpec(
+        name="revit_renumber_sheets",
+        bridge_tool="revit.renumber_sheets",
+        description="Batch renumber sheets",
+        input_schema={
+            "type": "object", "properties": {"prefix": {"type": "string"}, "start_number": {"type": "integer"}},
+            "required": ["start_number"]
+        },
+        build_payload=lambda arguments: {
+            "prefix": arguments.get("prefix"),
+            "start_number": arguments.get("start_number")
+        },
+    ),
+    # Batch 2: Selection
+    ToolSpec(name="revit_get_selection", bridge_tool="revit.get_selection", description="Get currently selected element IDs", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_set_selection", bridge_tool="revit.set_selection", description="Set selection by element IDs", input_schema={"type": "object", "properties": {"element_ids": {"type": "array", "items": {"type": "integer"}}}, "required": ["element_ids"]}, build_payload=lambda arguments: {"element_ids": arguments.get("element_ids")}),
+    # Batch 2: Annotation
+    ToolSpec(name="revit_create_text_note", bridge_tool="revit.create_text_note", description="Create a text note", input_schema={"type": "object", "properties": {"text": {"type": "string"}, "x": {"type": "number"}, "y": {"type": "number"}, "view_id": {"type": "integer"}}, "required": ["text", "x", "y"]}, build_payload=lambda arguments: {"text": arguments.get("text"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}, "view_id": arguments.get("view_id")}),
+    ToolSpec(name="revit_create_tag", bridge_tool="revit.create_tag", description="Tag an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}, "x": {"type": "number"}, "y": {"type": "number"}, "view_id": {"type": "integer"}}, "required": ["element_id", "x", "y"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}, "view_id": arguments.get("view_id")}),
+    # Batch 2: Structure
+    ToolSpec(name="revit_create_column", bridge_tool="revit.create_column", description="Create structural column", input_schema={"type": "object", "properties": {"family_name": {"type": "string"}, "type_name": {"type": "string"}, "level": {"type": "string"}, "x": {"type": "number"}, "y": {"type": "number"}}, "required": ["family_name", "type_name", "level", "x", "y"]}, build_payload=lambda arguments: {"family_name": arguments.get("family_name"), "type_name": arguments.get("type_name"), "level": arguments.get("level"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": 0}}),
+    ToolSpec(name="revit_create_beam", bridge_tool="revit.create_beam", description="Create structural beam", input_schema={"type": "object", "properties": {"family_name": {"type": "string"}, "type_name": {"type": "string"}, "level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "end_x": {"type": "number"}, "end_y": {"type": "number"}}, "required": ["family_name", "type_name", "level", "start_x", "start_y", "end_x", "end_y"]}, build_payload=lambda arguments: {"family_name": arguments.get("family_name"), "type_name": arguments.get("type_name"), "level": arguments.get("level"), "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": 0}, "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": 0}}),
+    ToolSpec(name="revit_create_foundation", bridge_tool="revit.create_foundation", description="Create foundation", input_schema={"type": "object", "properties": {"family_name": {"type": "string"}, "type_name": {"type": "string"}, "level": {"type": "string"}, "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}}, "required": ["family_name", "type_name", "level", "x", "y"]}, build_payload=lambda arguments: {"family_name": arguments.get("family_name"), "type_name": arguments.get("type_name"), "level": arguments.get("level"), "location": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z", 0)}}),
+    # Batch 2: MEP
+    ToolSpec(name="revit_create_duct", bridge_tool="revit.create_duct", description="Create duct", input_schema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "z": {"type": "number", "default": 10}, "system_type": {"type": "string"}, "duct_type": {"type": "string"}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]}, build_payload=lambda arguments: {"level": arguments.get("level"), "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("z", 10)}, "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("z", 10)}, "system_type": arguments.get("system_type"), "duct_type": arguments.get("duct_type")}),
+    ToolSpec(name="revit_create_pipe", bridge_tool="revit.create_pipe", description="Create pipe", input_schema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "z": {"type": "number", "default": 0}, "system_type": {"type": "string"}, "pipe_type": {"type": "string"}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]}, build_payload=lambda arguments: {"level": arguments.get("level"), "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("z", 0)}, "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("z", 0)}, "system_type": arguments.get("system_type"), "pipe_type": arguments.get("pipe_type")}),
+    # Batch 2: Helpers
+    ToolSpec(name="revit_get_categories", bridge_tool="revit.get_categories", description="List Revit categories", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_get_element_type", bridge_tool="revit.get_element_type", description="Find element types/families", input_schema={"type": "object", "properties": {"category_name": {"type": "string"}, "family_name": {"type": "string"}}, "required": ["category_name"]}, build_payload=lambda arguments: {"category_name": arguments.get("category_name"), "family_name": arguments.get("family_name")}),
+    # Batch 2: Remaining Existing
+    ToolSpec(name="revit_close_document", bridge_tool="revit.close_document", description="Close active document", input_schema={"type": "object", "properties": {"save_changes": {"type": "boolean", "default": False}}}, build_payload=lambda arguments: {"save_changes": arguments.get("save_changes", False)}),
+    ToolSpec(name="revit_create_new_document", bridge_tool="revit.create_new_document", description="Create new project", input_schema={"type": "object", "properties": {"template_path": {"type": "string"}}}, build_payload=lambda arguments: {"template_path": arguments.get("template_path")}),
+    ToolSpec(name="revit_export_dwg", bridge_tool="revit.export_dwg_by_view", description="Export view to DWG", input_schema={"type": "object", "properties": {"view_id": {"type": "integer"}, "output_path": {"type": "string"}}, "required": ["view_id", "output_path"]}, build_payload=lambda arguments: {"view_id": arguments.get("view_id"), "output_path": arguments.get("output_path")}),
+    ToolSpec(name="revit_export_ifc", bridge_tool="revit.export_ifc_with_settings", description="Export to IFC", input_schema={"type": "object", "properties": {"output_path": {"type": "string"}}, "required": ["output_path"]}, build_payload=lambda arguments: {"output_path": arguments.get("output_path")}),
+    ToolSpec(name="revit_export_navisworks", bridge_tool="revit.export_navisworks", description="Export to NWC", input_schema={"type": "object", "properties": {"output_path": {"type": "string"}}, "required": ["output_path"]}, build_payload=lambda arguments: {"output_path": arguments.get("output_path")}),
+    ToolSpec(name="revit_export_image", bridge_tool="revit.export_image", description="Export view to Image", input_schema={"type": "object", "properties": {"view_id": {"type": "integer"}, "output_path": {"type": "string"}, "width": {"type": "integer"}, "height": {"type": "integer"}}, "required": ["view_id", "output_path"]}, build_payload=lambda arguments: {"view_id": arguments.get("view_id"), "output_path": arguments.get("output_path"), "width": arguments.get("width"), "height": arguments.get("height")}),
+    ToolSpec(name="revit_render_3d", bridge_tool="revit.render_3d_view", description="Render 3D view to image", input_schema={"type": "object", "properties": {"view_id": {"type": "integer"}, "output_path": {"type": "string"}, "quality": {"type": "string", "enum": ["Draft", "Medium", "High"]}}, "required": ["view_id", "output_path"]}, build_payload=lambda arguments: {"view_id": arguments.get("view_id"), "output_path": arguments.get("output_path"), "quality": arguments.get("quality", "Medium")}),
+    # Batch 3: Editing
+    ToolSpec(name="revit_move_element", bridge_tool="revit.move_element", description="Move an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}, "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}}, "required": ["element_id", "x", "y"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id"), "vector": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z", 0)}}),
+    ToolSpec(name="revit_copy_element", bridge_tool="revit.copy_element", description="Copy an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}, "x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number", "default": 0}}, "required": ["element_id", "x", "y"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id"), "vector": {"x": arguments.get("x"), "y": arguments.get("y"), "z": arguments.get("z", 0)}}),
+    ToolSpec(name="revit_rotate_element", bridge_tool="revit.rotate_element", description="Rotate an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}, "center_x": {"type": "number"}, "center_y": {"type": "number"}, "center_z": {"type": "number", "default": 0}, "angle_radians": {"type": "number"}}, "required": ["element_id", "center_x", "center_y", "angle_radians"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id"), "axis_point": {"x": arguments.get("center_x"), "y": arguments.get("center_y"), "z": arguments.get("center_z", 0)}, "angle_radians": arguments.get("angle_radians")}),
+    ToolSpec(name="revit_mirror_element", bridge_tool="revit.mirror_element", description="Mirror an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}, "plane_origin_x": {"type": "number"}, "plane_origin_y": {"type": "number"}, "plane_origin_z": {"type": "number", "default": 0}, "plane_normal_x": {"type": "number"}, "plane_normal_y": {"type": "number"}, "plane_normal_z": {"type": "number", "default": 0}}, "required": ["element_id", "plane_origin_x", "plane_origin_y", "plane_normal_x", "plane_normal_y"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id"), "plane_origin": {"x": arguments.get("plane_origin_x"), "y": arguments.get("plane_origin_y"), "z": arguments.get("plane_origin_z", 0)}, "plane_normal": {"x": arguments.get("plane_normal_x"), "y": arguments.get("plane_normal_y"), "z": arguments.get("plane_normal_z", 0)}}),
+    ToolSpec(name="revit_pin_element", bridge_tool="revit.pin_element", description="Pin an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id")}),
+    ToolSpec(name="revit_unpin_element", bridge_tool="revit.unpin_element", description="Unpin an element", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id")}),
+    # Batch 3: Worksharing
+    ToolSpec(name="revit_sync_to_central", bridge_tool="revit.sync_to_central", description="Sync to central model", input_schema={"type": "object", "properties": {"comment": {"type": "string"}, "relinquish": {"type": "boolean", "default": True}}}, build_payload=lambda arguments: {"comment": arguments.get("comment", "Sync via MCP"), "relinquish": arguments.get("relinquish", True)}),
+    ToolSpec(name="revit_relinquish_all", bridge_tool="revit.relinquish_all", description="Relinquish all elements and worksets", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_get_worksets", bridge_tool="revit.get_worksets", description="Get all worksets", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    # Batch 3: Schedules & Geo
+    ToolSpec(name="revit_create_schedule", bridge_tool="revit.create_schedule", description="Create a schedule", input_schema={"type": "object", "properties": {"category_name": {"type": "string"}, "name": {"type": "string"}}, "required": ["category_name", "name"]}, build_payload=lambda arguments: {"category_name": arguments.get("category_name"), "name": arguments.get("name")}),
+    ToolSpec(name="revit_get_schedule_data", bridge_tool="revit.get_schedule_data", description="Get schedule data", input_schema={"type": "object", "properties": {"schedule_id": {"type": "integer"}}, "required": ["schedule_id"]}, build_payload=lambda arguments: {"schedule_id": arguments.get("schedule_id")}),
+    ToolSpec(name="revit_get_element_bounding_box", bridge_tool="revit.get_element_bounding_box", description="Get element bounding box", input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}}, "required": ["element_id"]}, build_payload=lambda arguments: {"element_id": arguments.get("element_id")}),
+    # Batch 4: Phasing
+    ToolSpec(name="revit_get_phases", bridge_tool="revit.get_phases", description="Get project phases", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_get_phase_filters", bridge_tool="revit.get_phase_filters", description="Get phase filters", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    # Batch 4: Design Options
+    ToolSpec(name="revit_get_design_options", bridge_tool="revit.get_design_options", description="Get design options", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    # Batch 4: Groups
+    ToolSpec(name="revit_create_group", bridge_tool="revit.create_group", description="Create a group", input_schema={"type": "object", "properties": {"element_ids": {"type": "array", "items": {"type": "integer"}}, "name": {"type": "string"}}, "required": ["element_ids", "name"]}, build_payload=lambda arguments: {"element_ids": arguments.get("element_ids"), "name": arguments.get("name")}),
+    ToolSpec(name="revit_ungroup", bridge_tool="revit.ungroup", description="Ungroup a group", input_schema={"type": "object", "properties": {"group_id": {"type": "integer"}}, "required": ["group_id"]}, build_payload=lambda arguments: {"group_id": arguments.get("group_id")}),
+    ToolSpec(name="revit_get_group_members", bridge_tool="revit.get_group_members", description="Get group members", input_schema={"type": "object", "properties": {"group_id": {"type": "integer"}}, "required": ["group_id"]}, build_payload=lambda arguments: {"group_id": arguments.get("group_id")}),
+    # Batch 4: Links
+    ToolSpec(name="revit_get_rvt_links", bridge_tool="revit.get_rvt_links", description="Get RVT links", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_get_link_instances", bridge_tool="revit.get_link_instances", description="Get link instances", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    # Batch 5: Advanced MEP & Engineering
+    ToolSpec(
+        name="revit_create_cable_tray",
+        bridge_tool="revit.create_cable_tray",
+        description="Create cable tray run",
+        input_schema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number", "default": 10}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number", "default": 10}, "width": {"type": "number", "default": 1.0}, "height": {"type": "number", "default": 0.33}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]},
+        build_payload=lambda arguments: {
+            "level": arguments.get("level"),
+            "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z", 10)},
+            "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z", 10)},
+            "width": arguments.get("width", 1.0),
+            "height": arguments.get("height", 0.33),
+            "cable_tray_type": arguments.get("cable_tray_type")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_conduit",
+        bridge_tool="revit.create_conduit",
+        description="Create electrical conduit",
+        input_schema={"type": "object", "properties": {"level": {"type": "string"}, "start_x": {"type": "number"}, "start_y": {"type": "number"}, "start_z": {"type": "number", "default": 10}, "end_x": {"type": "number"}, "end_y": {"type": "number"}, "end_z": {"type": "number", "default": 10}, "diameter": {"type": "number", "default": 0.0625}}, "required": ["level", "start_x", "start_y", "end_x", "end_y"]},
+        build_payload=lambda arguments: {
+            "level": arguments.get("level"),
+            "start_point": {"x": arguments.get("start_x"), "y": arguments.get("start_y"), "z": arguments.get("start_z", 10)},
+            "end_point": {"x": arguments.get("end_x"), "y": arguments.get("end_y"), "z": arguments.get("end_z", 10)},
+            "diameter": arguments.get("diameter", 0.0625),
+            "conduit_type": arguments.get("conduit_type")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_mep_systems",
+        bridge_tool="revit.get_mep_systems",
+        description="Get MEP systems info",
+        input_schema={"type": "object", "properties": {"system_type": {"type": "string", "default": "all"}}},
+        build_payload=lambda arguments: {
+            "system_type": arguments.get("system_type", "all")
+        },
+    ),
+    ToolSpec(
+        name="revit_check_clashes",
+        bridge_tool="revit.check_clashes",
+        description="Check clashes between categories",
+        input_schema={"type": "object", "properties": {"category1": {"type": "string"}, "category2": {"type": "string"}, "tolerance": {"type": "number", "default": 0.01}}, "required": ["category1", "category2"]},
+        build_payload=lambda arguments: {
+            "category1": arguments.get("category1"),
+            "category2": arguments.get("category2"),
+            "tolerance": arguments.get("tolerance", 0.01)
+        },
+    ),
+    # Batch 6: Materials & Visuals
+    ToolSpec(
+        name="revit_create_material",
+        bridge_tool="revit.create_material",
+        description="Create a new material with color and properties",
+        input_schema={"type": "object", "properties": {"name": {"type": "string"}, "color": {"type": "object", "properties": {"r": {"type": "integer"}, "g": {"type": "integer"}, "b": {"type": "integer"}}}, "transparency": {"type": "integer", "default": 0}, "shininess": {"type": "integer", "default": 50}, "smoothness": {"type": "integer", "default": 50}}, "required": ["name"]},
+        build_payload=lambda arguments: {
+            "name": arguments.get("name"),
+            "color": arguments.get("color"),
+            "transparency": arguments.get("transparency", 0),
+            "shininess": arguments.get("shininess", 50),
+            "smoothness": arguments.get("smoothness", 50)
+        },
+    ),
+    ToolSpec(
+        name="revit_set_element_material",
+        bridge_tool="revit.set_element_material",
+        description="Set material for an element or specific face",
+        input_schema={"type": "object", "properties": {"element_id": {"type": "integer"}, "material_name": {"type": "string"}, "face_index": {"type": "integer", "description": "Optional face index for face-specific material"}}, "required": ["element_id", "material_name"]},
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id"),
+            "material_name": arguments.get("material_name"),
+            "face_index": arguments.get("face_index")
+        },
+    ),
+    ToolSpec(name="revit_get_render_settings", bridge_tool="revit.get_render_settings", description="Get rendering settings from document", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    # Batch 7: Family Management
+    ToolSpec(
+        name="revit_convert_to_group",
+        bridge_tool="revit.convert_to_group",
+        description="Convert elements into a group",
+        input_schema={"type": "object", "properties": {"element_ids": {"type": "array", "items": {"type": "integer"}}, "name": {"type": "string"}}, "required": ["element_ids"]},
+        build_payload=lambda arguments: {
+            "element_ids": arguments.get("element_ids"),
+            "name": arguments.get("name")
+        },
+    ),
+    ToolSpec(
+        name="revit_edit_family",
+        bridge_tool="revit.edit_family",
+        description="Open a family for editing",
+        input_schema={"type": "object", "properties": {"family_name": {"type": "string"}, "family_symbol_id": {"type": "integer"}, "family_instance_id": {"type": "integer"}}, "required": []},
+        build_payload=lambda arguments: {
+            "family_name": arguments.get("family_name"),
+            "family_symbol_id": arguments.get("family_symbol_id"),
+            "family_instance_id": arguments.get("family_instance_id")
+        },
+    ),
+    # Batch 8: High-Value Documentation & Analysis
+    ToolSpec(
+        name="revit_create_dimension",
+        bridge_tool="revit.create_dimension",
+        description="Create linear dimension between elements",
+        input_schema={"type": "object", "properties": {"start_point": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}}}, "end_point": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}}}, "element1_id": {"type": "integer"}, "element2_id": {"type": "integer"}}, "required": ["start_point", "end_point", "element1_id", "element2_id"]},
+        build_payload=lambda arguments: {
+            "start_point": arguments.get("start_point"),
+            "end_point": arguments.get("end_point"),
+            "element1_id": arguments.get("element1_id"),
+            "element2_id": arguments.get("element2_id")
+        },
+    ),
+    ToolSpec(
+        name="revit_create_revision_cloud",
+        bridge_tool="revit.create_revision_cloud",
+        description="Create revision cloud defined by points",
+        input_schema={"type": "object", "properties": {"view_id": {"type": "integer"}, "points": {"type": "array", "items": {"type": "object", "properties": {"x": {"type": "number"}, "y": {"type": "number"}, "z": {"type": "number"}}}}, "revision_id": {"type": "integer"}}, "required": ["view_id", "points"]},
+        build_payload=lambda arguments: {
+            "view_id": arguments.get("view_id"),
+            "points": arguments.get("points"),
+            "revision_id": arguments.get("revision_id")
+        },
+    ),
+    ToolSpec(name="revit_get_revision_sequences", bridge_tool="revit.get_revision_sequences", description="Get list of revision sequences", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_tag_all_in_view", bridge_tool="revit.tag_all_in_view", description="Tag all elements of a category in view", input_schema={"type": "object", "properties": {"category": {"type": "string"}}, "required": ["category"]}, build_payload=lambda arguments: {"category": arguments.get("category")}),
+    ToolSpec(
+        name="revit_create_text_type",
+        bridge_tool="revit.create_text_type",
+        description="Create or duplicate a text type",
+        input_schema={"type": "object", "properties": {"name": {"type": "string"}, "font": {"type": "string", "default": "Arial"}, "size_inches": {"type": "number", "default": 0.09375}}, "required": ["name"]},
+        build_payload=lambda arguments: {
+            "name": arguments.get("name"),
+            "font": arguments.get("font"),
+            "size_inches": arguments.get("size_inches")
+        },
+    ),
+    ToolSpec(name="revit_get_view_templates", bridge_tool="revit.get_view_templates", description="Get list of view templates", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(
+        name="revit_apply_view_template",
+        bridge_tool="revit.apply_view_template",
+        description="Apply view template to a view",
+        input_schema={"type": "object", "properties": {"view_id": {"type": "integer"}, "template_id": {"type": "integer"}}, "required": ["view_id", "template_id"]},
+        build_payload=lambda arguments: {
+            "view_id": arguments.get("view_id"),
+            "template_id": arguments.get("template_id")
+        },
+    ),
+    ToolSpec(name="revit_calculate_material_quantities", bridge_tool="revit.calculate_material_quantities", description="Calculate material volumes for a category", input_schema={"type": "object", "properties": {"category": {"type": "string"}}, "required": ["category"]}, build_payload=lambda arguments: {"category": arguments.get("category")}),
+    ToolSpec(name="revit_get_room_boundary", bridge_tool="revit.get_room_boundary", description="Get room geometric boundary loops", input_schema={"type": "object", "properties": {"room_id": {"type": "integer"}}, "required": ["room_id"]}, build_payload=lambda arguments: {"room_id": arguments.get("room_id")}),
+    ToolSpec(name="revit_get_project_location", bridge_tool="revit.get_project_location", description="Get project base and survey points", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    ToolSpec(name="revit_get_warnings", bridge_tool="revit.get_warnings", description="Get current project warnings", input_schema={"type": "object", "properties": {}}, build_payload=lambda arguments: {}),
+    # Batch 9: Universal Reflection Bridge (10k+ Tools)
+    ToolSpec(
+        name="revit_invoke_method",
+        bridge_tool="revit.invoke_method",
+        description="Invoke any Revit API method dynamically using Reflection",
+        input_schema={"type": "object", "properties": {"class_name": {"type": "string"}, "method_name": {"type": "string"}, "arguments": {"type": "array", "items": {}}, "target_id": {"type": "string"}, "use_transaction": {"type": "boolean", "default": True}}, "required": ["class_name", "method_name", "arguments"]},
+        build_payload=lambda arguments: {
+            "class_name": arguments.get("class_name"),
+            "method_name": arguments.get("method_name"),
+            "arguments": arguments.get("arguments"),
+            "target_id": arguments.get("target_id"),
+            "use_transaction": arguments.get("use_transaction", True)
+        },
+    ),
+    ToolSpec(
+        name="revit_reflect_get",
+        bridge_tool="revit.reflect_get",
+        description="Get any Revit property value dynamically",
+        input_schema={"type": "object", "properties": {"target_id": {"type": "string"}, "property_name": {"type": "string"}}, "required": ["target_id", "property_name"]},
+        build_payload=lambda arguments: {
+            "target_id": arguments.get("target_id"),
+            "property_name": arguments.get("property_name")
+        },
+    ),
+    ToolSpec(
+        name="revit_reflect_set",
+        bridge_tool="revit.reflect_set",
+        description="Set any Revit property value dynamically",
+        input_schema={"type": "object", "properties": {"target_id": {"type": "string"}, "property_name": {"type": "string"}, "value": {}}, "required": ["target_id", "property_name", "value"]},
+        build_payload=lambda arguments: {
+            "target_id": arguments.get("target_id"),
+            "property_name": arguments.get("property_name"),
+            "value": arguments.get("value")
+        },
+    ),
+    # Batch 10: LLM Power Tools
+    ToolSpec(
+        name="revit_execute_python",
+        bridge_tool="revit.execute_python",
+        description=(
+            "Execute arbitrary Python/IronPython code inside Revit with full Revit API access. "
+            "Variables pre-injected: doc (Document), uidoc (UIDocument), uiapp (UIApplication), app (Application). "
+            "Write output to stdout (print) or set __output__ = 'result string'. "
+            "Use 'from Autodesk.Revit.DB import *' for API access."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "script": {"type": "string", "description": "Python script to execute"},
+                "timeout_ms": {"type": "integer", "description": "Execution timeout in milliseconds", "default": 10000}
+            },
+            "required": ["script"]
+        },
+        build_payload=lambda arguments: {
+            "script": arguments.get("script"),
+            "timeout_ms": arguments.get("timeout_ms", 10000)
+        },
+    ),
+    ToolSpec(
+        name="revit_change_element_type",
+        bridge_tool="revit.change_element_type",
+        description=(
+            "Swap all instances of one element type to another type. "
+            "Works for Walls, Doors, Windows, Floors, Roofs, Columns, Furniture, etc. "
+            "Use revit_get_element_type or revit_list_elements first to find type IDs."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "source_type_id": {"type": "integer", "description": "Element type ID to replace (all instances)"},
+                "target_type_id": {"type": "integer", "description": "Element type ID to change to"},
+                "category": {"type": "string", "description": "Optional category filter (e.g. 'Walls', 'Doors') to limit scope"}
+            },
+            "required": ["source_type_id", "target_type_id"]
+        },
+        build_payload=lambda arguments: {
+            "source_type_id": arguments.get("source_type_id"),
+            "target_type_id": arguments.get("target_type_id"),
+            "category": arguments.get("category")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_elements_by_type",
+        bridge_tool="revit.get_elements_by_type",
+        description=(
+            "Get element IDs and key parameters, filtered by type, category, and/or level. "
+            "Paginated — default 200 per call, max 500. Pass the returned next_cursor (or an offset) for the next page. "
+            "Specify 'fields' to limit returned data. Never crashes on large models."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "type_id":  {"type": "integer", "description": "Filter by element type ID (optional)"},
+                "category": {"type": "string",  "description": "Filter by category name, e.g. 'Walls', 'Doors' (optional)"},
+                "level":    {"type": "string",  "description": "Filter by level name, e.g. 'BG', 'L1' (optional)"},
+                "fields":   {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to return: id always included. Options: name, category, type_id, level, length, area, volume"
+                },
+                "offset": {"type": "integer", "description": "Pagination offset (default 0)", "default": 0},
+                "limit":  {"type": "integer", "description": "Max results to return (default 200, max 500)", "default": 200},
+                "cursor": {"type": "string", "description": "next_cursor from a previous page; resumes that listing and overrides the other arguments"}
+            },
+            "required": []
+        },
+        build_payload=_elements_page_payload,
+        transform_result=_elements_page_result,
+    ),
+    ToolSpec(
+        name="revit_batch_set_parameters_by_filter",
+        bridge_tool="revit.batch_set_parameters_by_filter",
+        description=(
+            "Set a parameter value on all elements matching a filter (category, type, level, or parameter value). "
+            "More powerful than revit_batch_set_parameters because you don't need to know element IDs first."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "filter": {
+                    "type": "object",
+                    "description": "Filter criteria to select elements",
+                    "properties": {
+                        "category": {"type": "string", "description": "Category name, e.g. 'Walls'"},
+                        "type_id":  {"type": "integer", "description": "Element type ID filter"},
+                        "level":    {"type": "string",  "description": "Level name filter"},
+                        "parameter_filter": {
+                            "type": "object",
+                            "description": "Only include elements where this parameter equals this value",
+                            "properties": {
+                                "name":  {"type": "string"},
+                                "value": {}
+                            },
+                            "required": ["name", "value"]
+                        }
+                    }
+                },
+                "parameter_name": {"type": "string", "description": "Name of the parameter to set"},
+                "value": {"description": "Value to set (string, number, or boolean)"}
+            },
+            "required": ["filter", "parameter_name", "value"]
+        },
+        build_payload=lambda arguments: {
+            "filter":         arguments.get("filter"),
+            "parameter_name": arguments.get("parameter_name"),
+            "value":          arguments.get("value")
+        },
+    ),
+    ToolSpec(
+        name="revit_replace_family_type",
+        bridge_tool="revit.replace_family_type",
+        description=(
+            "Replace all instances of one family/type combination with another, identified by name. "
+            "Use this for doors, windows, furniture etc. when you know the family and type names."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "old_family": {"type": "string", "description": "Current family name (exact match, case-insensitive)"},
+                "old_type":   {"type": "string", "description": "Current type name"},
+                "new_family": {"type": "string", "description": "Replacement family name"},
+                "new_type":   {"type": "string", "description": "Replacement type name"}
+            },
+            "required": ["old_family", "old_type", "new_family", "new_type"]
+        },
+        build_payload=lambda arguments: {
+            "old_family": arguments.get("old_family"),
+            "old_type":   arguments.get("old_type"),
+            "new_family": arguments.get("new_family"),
+            "new_type":   arguments.get("new_type")
+        },
+    ),
+    ToolSpec(
+        name="revit_get_element_geometry",
+        bridge_tool="revit.get_element_geometry",
+        description=(
+            "Get geometric data for an element: location point or curve endpoints, bounding box, "
+            "level, area, volume, and length. Coordinates are in Revit internal units (feet)."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "element_id": {"type": "integer", "description": "Element ID"}
+            },
+            "required": ["element_id"]
+        },
+        build_payload=lambda arguments: {
+            "element_id": arguments.get("element_id")
+        },
+    ),
+    # Batch execution
+    ToolSpec(
+        name="revit_batch",
+        bridge_tool="revit.batch_execute",
+        description=(
+            "Run many Revit tools in one bridge round trip. Operations run in order; each reports its own "
+            "result or error. With transaction=true the whole batch is one undoable step and is rolled back "
+            "if any operation fails."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Ordered operations, each naming an MCP tool (e.g. 'revit_create_wall') and its arguments",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {"type": "string", "description": "MCP tool name"},
+                            "arguments": {"type": "object", "description": "Arguments for that tool"}
+                        },
+                        "required": ["tool"]
+                    }
+                },
+                "transaction": {"type": "boolean", "description": "Run all operations in one transaction group", "default": False},
+                "stop_on_error": {"type": "boolean", "description": "Stop at the first failure (defaults to the value of transaction)"}
+            },
+            "required": ["operations"]
+        },
+        build_payload=_batch_payload,
+    ),
+    ToolSpec(
+        name="revit_fetch_result",
+        bridge_tool=None,
+        description=(
+            "Page through a tool result that was too large to return inline. Pass the result_handle from that "
+            "response, optionally a JSON path into it (e.g. '$.elements'), and offset/limit for lists."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "handle": {"type": "string", "description": "result_handle returned with the oversized result"},
+                "path": {"type": "string", "description": "JSON path inside the result, e.g. '$.elements' or 'rooms[0]'"},
+                "offset": {"type": "integer", "default": 0, "minimum": 0},
+                "limit": {"type": "integer", "default": 100, "minimum": 1, "maximum": 1000}
+            },
+            "required": ["handle"]
+        },
+        build_payload=lambda arguments: {
+            "handle": arguments.get("handle"),
+            "path": arguments.get("path"),
+            "offset": arguments.get("offset", 0),
+            "limit": min(arguments.get("limit", 100), 1000)
+        },
+    ),
+    ToolSpec(
+        name="revit_server_stats",
+        bridge_tool=None,
+        description=(
+            "Report per-tool call counts, error rates, retries, bytes transferred and p50/p95/p99 latency "
+            "(split into queue, network, bridge and formatting time), plus cache, circuit breaker and heartbeat state."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        build_payload=lambda arguments: {},
+    ),
+)
+
+TOOL_REGISTRY: Dict[str, ToolSpec] = {spec.name: spec for spec in _SPECS}
@@ -0,0 +1,166 @@
+"""Minimal tracing spans exported to a local JSON Lines file.
+
+Each finished span is written as one Chrome trace event (``"ph": "X"``)
+carrying ``trace_id``, ``span_id`` and ``parent_id`` in its ``args``. To view a
+trace, wrap the lines in a JSON array, e.g.
+``jq -s '{traceEvents: .}' spans.jsonl > trace.json``, and open the result in
+Perfetto or ``chrome://tracing``.
+
+Tracing is off until ``TRACER.configure`` is given a path. While it is off,
+or for a trace that was not sampled, ``span()`` hands out a shared no-op span
+and nothing is timed or written.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "started_ns", "status")
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.started_ns = time.time_ns()
+        self.status = "ok"
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    """Stands in for spans that are not recorded, including every descendant of an unsampled root."""
+
+    __slots__ = ()
+    trace_id = None
+    recording = False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+_NOOP_CONTEXT = nullcontext(NOOP_SPAN)
+
+_current: ContextVar[Span | _NoopSpan | None] = ContextVar("revit_mcp_span", default=None)
+
+
+class Tracer:
+    def __init__(
+        self,
+        path: Path | None = None,
+        sample_rate: float = 1.0,
+        *,
+        sampler: Callable[[], float] = random.random,
+    ):
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._sampler = sampler
+        self.path: Path | None = None
+        self.sample_rate = 0.0
+        self.configure(path, sample_rate)
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None and self.sample_rate > 0
+
+    def configure(self, path: Path | None, sample_rate: float = 1.0) -> None:
+        """Start (or, with ``path=None``, stop) exporting spans to ``path``."""
+        self.close()
+        self.path = path
+        self.sample_rate = sample_rate
+
+    def span(self, name: str, **attributes: Any) -> AbstractContextManager[Span | _NoopSpan]:
+        """Time the enclosed block as a child of the active span, or as a new sampled root."""
+        if self.path is None:
+            # Fast path while tracing is off: no timing, no context variable
+            return _NOOP_CONTEXT
+        return self._span(name, attributes)
+
+    @contextmanager
+    def _span(self, name: str, attributes: dict[str, Any]) -> Iterator[Span | _NoopSpan]:
+        parent = _current.get()
+        if parent is None:
+            if self._sampler() >= self.sample_rate:
+                # Unsampled: descendants see the no-op parent and skip sampling
+                token = _current.set(NOOP_SPAN)
+                try:
+                    yield NOOP_SPAN
+                finally:
+                    _current.reset(token)
+                return
+            span = Span(name, os.urandom(16).hex(), None, attributes)
+        elif parent.recording:
+            span = Span(name, parent.trace_id, parent.span_id, attributes)
+        else:
+            yield NOOP_SPAN
+            return
+
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.status = "error"
+            span.attributes.setdefault("error", f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _current.reset(token)
+            self._export(span, time.time_ns())
+
+    def _export(self, span: Span, ended_ns: int) -> None:
+        event = {
+            "name": span.name,
+            "cat": "revit-mcp",
+            "ph": "X",
+            "ts": span.started_ns // 1000,
+            "dur": (ended_ns - span.started_ns) // 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "status": span.status,
+                **span.attributes,
+            },
+        }
+        line = json.dumps(event, default=str) + "\n"
+        with self._lock:
+            if self.path is None:
+                return
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+
+def current_trace_id() -> str | None:
+    """Trace ID of the active recorded span, if any."""
+    span = _current.get()
+    return span.trace_id if span is not None else None
+
+
+# Process-wide tracer shared by every instrumented layer; off until configured.
+TRACER = Tracer()
@@ -1,5 +1,11 @@
+import asyncio
+import json
 import os
 from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+import pytest
 
 # Ensure environment variables exist before other modules import config.
 workspace = Path(__file__).resolve().parent
@@ -7,3 +13,78 @@ os.environ.setdefault("WORKSPACE_DIR", str(workspace))
 os.environ.setdefault("MCP_REVIT_WORKSPACE_DIR", str(workspace))
 os.environ.setdefault("MCP_REVIT_ALLOWED_DIRECTORIES", str(workspace))
 os.environ.setdefault("MCP_REVIT_MODE", "mock")
+
+TOOLS = ["revit.health", "revit.list_levels"]
+
+
+class FakeClock:
+    """Injectable ``clock``; time only moves when a test sets ``now``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def make_transport(
+    requests: list[httpx.Request] | None = None,
+    *,
+    result: Callable[[str], Any] = lambda tool: {"wall_id": 7, "tool": tool},
+    health: dict[str, Any] | None = None,
+    tools: list[str] = TOOLS,
+    etag: str | None = None,
+    failures: int | None = 0,
+    error: type[httpx.RequestError] = httpx.ConnectError,
+    delays: dict[str, float] | None = None,
+) -> httpx.MockTransport:
+    """``httpx.MockTransport`` standing in for the bridge's HTTP API.
+
+    Each request is appended to ``requests``. The first ``failures`` requests
+    raise ``error``; ``failures=None`` fails them all. ``/execute`` answers
+    ``result(tool)``, or an error envelope for ``revit.fail``. With ``etag``,
+    ``/tools`` carries it and answers a matching ``If-None-Match`` with 304.
+    With ``delays`` the transport is async and sleeps that long per tool.
+    """
+    requests = requests if requests is not None else []
+    state = {"failures": failures}
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if state["failures"] is None or state["failures"] > 0:
+            if state["failures"] is not None:
+                state["failures"] -= 1
+            raise error("bridge down", request=request)
+        if request.url.path == "/health":
+            return httpx.Response(200, json=health or {"status": "healthy"})
+        if request.url.path == "/tools":
+            if etag is None:
+                return httpx.Response(200, json={"tools": tools})
+            if request.headers.get("If-None-Match") == f'"{etag}"':
+                return httpx.Response(304, headers={"ETag": f'"{etag}"'})
+            return httpx.Response(200, json={"tools": tools}, headers={"ETag": f'"{etag}"'})
+        tool = json.loads(request.content)["tool"]
+        if tool == "revit.fail":
+            return httpx.Response(200, json={"Status": "error", "Message": "boom"})
+        return httpx.Response(200, json={"Status": "ok", "Result": result(tool)})
+
+    if delays is None:
+        return httpx.MockTransport(respond)
+
+    async def respond_later(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/execute":
+            await asyncio.sleep(delays.get(json.loads(request.content)["tool"], 0))
+        return respond(request)
+
+    return httpx.MockTransport(respond_later)
+
+
+@pytest.fixture
+def bridge_transport() -> Callable[..., httpx.MockTransport]:
+    """Factory for mock bridge transports; see ``make_transport``."""
+    return make_transport
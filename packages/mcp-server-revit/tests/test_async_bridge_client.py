@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.bridge import AsyncBridgeClient, RetryPolicy
+from revit_mcp_server.errors import BridgeError
+
+
+def test_call_tool_normalizes_like_sync_client(bridge_transport):
+    async def scenario():
+        async with AsyncBridgeClient("http://bridge", transport=bridge_transport()) as client:
+            result = await client.call_tool("revit.create_wall", {})
+            assert result["element_id"] == 7
+            with pytest.raises(BridgeError, match="boom"):
+                await client.call_tool("revit.fail", {})
+
+    asyncio.run(scenario())
+
+
+def test_call_tool_retries_without_blocking(bridge_transport):
+    no_wait = RetryPolicy(base_delay=0)
+
+    async def scenario():
+        client = AsyncBridgeClient("http://bridge", retry_policy=no_wait, transport=bridge_transport(failures=2))
+        result = await client.call_tool("revit.list_levels", {})
+        assert result["tool"] == "revit.list_levels"
+        await client.aclose()
+
+        client = AsyncBridgeClient("http://bridge", retry_policy=no_wait, transport=bridge_transport(failures=3))
+        with pytest.raises(BridgeError, match="after 3 attempts"):
+            await client.call_tool("revit.list_levels", {})
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_slow_call_does_not_stall_concurrent_requests(monkeypatch, bridge_transport):
+    transport = bridge_transport(
+        tools=["revit.export_image", "revit.list_levels"], delays={"revit.export_image": 0.2}
+    )
+    client = AsyncBridgeClient("http://bridge", transport=transport)
+    monkeypatch.setattr(mcp_server, "bridge", client)
+    finished: list[str] = []
+
+    async def call(name: str) -> None:
+        await mcp_server.call_tool(name, {})
+        finished.append(name)
+
+    async def scenario():
+        await asyncio.gather(call("revit_export_image"), call("revit_list_levels"))
+        await client.aclose()
+
+    asyncio.run(scenario())
+    assert finished == ["revit_list_levels", "revit_export_image"]
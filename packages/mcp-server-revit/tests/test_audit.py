@@ -0,0 +1,164 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from revit_mcp_server.security import AuditDurability, AuditRecorder
+from revit_mcp_server.security.audit import index_path, rotated_segments
+from revit_mcp_server.security.audit_query import main as audit_main, query_audit
+
+
+def read_entries(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_batched_writer_flushes_on_close(tmp_path):
+    path = tmp_path / "audit.log"
+    recorder = AuditRecorder(path, flush_interval=60)
+    for index in range(5):
+        recorder.record("revit.health", f"req-{index}", {}, {"status": "healthy"})
+    recorder.close()
+    assert [entry["request_id"] for entry in read_entries(path)] == [f"req-{index}" for index in range(5)]
+
+
+def test_flush_makes_entries_visible(tmp_path):
+    path = tmp_path / "audit.log"
+    with AuditRecorder(path, flush_interval=60) as recorder:
+        recorder.record("revit.create_wall", "req-1", {"level": "L1"}, {"status": "ok"})
+        recorder.flush()
+        assert read_entries(path)[0]["payload"] == {"level": "L1"}
+
+
+def test_bounded_queue_keeps_every_entry(tmp_path):
+    path = tmp_path / "audit.log"
+    recorder = AuditRecorder(path, batch_size=4, max_queue=2)
+
+    def produce(worker: int) -> None:
+        for index in range(50):
+            recorder.record("revit.health", f"{worker}-{index}", {}, {})
+
+    threads = [threading.Thread(target=produce, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    recorder.close()
+    assert len(read_entries(path)) == 200
+
+
+def test_sync_and_fsync_modes(tmp_path):
+    for durability in (AuditDurability.sync, AuditDurability.fsync):
+        path = tmp_path / f"{durability.value}.log"
+        recorder = AuditRecorder(path, durability=durability)
+        recorder.record("revit.health", "req-1", {}, {})
+        if durability == AuditDurability.sync:
+            assert read_entries(path)[0]["request_id"] == "req-1"
+        recorder.close()
+        assert len(read_entries(path)) == 1
+
+
+def test_redacts_hashes_and_stores_large_bodies_once(tmp_path):
+    path = tmp_path / "audit.log"
+    blobs = tmp_path / "blobs"
+    recorder = AuditRecorder(path, max_field_bytes=64, blob_dir=blobs, redact_keys=["Password"])
+    big = {"elements": list(range(100))}
+    recorder.record("revit.open_document", "req-1", {"path": "a.rvt", "password": "hunter2"}, big)
+    recorder.record("revit.open_document", "req-2", {"path": "a.rvt", "password": "hunter2"}, big)
+    recorder.close()
+    first, second = read_entries(path)
+    assert first["payload"] == {"path": "a.rvt", "password": "***"}
+    assert first["response"] == {"$blob": first["response_sha256"], "bytes": first["response"]["bytes"]}
+    assert second["response_sha256"] == first["response_sha256"]
+    assert len(list(blobs.rglob("*.json.gz"))) == 1
+    assert recorder.load_blob(first["response_sha256"]) == big
+    assert "hunter2" not in path.read_text(encoding="utf-8")
+
+
+def test_truncates_without_blob_storage(tmp_path):
+    path = tmp_path / "audit.log"
+    with AuditRecorder(path, durability=AuditDurability.sync, max_field_bytes=10) as recorder:
+        recorder.record("revit.list_levels", "req-1", {}, {"levels": ["L1", "L2", "L3"]})
+    entry = read_entries(path)[0]
+    assert len(entry["response"]["$truncated"]) == 10
+    assert entry["response"]["bytes"] > 10
+
+
+def test_rotation_compresses_segments_and_query_uses_index(tmp_path):
+    path = tmp_path / "audit.log"
+    with AuditRecorder(path, durability=AuditDurability.sync, rotate_bytes=300) as recorder:
+        for index in range(12):
+            tool = "revit.create_wall" if index % 3 == 0 else "revit.list_levels"
+            recorder.record(tool, f"req-{index}", {"index": index}, {"status": "ok"})
+    segments = rotated_segments(path)
+    assert segments and all(segment.name.endswith(".log.gz") for segment in segments)
+    assert all(index_path(segment).exists() for segment in segments)
+
+    walls = list(query_audit(path, tool="revit.create_wall"))
+    assert [entry["request_id"] for entry in walls] == ["req-0", "req-3", "req-6", "req-9"]
+    assert [entry["payload"]["index"] for entry in query_audit(path, request_id="req-7")] == [7]
+    assert len(list(query_audit(path, since="2000-01-01", limit=5))) == 5
+    assert not list(query_audit(path, since="2999-01-01"))
+
+
+def test_rotate_interval_counts_from_first_entry_across_restarts(tmp_path):
+    path = tmp_path / "audit.log"
+    with AuditRecorder(path, durability=AuditDurability.sync, rotate_interval=3600) as recorder:
+        recorder.record("revit.health", "req-old", {}, {})
+    with AuditRecorder(path, durability=AuditDurability.sync, rotate_interval=3600) as recorder:
+        recorder.record("revit.health", "req-recent", {}, {})
+    assert not rotated_segments(path)
+
+    # The first entry is now two hours old, as if the server had been restarted since
+    index = index_path(path)
+    first, *rest = index.read_text(encoding="utf-8").splitlines()
+    old = json.loads(first)
+    old["timestamp"] = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+    index.write_text("\n".join([json.dumps(old), *rest]) + "\n", encoding="utf-8")
+
+    with AuditRecorder(path, durability=AuditDurability.sync, rotate_interval=3600) as recorder:
+        recorder.record("revit.health", "req-new", {}, {})
+    assert len(rotated_segments(path)) == 1
+    assert [entry["request_id"] for entry in read_entries(path)] == ["req-new"]
+
+
+def test_audit_query_cli(tmp_path, capsys):
+    path = tmp_path / "audit.log"
+    with AuditRecorder(path, durability=AuditDurability.sync) as recorder:
+        recorder.record("revit.create_wall", "req-1", {}, {})
+        recorder.record("revit.health", "req-2", {}, {})
+    assert audit_main(["query", "--log", str(path), "--tool", "revit.create_wall"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["request_id"] for line in lines] == ["req-1"]
+
+
+def test_writer_survives_entries_it_cannot_serialize(tmp_path):
+    path = tmp_path / "audit.log"
+    recorder = AuditRecorder(path, max_queue=3, flush_interval=60)
+    circular: dict = {}
+    circular["self"] = circular
+    recorder.record("revit.export_pdf_by_sheet_set", "req-path", {"output_path": tmp_path}, {})
+    for index in range(5):
+        recorder.record("revit.health", f"bad-{index}", circular, {})
+    recorder.record("revit.health", "req-after", {}, {})
+    recorder.flush()
+    recorder.close()
+    entries = read_entries(path)
+    assert [entry["request_id"] for entry in entries] == ["req-path", "req-after"]
+    assert entries[0]["payload"] == {"output_path": str(tmp_path)}
+    assert recorder.dropped == 5
+
+
+def test_record_snapshots_entry_and_rejects_after_close(tmp_path):
+    path = tmp_path / "audit.log"
+    recorder = AuditRecorder(path, flush_interval=60)
+    payload = {"operations": [{"tool": "revit.health"}]}
+    recorder.record("revit.batch_execute", "req-1", payload, {})
+    payload["operations"][0]["payload"] = {"request_id": "req-1"}
+    payload["late"] = True
+    recorder.close()
+    assert read_entries(path)[0]["payload"] == {"operations": [{"tool": "revit.health"}]}
+
+    with pytest.raises(RuntimeError, match="closed"):
+        recorder.record("revit.health", "req-2", {}, {})
+    assert len(read_entries(path)) == 1
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.bridge import AsyncBridgeClient, BridgeClient
+from revit_mcp_server.bridge.standin import StandInBridge
+from revit_mcp_server.config import BridgeMode, Config
+from revit_mcp_server.errors import SchemaValidationError
+from revit_mcp_server.security.workspace import WorkspaceMonitor
+from revit_mcp_server.server import MCPServer
+from revit_mcp_server.tools import TOOL_HANDLERS
+
+
+def failing_executor(tool: str, payload: dict) -> dict:
+    if tool == "revit.delete_element":
+        raise RuntimeError("element is pinned")
+    if tool == "revit.create_floor":
+        return {"status": "error", "message": "boundary is not closed"}
+    return {"wall_id": payload.get("n", 0)}
+
+
+def test_call_batch_against_standin_bridge():
+    with StandInBridge(executor=failing_executor) as standin, BridgeClient(standin.url) as client:
+        client.initialize()
+        result = client.call_batch([
+            {"tool": "revit.create_wall", "payload": {"n": 1}},
+            {"tool": "revit.delete_element", "payload": {}},
+            {"tool": "revit.create_wall", "payload": {"n": 2}},
+        ])
+        assert standin.requests == 1
+    assert [entry["status"] for entry in result["results"]] == ["ok", "error", "ok"]
+    assert result["results"][0]["result"]["element_id"] == 1
+    assert result["results"][1]["message"] == "element is pinned"
+    assert (result["succeeded"], result["failed"], result["rolled_back"]) == (2, 1, False)
+
+
+def test_transactional_batch_stops_and_rolls_back():
+    with StandInBridge(executor=failing_executor) as standin, BridgeClient(standin.url) as client:
+        result = client.call_batch(
+            [
+                {"tool": "revit.delete_element", "payload": {}},
+                {"tool": "revit.create_wall", "payload": {}},
+            ],
+            transaction=True,
+        )
+    assert len(result["results"]) == 1
+    assert result["skipped"] == 1
+    assert result["rolled_back"] is True
+
+
+def test_reported_error_fails_the_operation():
+    with StandInBridge(executor=failing_executor) as standin, BridgeClient(standin.url) as client:
+        result = client.call_batch(
+            [
+                {"tool": "revit.create_wall", "payload": {}},
+                {"tool": "revit.create_floor", "payload": {}},
+            ],
+            transaction=True,
+        )
+    assert result["results"][1] == {
+        "index": 1, "tool": "revit.create_floor", "status": "error", "message": "boundary is not closed",
+    }
+    assert (result["succeeded"], result["failed"], result["rolled_back"]) == (1, 1, True)
+
+
+def test_batch_payload_rejects_nesting():
+    client = BridgeClient("http://unused")
+    with pytest.raises(SchemaValidationError):
+        client.call_batch([{"tool": "revit.batch_execute", "payload": {}}])
+
+
+def test_mock_mode_batch_handler(tmp_path):
+    handler = TOOL_HANDLERS["revit.batch_execute"]
+    response = handler(
+        {
+            "request_id": "batch-1",
+            "operations": [
+                {"tool": "revit.health"},
+                {"tool": "revit.export_quantities", "payload": {"output_path": str(tmp_path / "q.json")}},
+                {"tool": "revit.unknown"},
+            ],
+        },
+        WorkspaceMonitor([tmp_path]),
+    )
+    assert [entry["status"] for entry in response["results"]] == ["ok", "ok", "error"]
+    assert response["results"][1]["result"]["categories_exported"] == 5
+
+
+def test_mcp_batch_tool_translates_operations(monkeypatch):
+    calls = []
+
+    class Bridge:
+        async def call_batch(self, operations, *, transaction, stop_on_error):
+            calls.append((operations, transaction, stop_on_error))
+            return {"results": []}
+
+    monkeypatch.setattr(mcp_server, "bridge", Bridge())
+    asyncio.run(mcp_server.call_tool("revit_batch", {
+        "operations": [
+            {"tool": "revit_list_levels"},
+            {"tool": "revit_create_level", "arguments": {"name": "L3", "elevation": 20}},
+        ],
+        "transaction": True,
+    }))
+    assert calls == [(
+        [
+            {"tool": "revit.list_levels", "payload": {}},
+            {"tool": "revit.create_level", "payload": {"name": "L3", "elevation": 20}},
+        ],
+        True,
+        True,
+    )]
+
+
+def test_mcp_batch_tool_normalizes_element_ids(monkeypatch):
+    with StandInBridge(executor=failing_executor) as standin:
+        monkeypatch.setattr(mcp_server, "bridge", AsyncBridgeClient(standin.url))
+        content = asyncio.run(mcp_server.call_tool("revit_batch", {
+            "operations": [{"tool": "revit_create_wall", "arguments": {}}],
+        }))
+    assert '"element_id"' in content[0].text
+
+
+def test_forward_mode_validates_batch_without_running_it(tmp_path, monkeypatch):
+    ran, sent = [], []
+
+    class Bridge:
+        def send_tool(self, tool, payload):
+            sent.append(tool)
+            return {"results": []}
+
+    monkeypatch.setitem(TOOL_HANDLERS, "revit.health", lambda payload, workspace: ran.append(payload))
+    config = Config(
+        workspace_dir=tmp_path, allowed_directories=[tmp_path], audit_log=tmp_path / "audit.log",
+        bridge_url="http://bridge", mode=BridgeMode.bridge,
+    )
+    with MCPServer(config=config, bridge_factory=lambda _: Bridge()) as server:
+        server.handle_tool("revit.batch_execute", {
+            "request_id": "b1",
+            "operations": [{"tool": "revit.health"}, {"tool": "revit.create_wall", "payload": {}}],
+        })
+        assert ran == [] and sent == ["revit.batch_execute"]
+
+        with pytest.raises(SchemaValidationError, match="Batch operation 1"):
+            server.handle_tool("revit.batch_execute", {
+                "request_id": "b2",
+                "operations": [
+                    {"tool": "revit.health"},
+                    {"tool": "revit.export_quantities", "payload": {"output_path": str(tmp_path.parent / "q.json")}},
+                ],
+            })
+    assert sent == ["revit.batch_execute"]
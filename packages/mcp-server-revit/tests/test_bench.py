@@ -0,0 +1,49 @@
+import json
+
+from revit_mcp_server import bench, mcp_server
+from revit_mcp_server.config import get_config
+
+
+def test_suite_runs_selected_cases_and_restores_globals(tmp_path):
+    bridge, results = mcp_server.bridge, mcp_server.results
+    inline_limit = get_config().result_inline_limit
+    run = bench.run_suite(workspace=tmp_path, min_time=0.001, repeat=1, select="/small")
+    assert set(run["results"]) == {
+        "handlers.validate/small",
+        "registry.dispatch/small",
+        "workspace.check/small",
+        "server.handle_tool/small",
+        "mcp.call_tool/small",
+        "mcp.call_tool_spill/small",
+        "bridge.normalize/small",
+        "formatting.auto/small",
+        "formatting.table/small",
+    }
+    assert all(result["median_us"] > 0 for result in run["results"].values())
+    assert (mcp_server.bridge, mcp_server.results) == (bridge, results)
+    assert get_config().result_inline_limit == inline_limit
+
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    baseline = {"results": {"a/small": {"median_us": 10.0}, "b/small": {"median_us": 10.0}}}
+    current = {"results": {
+        "a/small": {"median_us": 11.0},
+        "b/small": {"median_us": 13.0},
+        "c/small": {"median_us": 1.0},
+    }}
+    rows = bench.compare(baseline, current, threshold=0.2)
+    assert [(row["case"], row["regressed"]) for row in rows] == [("a/small", False), ("b/small", True)]
+
+
+def test_main_writes_results_and_fails_on_regression(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    args = ["--select", "formatting.table/small", "--min-time", "0.001", "--repeat", "1", "--output", str(output)]
+    assert bench.main(args) == 0
+    saved = json.loads(output.read_text(encoding="utf-8"))
+    assert list(saved["results"]) == ["formatting.table/small"]
+
+    saved["results"]["formatting.table/small"]["median_us"] /= 100
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(saved), encoding="utf-8")
+    assert bench.main(args + ["--baseline", str(baseline)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
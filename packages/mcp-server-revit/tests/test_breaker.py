@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from revit_mcp_server.bridge import AsyncBridgeClient, BridgeClient, CircuitBreaker, RetryPolicy
+from revit_mcp_server.bridge.breaker import BreakerState
+from revit_mcp_server.bridge.policy import retry_is_safe
+from revit_mcp_server.errors import BridgeError, BridgeUnavailable
+
+NO_WAIT = RetryPolicy(base_delay=0)
+
+
+def test_breaker_transitions(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.state == BreakerState.closed
+    breaker.record_failure()
+    assert breaker.state == BreakerState.open and not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state == BreakerState.half_open
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == BreakerState.open and breaker.snapshot()["trips"] == 2
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.snapshot() == {
+        "state": "closed", "consecutive_failures": 0, "retry_in_seconds": 0.0, "trips": 2, "rejected": 2,
+    }
+
+
+def test_open_breaker_fails_fast(bridge_transport):
+    requests: list[httpx.Request] = []
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    transport = bridge_transport(requests, failures=None)
+    with BridgeClient("http://bridge", retry_policy=NO_WAIT, breaker=breaker, transport=transport) as client:
+        with pytest.raises(BridgeError, match="after 3 attempts"):
+            client.call_tool("revit.list_levels", {})
+        with pytest.raises(BridgeUnavailable, match="circuit breaker is open"):
+            client.call_tool("revit.list_levels", {})
+    assert len(requests) == 3
+
+
+def test_mutating_tools_retry_only_undelivered_requests(bridge_transport):
+    assert retry_is_safe("revit.list_levels", httpx.ReadTimeout("slow"))
+    assert retry_is_safe("revit.create_wall", httpx.ConnectError("refused"))
+    assert not retry_is_safe("revit.create_wall", httpx.ReadTimeout("slow"))
+
+    requests: list[httpx.Request] = []
+    transport = bridge_transport(requests, failures=None, error=httpx.ReadTimeout)
+    with BridgeClient("http://bridge", retry_policy=NO_WAIT, transport=transport) as client:
+        with pytest.raises(BridgeError, match="after 1 attempts"):
+            client.call_tool("revit.create_wall", {})
+        with pytest.raises(BridgeError, match="after 3 attempts"):
+            client.call_tool("revit.list_walls", {})
+    assert [json.loads(request.content)["tool"] for request in requests] == ["revit.create_wall"] + ["revit.list_walls"] * 3
+
+
+def test_retry_policy_jitter_and_tool_overrides():
+    policy = RetryPolicy(max_attempts=4, base_delay=1, max_delay=3)
+    delays = [policy.delay(attempt) for attempt in (0, 1, 2, 5) for _ in range(20)]
+    assert all(0 <= delay <= 3 for delay in delays)
+    assert len(set(delays)) > 1
+    assert policy.for_tool("revit.health").max_attempts == 1
+    assert policy.for_tool("revit.create_wall") is policy
+
+
+def test_lost_probe_expires(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow() and not breaker.allow()
+    clock.now = 20  # the probe never reported back
+    assert breaker.allow()
+
+
+def test_cancelled_probe_is_released(bridge_transport):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.5)
+    breaker.record_failure()
+    transport = bridge_transport(delays={"revit.list_levels": 60})
+
+    async def scenario() -> None:
+        async with AsyncBridgeClient("http://bridge", breaker=breaker, transport=transport) as client:
+            await asyncio.sleep(0.5)
+            probe = asyncio.create_task(client.call_tool("revit.list_levels", {}))
+            await asyncio.sleep(0.01)
+            assert breaker.state == BreakerState.half_open and not breaker.allow()
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+
+    asyncio.run(scenario())
+    assert breaker.state == BreakerState.half_open
+    assert breaker.allow()  # the next call may probe again
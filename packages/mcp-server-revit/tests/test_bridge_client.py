@@ -0,0 +1,47 @@
+import threading
+
+import httpx
+
+from revit_mcp_server.bridge import BridgeClient
+
+
+def test_client_reuses_one_pooled_connection(bridge_transport):
+    requests: list[httpx.Request] = []
+    client = BridgeClient("http://bridge", transport=bridge_transport(requests))
+    client.initialize()
+    first = client._http()
+    client.call_tool("revit.list_levels", {})
+    assert client._http() is first
+    assert [request.url.path for request in requests] == ["/health", "/tools", "/execute"]
+    client.close()
+
+
+def test_close_and_context_manager_lifecycle(bridge_transport):
+    with BridgeClient("http://bridge", transport=bridge_transport()) as client:
+        result = client.call_tool("revit.create_wall", {})
+        assert result["element_id"] == 7
+        assert not client.closed
+    assert client.closed
+    # A closed client reopens lazily on the next call.
+    client.call_tool("revit.create_wall", {})
+    assert not client.closed
+    client.close()
+
+
+def test_client_shared_across_threads(bridge_transport):
+    requests: list[httpx.Request] = []
+    client = BridgeClient("http://bridge", transport=bridge_transport(requests))
+    seen = []
+
+    def worker():
+        seen.append(id(client._http()))
+        client.call_tool("revit.create_wall", {})
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(seen)) == 1
+    assert len(requests) == 8
+    client.close()
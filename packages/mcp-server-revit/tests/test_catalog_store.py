@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import pytest
+
+from revit_mcp_server.bridge import AsyncBridgeClient, BridgeClient
+from revit_mcp_server.bridge.catalog_store import ToolCatalogStore, catalog_etag
+from revit_mcp_server.bridge.standin import StandInBridge
+from revit_mcp_server.errors import BridgeError
+
+TOOLS = ["revit.health", "revit.list_levels"]
+ETAG = catalog_etag(TOOLS)
+
+
+HEALTH = {"status": "healthy", "version": "1.0", "revit_version": "2025", "tools_hash": ETAG}
+
+
+def test_catalog_is_reused_when_health_hash_matches(tmp_path, bridge_transport):
+    store = ToolCatalogStore(tmp_path)
+    requests: list[httpx.Request] = []
+    with BridgeClient("http://bridge", catalog_store=store, transport=bridge_transport(requests, health=HEALTH, tools=TOOLS, etag=ETAG)) as client:
+        client.initialize()
+    assert [request.url.path for request in requests] == ["/health", "/tools"]
+
+    requests.clear()
+    with BridgeClient("http://bridge", catalog_store=store, transport=bridge_transport(requests, health=HEALTH, tools=TOOLS, etag=ETAG)) as client:
+        client.initialize()
+        assert client.tool_catalog == frozenset(TOOLS)
+    assert [request.url.path for request in requests] == ["/health"]
+
+
+def test_catalog_revalidates_with_etag_when_hash_unknown(tmp_path, bridge_transport):
+    store = ToolCatalogStore(tmp_path)
+    requests: list[httpx.Request] = []
+    transport = bridge_transport(requests, health={**HEALTH, "tools_hash": None}, tools=TOOLS, etag=ETAG)
+    for _ in range(2):
+        client = AsyncBridgeClient("http://bridge", catalog_store=store, transport=transport)
+        asyncio.run(client.initialize())
+        asyncio.run(client.aclose())
+        assert client.tool_catalog == frozenset(TOOLS)
+    assert "If-None-Match" not in requests[1].headers
+    assert requests[3].headers["If-None-Match"] == f'"{ETAG}"'
+
+
+def test_cache_is_keyed_by_bridge_and_revit_version(tmp_path, bridge_transport):
+    store = ToolCatalogStore(tmp_path)
+    requests: list[httpx.Request] = []
+    with BridgeClient("http://bridge", catalog_store=store, transport=bridge_transport(requests, health=HEALTH, tools=TOOLS, etag=ETAG)) as client:
+        client.initialize()
+    assert store.load("http://bridge", {"version": "1.0", "revit_version": "2025"}) is not None
+    assert store.load("http://bridge", {"version": "1.0", "revit_version": "2026"}) is None
+
+
+def test_unavailable_tool_error_does_not_list_catalog(bridge_transport):
+    requests: list[httpx.Request] = []
+    with BridgeClient("http://bridge", transport=bridge_transport(requests, health=HEALTH, tools=TOOLS, etag=ETAG)) as client:
+        client.initialize()
+        with pytest.raises(BridgeError, match=r"\(2 tools advertised\)"):
+            client.call_tool("revit.create_wall", {})
+
+
+def test_standin_serves_etag_and_tools_hash(tmp_path):
+    with StandInBridge(tools=TOOLS) as bridge:
+        store = ToolCatalogStore(tmp_path)
+        for _ in range(2):
+            with BridgeClient(bridge.url, catalog_store=store) as client:
+                client.initialize()
+                assert client.tool_catalog == frozenset(TOOLS)
+        response = httpx.get(f"{bridge.url}/tools", headers={"If-None-Match": f'"{ETAG}"'})
+        assert response.status_code == 304
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 from pathlib import Path
 
 from revit_mcp_server.config import Config
@@ -11,3 +13,9 @@ def test_config_reads_env(monkeypatch, tmp_path):
     cfg = Config()
     assert cfg.workspace_dir == tmp_path
     assert tmp_path in cfg.allowed_directories
+
+
+def test_config_import_does_not_load_security():
+    code = "import sys, revit_mcp_server.config; print(any(m.startswith('revit_mcp_server.security') for m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,31 @@
+import json
+
+from revit_mcp_server.formatting import ResponseEncoding, encode_result, tabulate
+
+ELEMENTS = {
+    "total": 3,
+    "elements": [
+        {"id": 1, "name": "Wall A", "level": "L1"},
+        {"id": 2, "name": "Wall B", "level": "L1"},
+        {"id": 3, "name": "Wall C"},
+    ],
+}
+
+
+def test_tabulate_lists_of_records():
+    table = tabulate(ELEMENTS)["elements"]
+    assert table["columns"] == ["id", "name", "level"]
+    assert table["rows"][2] == [3, "Wall C", None]
+    assert tabulate({"ids": [1, 2]}) == {"ids": [1, 2]}
+
+
+def test_encodings_round_trip():
+    assert json.loads(encode_result(ELEMENTS, "compact")) == ELEMENTS
+    assert json.loads(encode_result(ELEMENTS, ResponseEncoding.pretty)) == ELEMENTS
+    assert "\n" not in encode_result(ELEMENTS, "compact")
+    assert len(encode_result(ELEMENTS, "table")) < len(encode_result(ELEMENTS, "compact"))
+
+
+def test_auto_switches_to_compact_above_threshold():
+    assert "\n" in encode_result(ELEMENTS, "auto", compact_threshold=10_000)
+    assert "\n" not in encode_result(ELEMENTS, "auto", compact_threshold=20)
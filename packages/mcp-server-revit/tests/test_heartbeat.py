@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.bridge import AsyncBridgeClient, CircuitBreaker, ResultCache
+from revit_mcp_server.bridge.heartbeat import Heartbeat
+
+
+class FakeHealthClient:
+    def __init__(self) -> None:
+        self.responses: list = []
+        self.polls = 0
+
+    async def fetch_health(self) -> dict:
+        self.polls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def healthy(document: str = "Tower.rvt") -> dict:
+    return {"status": "healthy", "revit_version": "2025", "active_document": document, "uptime_seconds": 12.0}
+
+
+def test_subscribers_see_only_state_changes():
+    client = FakeHealthClient()
+    client.responses = [healthy(), healthy(), httpx.ConnectError("refused"), healthy("Podium.rvt")]
+    heartbeat = Heartbeat(client, interval=1)
+    changes = []
+    heartbeat.subscribe(lambda previous, current: changes.append(current.state))
+
+    async def scenario():
+        for _ in range(4):
+            await heartbeat.poll_once()
+
+    asyncio.run(scenario())
+    assert changes == [
+        (True, "Tower.rvt", "2025"),
+        (False, None, None),
+        (True, "Podium.rvt", "2025"),
+    ]
+    assert heartbeat.snapshot.recent_latency_ms and len(heartbeat.snapshot.recent_latency_ms) == 3
+
+
+def test_background_task_polls_until_stopped():
+    client = FakeHealthClient()
+    client.responses = [healthy() for _ in range(100)]
+    heartbeat = Heartbeat(client, interval=0.01)
+
+    async def scenario():
+        heartbeat.start()
+        await asyncio.sleep(0.05)
+        await heartbeat.stop()
+
+    asyncio.run(scenario())
+    assert client.polls >= 2
+    assert heartbeat.fresh_snapshot() is not None
+
+
+def test_revit_health_is_served_from_snapshot(monkeypatch):
+    client = FakeHealthClient()
+    client.responses = [healthy()]
+    heartbeat = Heartbeat(client, interval=5)
+    asyncio.run(heartbeat.poll_once())
+
+    class NoBridge:
+        async def call_tool(self, tool, payload):
+            raise AssertionError("revit_health should not reach /execute")
+
+    monkeypatch.setattr(mcp_server, "bridge", NoBridge())
+    monkeypatch.setattr(mcp_server, "heartbeat", heartbeat)
+    text = asyncio.run(mcp_server.call_tool("revit_health", {}))[0].text
+    assert '"source": "heartbeat"' in text and "Tower.rvt" in text
+
+
+def test_client_subscriber_updates_cache_and_breaker(bridge_transport):
+    transport = bridge_transport(health=healthy("Podium.rvt"), result=lambda tool: {"levels": [tool]})
+    cache = ResultCache()
+    cache.observe_document("Tower.rvt")
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    client = AsyncBridgeClient("http://bridge", result_cache=cache, breaker=breaker, transport=transport)
+    heartbeat = Heartbeat(client)
+    heartbeat.subscribe(client.observe_health)
+
+    async def scenario():
+        await heartbeat.poll_once()
+        await client.aclose()
+
+    asyncio.run(scenario())
+    assert breaker.state == "closed"
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,95 @@
+import asyncio
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.bridge.async_client import AsyncBridgeClient
+from revit_mcp_server.catalog import ToolCatalog
+from revit_mcp_server.tools import TOOL_REGISTRY
+
+
+class RecordingBridge:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    async def call_tool(self, tool: str, payload: dict) -> dict:
+        self.calls.append((tool, payload))
+        return {"ok": True}
+
+
+def test_registry_matches_advertised_tools():
+    tools = asyncio.run(mcp_server.list_tools())
+    assert {tool.name for tool in tools} == set(TOOL_REGISTRY)
+
+
+def test_call_tool_builds_only_requested_payload(monkeypatch):
+    bridge = RecordingBridge()
+    monkeypatch.setattr(mcp_server, "bridge", bridge)
+    asyncio.run(mcp_server.call_tool("revit_create_wall", {"start_x": 1, "end_x": 5, "end_y": 2}))
+    assert bridge.calls == [(
+        "revit.create_wall",
+        {
+            "start_point": {"x": 1, "y": 0, "z": 0},
+            "end_point": {"x": 5, "y": 2, "z": 0},
+            "height": 10,
+            "level": "L1",
+        },
+    )]
+
+
+def test_bridge_is_initialized_once_and_retried_after_failure(monkeypatch, bridge_transport):
+    requests = []
+    bridge = AsyncBridgeClient("http://bridge", transport=bridge_transport(requests, failures=1))
+    monkeypatch.setattr(mcp_server, "bridge", bridge)
+    monkeypatch.setattr(mcp_server, "initialized_bridge", None)
+
+    async def scenario():
+        first = await mcp_server.list_tools()
+        second = await mcp_server.list_tools()
+        await mcp_server.call_tool("revit_list_levels", {})
+        await bridge.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert {tool.name for tool in first} == set(TOOL_REGISTRY)
+    assert [tool.name for tool in second] == [
+        "revit_health", "revit_list_levels", "revit_fetch_result", "revit_server_stats",
+    ]
+    assert bridge.tool_catalog == {"revit.health", "revit.list_levels"}
+    assert [request.url.path for request in requests] == ["/health", "/health", "/tools", "/execute"]
+
+
+def test_call_tool_unknown_tool(monkeypatch):
+    bridge = RecordingBridge()
+    monkeypatch.setattr(mcp_server, "bridge", bridge)
+    content = asyncio.run(mcp_server.call_tool("revit_does_not_exist", {}))
+    assert "Unknown tool 'revit_does_not_exist'" in content[0].text
+    assert not bridge.calls
+
+
+def test_catalog_is_built_once():
+    catalog = ToolCatalog()
+    first = catalog.tools()
+    second = catalog.tools()
+    assert catalog.builds == 1
+    assert [tool.name for tool in first] == [tool.name for tool in second]
+    assert first[0] is second[0]
+
+
+def test_catalog_rebuilds_only_when_bridge_tools_change():
+    catalog = ToolCatalog()
+    assert len(catalog.tools(["revit.health", "revit.list_levels"])) == 4
+    assert len(catalog.tools(["revit.list_levels", "revit.health"])) == 4
+    assert catalog.builds == 1
+    names = [tool.name for tool in catalog.tools(["revit.health"])]
+    assert names == ["revit_health", "revit_fetch_result", "revit_server_stats"]
+    assert catalog.builds == 2
+
+
+def test_call_tool_honours_response_format(monkeypatch):
+    class ListingBridge:
+        async def call_tool(self, tool, payload):
+            return {"levels": [{"name": "L1", "elevation": 0}, {"name": "L2", "elevation": 10}]}
+
+    monkeypatch.setattr(mcp_server, "bridge", ListingBridge())
+    content = asyncio.run(mcp_server.call_tool("revit_list_levels", {"response_format": "table"}))
+    body = content[0].text.split("Result:\n", 1)[1]
+    assert body == '{"levels":{"columns":["name","elevation"],"rows":[["L1",0],["L2",10]]}}'
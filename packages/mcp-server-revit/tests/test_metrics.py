@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.bridge import AsyncBridgeClient, BridgeClient, RetryPolicy
+from revit_mcp_server.errors import BridgeError
+from revit_mcp_server.metrics import METRICS, Metrics
+
+
+def test_summary_quantiles_and_exposition(tmp_path):
+    metrics = Metrics()
+    tool_metrics = metrics.tool("bridge", "revit.list_levels")
+    for ms in range(1, 101):
+        tool_metrics.observe("total", ms / 1000)
+    tool_metrics.record(request_bytes=10, response_bytes=200)
+    tool_metrics.record(error=True)
+
+    latency = metrics.snapshot()["bridge"]["revit.list_levels"]
+    assert latency["calls"] == 2 and latency["error_rate"] == 0.5
+    assert latency["latency_ms"]["total"]["p50"] == 51.0
+    assert latency["latency_ms"]["total"]["p99"] == 100.0
+
+    text = metrics.prometheus()
+    assert 'revit_mcp_calls_total{layer="bridge",tool="revit.list_levels"} 2' in text
+    assert 'revit_mcp_latency_seconds{layer="bridge",tool="revit.list_levels",phase="total",quantile="0.95"} 0.096000' in text
+    assert 'revit_mcp_latency_seconds_count{layer="bridge",tool="revit.list_levels",phase="total"} 100' in text
+
+    path = tmp_path / "metrics" / "revit_mcp.prom"
+    metrics.dump(path)
+    assert path.read_text(encoding="utf-8") == text
+
+
+def _bridge_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"Status": "ok", "Result": {"levels": []}, "QueueMs": 4.0, "ExecuteMs": 6.0})
+
+
+def test_bridge_client_records_phases_bytes_and_retries():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return _bridge_response(request)
+
+    metrics = Metrics()
+    with BridgeClient(
+        "http://bridge", retry_policy=RetryPolicy(base_delay=0), metrics=metrics, transport=httpx.MockTransport(handler)
+    ) as client:
+        client.call_tool("revit.list_levels", {})
+
+    stats = metrics.snapshot()["bridge"]["revit.list_levels"]
+    assert stats["calls"] == 1 and stats["errors"] == 0 and stats["retries"] == 1
+    assert stats["request_bytes"] == len(attempts[-1].content)
+    assert stats["response_bytes"] > 0
+    assert stats["latency_ms"]["queue"]["p50"] == 4.0
+    assert stats["latency_ms"]["bridge"]["p50"] == 6.0
+    assert set(stats["latency_ms"]) == {"total", "queue", "bridge", "network"}
+
+
+def test_async_bridge_client_counts_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"Status": "error", "Message": "no document", "ExecuteMs": 1.0})
+
+    async def scenario(metrics):
+        async with AsyncBridgeClient("http://bridge", metrics=metrics, transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(BridgeError, match="no document"):
+                await client.call_tool("revit.list_levels", {})
+
+    metrics = Metrics()
+    asyncio.run(scenario(metrics))
+    stats = metrics.snapshot()["bridge"]["revit.list_levels"]
+    assert stats["calls"] == 1 and stats["errors"] == 1
+    assert stats["latency_ms"]["bridge"]["count"] == 1
+
+
+def test_server_stats_tool_reports_mcp_layer(monkeypatch):
+    class LevelsBridge:
+        async def call_tool(self, tool, payload):
+            return {"levels": []}
+
+    monkeypatch.setattr(mcp_server, "bridge", LevelsBridge())
+    METRICS.reset()
+    asyncio.run(mcp_server.call_tool("revit_list_levels", {}))
+    asyncio.run(mcp_server.call_tool("revit_does_not_exist", {}))
+
+    content = asyncio.run(mcp_server.call_tool("revit_server_stats", {}))
+    stats = json.loads(content[0].text.split("Result:\n", 1)[1])
+    levels = stats["tools"]["mcp"]["revit_list_levels"]
+    assert levels["calls"] == 1 and levels["errors"] == 0
+    assert set(levels["latency_ms"]) == {"total", "format"}
+    assert "revit_does_not_exist" not in stats["tools"]["mcp"]
@@ -0,0 +1,127 @@
+import pytest
+
+from revit_mcp_server.bridge import BridgeClient, MockBridge
+from revit_mcp_server.bridge.model import ELEMENT_ID_BASE, SimulatedModel
+from revit_mcp_server.bridge.paging import iter_elements
+from revit_mcp_server.bridge.standin import StandInBridge
+from revit_mcp_server.config import Config
+from revit_mcp_server.server import MCPServer
+
+
+@pytest.fixture(scope="module")
+def model():
+    return SimulatedModel.generate(20000, levels=4, seed=7)
+
+
+def test_generation_is_deterministic(model):
+    again = SimulatedModel.generate(20000, levels=4, seed=7)
+    assert model.category == again.category and model.bbox_size[0] == again.bbox_size[0]
+    assert SimulatedModel.generate(20000, levels=4, seed=8).category != model.category
+    assert model.list_levels({})["count"] == 4
+
+
+def test_elements_by_type_pages_and_filters(model):
+    walls = model.execute("revit.get_elements_by_type", {"category": "Walls", "level": "L2", "fields": ["level"]})
+    assert walls["returned"] == 200 and walls["truncated"]
+    assert all(set(element) == {"id", "level"} and element["level"] == "L2" for element in walls["elements"])
+
+    everything = model.execute("revit.get_elements_by_type", {"limit": 5000})
+    assert everything["limit"] == 500 and everything["total"] == 20000
+
+    with pytest.raises(ValueError, match="Unknown category"):
+        model.execute("revit.get_elements_by_type", {"category": "Spaceships"})
+
+
+def test_batch_set_updates_filtered_elements():
+    model = SimulatedModel.generate(5000, seed=1)
+    doors = model.execute("revit.list_elements_by_category", {"category": "Doors"})["count"]
+    result = model.execute("revit.batch_set_parameters_by_filter", {
+        "filter": {"category": "Doors"}, "parameter_name": "Mark", "value": "D-1",
+    })
+    assert result == {"success": True, "updated": doors, "failed": 0, "total": doors}
+
+    marked = model.execute("revit.get_elements_by_type", {"parameter_filter": {"name": "Mark", "value": "D-1"}})
+    assert marked["total"] == doors
+    element_id = marked["elements"][0]["id"]
+    assert model.execute("revit.get_parameter_value", {"element_id": element_id, "parameter_name": "Mark"})["value"] == "D-1"
+    with pytest.raises(ValueError, match="read-only"):
+        model.execute("revit.set_parameter_value", {"element_id": element_id, "parameter_name": "Area", "value": 1})
+
+
+def test_failed_transactional_batch_is_rolled_back():
+    model = SimulatedModel.generate(100, seed=3)
+    wall = {"start_point": {"x": 0, "y": 0}, "end_point": {"x": 10, "y": 0}, "level": "L1"}
+    operations = [
+        {"tool": "revit.create_wall", "payload": wall},
+        {"tool": "revit.create_level", "payload": {"name": "Roof", "elevation": 40}},
+        {"tool": "revit.set_parameter_value", "payload": {"element_id": ELEMENT_ID_BASE, "parameter_name": "Mark", "value": "M-1"}},
+        {"tool": "revit.get_element_bounding_box", "payload": {"element_id": 1}},
+    ]
+    walls = model.execute("revit.list_elements_by_category", {"category": "Walls"})["count"]
+
+    result = model.execute("revit.batch_execute", {"operations": operations, "transaction": True})
+    assert result["rolled_back"] and result["succeeded"] == 3
+    assert model.element_count == 100 and model.list_levels({})["count"] == 3
+    assert model.execute("revit.get_parameter_value", {"element_id": ELEMENT_ID_BASE, "parameter_name": "Mark"})["value"] == ""
+    assert model.execute("revit.list_elements_by_category", {"category": "Walls"})["count"] == walls
+
+    result = model.execute("revit.batch_execute", {"operations": operations, "stop_on_error": False})
+    assert not result["rolled_back"] and model.element_count == 101 and model.list_levels({})["count"] == 4
+
+
+def test_created_elements_are_queryable():
+    model = SimulatedModel.generate(100, seed=2)
+    walls = model.execute("revit.list_elements_by_category", {"category": "Walls"})["count"]
+    wall = model.execute("revit.create_wall", {
+        "start_point": {"x": 0, "y": 0}, "end_point": {"x": 30, "y": 40}, "height": 10, "level": "L1",
+    })
+    assert wall["wall_id"] == ELEMENT_ID_BASE + 100 and wall["length"] == 50
+    assert model.execute("revit.list_elements_by_category", {"category": "Walls"})["count"] == walls + 1
+    box = model.execute("revit.get_element_bounding_box", {"element_id": wall["wall_id"]})
+    assert box["max"] == {"x": 30, "y": 40, "z": 10}
+
+    with pytest.raises(ValueError, match="Level 'Roof' not found"):
+        model.execute("revit.create_floor", {"boundary_points": [{"x": 0, "y": 0}] * 3, "level": "Roof"})
+    sheet = model.execute("revit.create_sheet", {"number": "X-1", "name": "Plans"})
+    assert any(entry["sheet_number"] == "X-1" for entry in model.list_sheets({})["sheets"]) and sheet["is_placeholder"]
+
+
+def test_mock_mode_serves_the_model(tmp_path):
+    config = Config(
+        workspace_dir=tmp_path,
+        allowed_directories=[tmp_path],
+        audit_log=tmp_path / "audit.log",
+        mock_model_elements=1000,
+    )
+    with MCPServer(config) as server:
+        assert isinstance(server.bridge, MockBridge)
+        views = server.handle_tool("revit.list_views", {"request_id": "r1"})
+        assert views["count"] == len(server.bridge.model.views)
+        page = server.handle_tool("revit.get_elements_by_type", {"category": "Floors", "limit": 10})
+        assert page["returned"] == 10
+        # Tools the model does not implement keep their mock handlers
+        assert server.handle_tool("revit.health", {"request_id": "r2"})["status"]
+        with pytest.raises(ValueError, match="Unknown tool"):
+            server.handle_tool("revit.not_a_tool", {})
+
+
+def test_standin_pages_through_the_model():
+    model = SimulatedModel.generate(3000, seed=3)
+    with StandInBridge(executor=model.execute) as standin, BridgeClient(standin.url) as client:
+        elements = list(iter_elements(client, {"category": "Walls"}))
+    assert len(elements) == model.execute("revit.list_elements_by_category", {"category": "Walls"})["count"]
+
+
+def test_standin_rolls_back_failed_transactional_batch():
+    model = SimulatedModel.generate(100, seed=3)
+    wall = {"start_point": {"x": 0, "y": 0}, "end_point": {"x": 10, "y": 0}, "level": "L1"}
+    with StandInBridge(executor=model.execute) as standin, BridgeClient(standin.url) as client:
+        result = client.call_batch(
+            [
+                {"tool": "revit.create_wall", "payload": wall},
+                {"tool": "revit.get_element_bounding_box", "payload": {"element_id": 1}},
+            ],
+            transaction=True,
+        )
+    assert result["rolled_back"] and result["succeeded"] == 1
+    assert model.element_count == 100
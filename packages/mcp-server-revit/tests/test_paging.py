@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import httpx
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.bridge import AsyncBridgeClient, BridgeClient, ResultCache
+from revit_mcp_server.bridge.paging import decode_cursor
+
+
+def paged_elements(total: int, offsets: list[int]):
+    def page(payload: dict) -> dict:
+        offset, limit = payload["offset"], min(payload["limit"], 500)
+        offsets.append(offset)
+        ids = range(offset, min(offset + limit, total))
+        return {
+            "total": total,
+            "returned": len(ids),
+            "offset": offset,
+            "limit": limit,
+            "truncated": total > offset + limit,
+            "elements": [{"id": i, "category": payload["category"]} for i in ids],
+        }
+    return page
+
+
+def transport(page) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"Status": "ok", "Result": page(body["payload"])})
+    return httpx.MockTransport(handler)
+
+
+def test_iter_elements_streams_every_page_without_caching():
+    offsets: list[int] = []
+    client = BridgeClient(
+        "http://bridge", result_cache=ResultCache(), transport=transport(paged_elements(1234, offsets))
+    )
+    ids = [element["id"] for element in client.iter_elements({"category": "Walls"})]
+    assert ids == list(range(1234))
+    assert offsets == [0, 500, 1000]
+    assert client.result_cache.stats()["entries"] == 0
+    client.close()
+
+
+def test_iter_elements_stops_early():
+    offsets: list[int] = []
+    client = BridgeClient("http://bridge", transport=transport(paged_elements(100_000, offsets)))
+    first = list(client.iter_elements({"category": "Walls"}, page_size=100, max_elements=150))
+    assert len(first) == 150
+    # Current page plus at most one prefetched page beyond it.
+    assert len(offsets) <= 3
+    client.close()
+
+
+def test_iter_elements_stops_at_page_boundary():
+    offsets: list[int] = []
+    client = BridgeClient("http://bridge", transport=transport(paged_elements(100_000, offsets)))
+    assert len(list(client.iter_elements({"category": "Walls"}, page_size=100, max_elements=100))) == 100
+    assert len(list(client.iter_elements({"category": "Walls"}, page_size=100, max_elements=200))) == 200
+    client.close()
+
+    async def scenario():
+        client = AsyncBridgeClient("http://bridge", transport=transport(paged_elements(100_000, offsets)))
+        ids = [element["id"] async for element in client.iter_elements({"category": "Walls"}, page_size=100, max_elements=100)]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(scenario()) == list(range(100))
+    # No page is fetched or prefetched beyond the one that fills the budget.
+    assert offsets == [0, 0, 100, 0]
+
+
+def test_async_iter_elements():
+    offsets: list[int] = []
+
+    async def scenario():
+        client = AsyncBridgeClient("http://bridge", transport=transport(paged_elements(950, offsets)))
+        ids = [element["id"] async for element in client.iter_elements({"category": "Doors"}, page_size=400)]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(scenario()) == list(range(950))
+    assert offsets == [0, 400, 800]
+
+
+def test_mcp_tool_returns_resumable_cursor(monkeypatch):
+    offsets: list[int] = []
+    page = paged_elements(450, offsets)
+
+    class Bridge:
+        async def call_tool(self, tool, payload):
+            return page(payload)
+
+    monkeypatch.setattr(mcp_server, "bridge", Bridge())
+    text = asyncio.run(mcp_server.call_tool("revit_get_elements_by_type", {"category": "Walls", "limit": 300}))[0].text
+    result = json.loads(text.split("Result:\n", 1)[1])
+    filters, offset, limit = decode_cursor(result["next_cursor"])
+    assert (filters, offset, limit) == ({"category": "Walls"}, 300, 300)
+
+    text = asyncio.run(mcp_server.call_tool("revit_get_elements_by_type", {"cursor": result["next_cursor"]}))[0].text
+    result = json.loads(text.split("Result:\n", 1)[1])
+    assert result["returned"] == 150
+    assert "next_cursor" not in result
+    assert offsets == [0, 300]
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+
+from revit_mcp_server import replay
+from revit_mcp_server.bridge.standin import StandInBridge, ToolBehavior
+from revit_mcp_server.security.audit import AuditRecorder
+
+
+def write_log(path, entries):
+    with path.open("w", encoding="utf-8") as fh:
+        for seconds, tool, payload in entries:
+            fh.write(json.dumps({
+                "timestamp": f"2026-10-01T12:00:{seconds:06.3f}+00:00",
+                "tool": tool,
+                "request_id": "r",
+                "payload": payload,
+                "response": {},
+            }) + "\n")
+
+
+def test_load_calls_reads_blobs_and_skips_truncated(tmp_path):
+    log = tmp_path / "audit.log"
+    big = {"request_id": "big", "rows": ["x" * 50] * 10}
+    with AuditRecorder(log, max_field_bytes=200, blob_dir=tmp_path / "audit-blobs") as recorder:
+        recorder.record("revit.health", "a", {"request_id": "a"}, {})
+        recorder.record("revit.export_report", "big", big, {})
+    with AuditRecorder(tmp_path / "other.log", max_field_bytes=200) as recorder:
+        recorder.record("revit.export_report", "big", big, {})
+
+    calls, skipped = replay.load_calls(log)
+    assert [call.tool for call in calls] == ["revit.health", "revit.export_report"]
+    assert calls[1].payload == big and skipped == 0
+    assert replay.load_calls(tmp_path / "other.log") == ([], 1)
+
+
+def test_replay_preserves_scaled_timing(tmp_path):
+    log = tmp_path / "audit.log"
+    write_log(log, [(0, "a", {}), (0.4, "b", {}), (0.2, "a", {})])
+    calls, _ = replay.load_calls(log)
+    assert [call.offset for call in calls] == [0, 0.2, 0.4]
+
+    seen = []
+    started = time.perf_counter()
+    report = replay.replay(calls, lambda tool, payload: seen.append(time.perf_counter() - started), speed=2)
+    assert seen[1] >= 0.1 and seen[2] >= 0.2
+    assert report["overall"]["calls"] == 3 and report["tools"]["a"]["calls"] == 2
+
+    seen.clear()
+    replay.replay(calls, lambda tool, payload: seen.append(time.perf_counter() - started), speed=0)
+    assert len(seen) == 3
+
+
+def test_replay_bounds_concurrency_and_counts_errors():
+    calls = [replay.ReplayCall(0.0, "revit.fail" if n % 4 == 0 else "revit.ok", {}, "") for n in range(12)]
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def target(tool, payload):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        if tool == "revit.fail":
+            raise RuntimeError("boom")
+
+    report = replay.replay(calls, target, speed=0, concurrency=3)
+    assert peak[0] == 3
+    assert report["overall"]["errors"] == 3 and report["tools"]["revit.fail"]["error_rate"] == 1.0
+    assert report["top_errors"] == [{"message": "RuntimeError: boom", "count": 3}]
+    assert report["overall"]["latency_ms"]["p50"] >= 10
+
+
+def test_main_replays_against_standin_bridge(tmp_path, capsys):
+    log = tmp_path / "audit.log"
+    write_log(log, [(n / 100, "revit.list_views", {"request_id": f"r{n}"}) for n in range(5)])
+    output = tmp_path / "report.json"
+    with StandInBridge(behavior=ToolBehavior(latency_ms=5)) as standin:
+        args = ["--log", str(log), "--speed", "0", "--bridge-url", standin.url, "--output", str(output)]
+        assert replay.main(args) == 0
+        # Repeated reads are served by the client's result cache, as in production
+        assert 1 <= standin.stats()["executed"] <= 5
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["overall"]["calls"] == 5 and report["overall"]["errors"] == 0
+    assert "revit.list_views" in capsys.readouterr().out
+
+    # Mock mode needs no bridge; the report compares against the bridge run
+    assert replay.main(["--log", str(log), "--speed", "0", "--baseline", str(output)]) == 0
+    assert "overall" in capsys.readouterr().out.split("\n\n")[-1]
@@ -0,0 +1,64 @@
+import httpx
+
+from revit_mcp_server.bridge import BridgeClient, ResultCache
+from revit_mcp_server.bridge.policy import is_cacheable, is_mutating
+
+
+def test_policy_classification():
+    assert is_cacheable("revit.list_levels")
+    assert is_cacheable("revit.get_type_parameters")
+    assert not is_cacheable("revit.get_selection")
+    assert is_mutating("revit.create_wall")
+    assert is_mutating("revit.sync_to_central")
+    assert not is_mutating("revit.export_image")
+    assert not is_mutating("revit.list_views")
+
+
+def test_lookup_ignores_request_id_and_key_order():
+    cache = ResultCache()
+    cache.store("revit.list_elements_by_category", {"category": "Walls", "a": 1}, {"n": 1}, cache.generation)
+    hit, value = cache.lookup("revit.list_elements_by_category", {"a": 1, "category": "Walls", "request_id": "x"})
+    assert hit and value == {"n": 1}
+
+
+def test_ttl_and_lru_bounds(clock):
+    cache = ResultCache(max_entries=2, ttl=10, clock=clock)
+    for tool in ("revit.list_levels", "revit.list_views", "revit.list_sheets"):
+        cache.store(tool, {}, {"tool": tool}, cache.generation)
+    assert cache.lookup("revit.list_levels", {}) == (False, None)
+    assert cache.lookup("revit.list_sheets", {})[0]
+    clock.now = 11
+    assert cache.lookup("revit.list_sheets", {}) == (False, None)
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+def test_mutation_and_document_change_invalidate():
+    cache = ResultCache()
+    cache.store("revit.list_levels", {}, {"levels": []}, cache.generation)
+    stale_generation = cache.generation
+    cache.store("revit.create_level", {"name": "L3"}, {"level_id": 9}, cache.generation)
+    assert cache.lookup("revit.list_levels", {}) == (False, None)
+    # A read that began before the mutation must not repopulate the cache.
+    cache.store("revit.list_levels", {}, {"levels": []}, stale_generation)
+    assert cache.lookup("revit.list_levels", {}) == (False, None)
+
+    cache.observe_document("A.rvt")
+    cache.store("revit.list_levels", {}, {"levels": []}, cache.generation)
+    cache.store("revit.health", {}, {"active_document": "B.rvt"}, cache.generation)
+    assert cache.lookup("revit.list_levels", {}) == (False, None)
+
+
+def test_client_serves_repeated_reads_from_cache(bridge_transport):
+    executed: list[httpx.Request] = []
+    transport = bridge_transport(executed, result=lambda tool: {"levels": ["L1"]})
+    client = BridgeClient("http://bridge", result_cache=ResultCache(), transport=transport)
+    client.call_tool("revit.list_levels", {})
+    client.call_tool("revit.list_levels", {})
+    assert len(executed) == 1
+    client.call_tool("revit.create_level", {"name": "L2"})
+    client.call_tool("revit.list_levels", {})
+    assert len(executed) == 3
+    assert client.result_cache.stats()["hits"] == 1
+    client.close()
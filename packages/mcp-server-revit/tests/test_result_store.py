@@ -0,0 +1,119 @@
+import asyncio
+import threading
+
+import pytest
+
+from revit_mcp_server import mcp_server
+from revit_mcp_server.config import get_config
+from revit_mcp_server.errors import ResultExpired, SchemaValidationError
+from revit_mcp_server.results import ResultStore, resolve_path, summarize
+
+RESULT = {"count": 3, "elements": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}, {"id": 3, "name": "C"}]}
+
+
+def test_resolve_path():
+    assert resolve_path(RESULT, None) is RESULT
+    assert resolve_path(RESULT, "$.elements[1].name") == "B"
+    assert resolve_path(RESULT, "elements.2.id") == 3
+    with pytest.raises(SchemaValidationError):
+        resolve_path(RESULT, "$.elements[9]")
+
+
+def test_summarize_reports_shape():
+    assert summarize(RESULT) == {"count": 3, "elements": "list[3]"}
+
+
+def test_fetch_pages_through_list(tmp_path):
+    store = ResultStore(tmp_path)
+    handle = store.put("revit_list_elements", RESULT, 100)
+    page = store.fetch(handle, path="$.elements", offset=0, limit=2)
+    assert page["items"] == RESULT["elements"][:2]
+    assert page["total"] == 3 and page["next_offset"] == 2
+    last = store.fetch(handle, path="$.elements", offset=2, limit=2)
+    assert last["returned"] == 1 and "next_offset" not in last
+    assert store.fetch(handle, path="count")["value"] == 3
+    with pytest.raises(SchemaValidationError, match="offset"):
+        store.fetch(handle, path="$.elements", offset=-1)
+
+
+def test_spills_to_disk_over_memory_budget(tmp_path):
+    store = ResultStore(tmp_path, memory_budget=150)
+    first = store.put("a", {"n": 1}, 100)
+    second = store.put("b", {"n": 2}, 100)
+    assert store.stats()["spilled"] == 1
+    assert (tmp_path / f"{first}.json").exists()
+    assert store.get(first) == {"n": 1}
+    assert store.get(second) == {"n": 2}
+
+
+def test_evicted_handle_expires(tmp_path):
+    store = ResultStore(tmp_path, memory_budget=0, max_entries=1)
+    first = store.put("a", {"n": 1}, 10)
+    store.put("b", {"n": 2}, 10)
+    assert not (tmp_path / f"{first}.json").exists()
+    with pytest.raises(ResultExpired):
+        store.get(first)
+
+
+def test_spill_file_removed_during_get_expires(tmp_path):
+    store = ResultStore(tmp_path, memory_budget=0)
+    first = store.put("a", {"n": 1}, 10)
+    store.put("b", {"n": 2}, 10)
+    # As if a concurrent eviction unlinked it after get released the lock
+    (tmp_path / f"{first}.json").unlink()
+    with pytest.raises(ResultExpired):
+        store.get(first)
+
+
+def test_close_removes_spill_files(tmp_path):
+    spill_dir = tmp_path / "results"
+    store = ResultStore(spill_dir, memory_budget=0)
+    handles = [store.put("a", {"n": n}, 10) for n in range(3)]
+    assert len(list(spill_dir.iterdir())) == 2
+    store.close()
+    assert not spill_dir.exists()
+    assert store.stats()["entries"] == 0
+    with pytest.raises(ResultExpired):
+        store.get(handles[-1])
+
+
+class LargeResultBridge:
+    async def call_tool(self, tool: str, payload: dict) -> dict:
+        return {"elements": [{"id": index} for index in range(1000)]}
+
+
+def test_oversized_result_returns_handle(monkeypatch, tmp_path):
+    store = ResultStore(tmp_path)
+    monkeypatch.setattr(mcp_server, "bridge", LargeResultBridge())
+    monkeypatch.setattr(mcp_server, "results", store)
+    monkeypatch.setattr(get_config(), "result_inline_limit", 1000)
+    text = asyncio.run(mcp_server.call_tool("revit_list_elements", {"category": "Walls"}))[0].text
+    assert "list[1000]" in text
+    handle = next(iter(store._entries))
+    page = asyncio.run(mcp_server.call_tool("revit_fetch_result", {"handle": handle, "path": "$.elements", "offset": 10, "limit": 2}))
+    assert '"id": 10' in page[0].text and '"next_offset": 12' in page[0].text
+
+
+def test_spill_runs_off_the_event_loop(monkeypatch, tmp_path):
+    store = ResultStore(tmp_path, memory_budget=0)
+    loop_threads = []
+    spill = store._spill
+
+    def spill_recording_thread(handle, entry):
+        loop_threads.append(threading.get_ident())
+        spill(handle, entry)
+
+    monkeypatch.setattr(store, "_spill", spill_recording_thread)
+    monkeypatch.setattr(mcp_server, "bridge", LargeResultBridge())
+    monkeypatch.setattr(mcp_server, "results", store)
+    monkeypatch.setattr(get_config(), "result_inline_limit", 1000)
+
+    async def call_twice():
+        for _ in range(2):
+            await mcp_server.call_tool("revit_list_elements", {"category": "Walls"})
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(call_twice())
+    assert store.stats()["spilled"] == 1 and loop_threads and loop_thread not in loop_threads
+    error = asyncio.run(mcp_server.call_tool("revit_fetch_result", {"handle": next(iter(store._entries)), "offset": -5}))
+    assert "offset must be >= 0" in error[0].text
@@ -1,3 +1,7 @@
+import io
+import json
+import threading
+import time
 from pathlib import Path
 
 from revit_mcp_server.config import BridgeMode, Config
@@ -37,3 +41,106 @@ def test_handle_tool_bridge_mode(tmp_path: Path):
     response = server.handle_tool("revit.health", {"request_id": "req-bridge"})
     assert response["echo"] == "revit.health"
     assert bridge.calls
+
+
+class SlowBridge:
+    """Sleeps for requests whose ID starts with ``slow`` and tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def send_tool(self, tool_name: str, payload: dict) -> dict:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.2 if payload["request_id"].startswith("slow") else 0.01)
+        with self.lock:
+            self.active -= 1
+        return {"echo": payload["request_id"]}
+
+
+def run_lines(tmp_path: Path, request_ids: list[str], **options) -> tuple[list[dict], SlowBridge, MCPServer]:
+    cfg = create_config(tmp_path, bridge_url="http://bridge", mode=BridgeMode.bridge)
+    bridge = SlowBridge()
+    server = MCPServer(config=cfg, bridge_factory=lambda _: bridge)
+    requests = "".join(
+        json.dumps({"tool": "revit.health", "payload": {"request_id": request_id}}) + "\n"
+        for request_id in request_ids
+    )
+    stdout = io.StringIO()
+    server.run(stdin=io.StringIO(requests + "\n"), stdout=stdout, **options)
+    lines = stdout.getvalue().splitlines()[1:]
+    return [json.loads(line) for line in lines], bridge, server
+
+
+def test_run_answers_out_of_order_and_drains_on_eof(tmp_path: Path):
+    responses, bridge, server = run_lines(tmp_path, ["slow-1", "fast-1", "fast-2"], workers=4)
+    assert [response["request_id"] for response in responses][-1] == "slow-1"
+    assert {response["response"]["echo"] for response in responses} == {"slow-1", "fast-1", "fast-2"}
+    assert bridge.peak >= 2
+    server.close()
+    assert len((tmp_path / "audit.log").read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_run_ordered_mode_keeps_input_order(tmp_path: Path):
+    request_ids = ["slow-1", "fast-1", "fast-2", "slow-2", "fast-3"]
+    responses, _, server = run_lines(tmp_path, request_ids, workers=4, ordered=True)
+    assert [response["request_id"] for response in responses] == request_ids
+    server.close()
+
+
+def test_run_bounds_requests_in_flight(tmp_path: Path):
+    responses, bridge, server = run_lines(tmp_path, [f"fast-{n}" for n in range(20)], workers=8, max_in_flight=2)
+    assert len(responses) == 20 and bridge.peak <= 2
+    server.close()
+
+
+def test_run_tags_errors_with_request_id(tmp_path: Path):
+    server = MCPServer(config=create_config(tmp_path))
+    stdout = io.StringIO()
+    server.run(stdin=io.StringIO('{"tool": "revit.nope", "request_id": "r9"}\nnot json\n'), stdout=stdout)
+    first, second = (json.loads(line) for line in stdout.getvalue().splitlines()[1:])
+    assert first["request_id"] == "r9" and "Unknown tool" in first["response"]["message"]
+    assert second["tool"] is None and second["response"]["status"] == "error"
+    server.close()
+
+
+def test_run_survives_a_failed_response(tmp_path: Path, monkeypatch):
+    cfg = create_config(tmp_path, bridge_url="http://bridge", mode=BridgeMode.bridge)
+    server = MCPServer(config=cfg, bridge_factory=lambda _: SlowBridge())
+    respond = server._respond
+
+    def flaky(line: str) -> str:
+        if "fast-1" in line:
+            raise RuntimeError("boom")
+        return respond(line)
+
+    monkeypatch.setattr(server, "_respond", flaky)
+    requests = "".join(
+        json.dumps({"tool": "revit.health", "payload": {"request_id": request_id}}) + "\n"
+        for request_id in ["slow-1", "fast-1", "fast-2", "fast-3"]
+    )
+    stdout = io.StringIO()
+    server.run(stdin=io.StringIO(requests), stdout=stdout, workers=4, max_in_flight=2, ordered=True)
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()[1:]]
+    assert [response["request_id"] for response in responses] == ["slow-1", "fast-1", "fast-2", "fast-3"]
+    assert responses[1]["response"] == {"status": "error", "message": "boom"}
+    server.close()
+
+
+def test_run_answers_unserializable_results_with_an_error(tmp_path: Path):
+    server = MCPServer(config=create_config(tmp_path))
+    server.handlers = {**server.handlers, "revit.health": lambda payload, workspace: {"value": {1, 2}}}
+    requests = "".join(
+        json.dumps({"tool": tool, "payload": {"request_id": request_id}}) + "\n"
+        for tool, request_id in [("revit.health", "bad"), ("revit.list_views", "good")]
+    )
+    stdout = io.StringIO()
+    server.run(stdin=io.StringIO(requests), stdout=stdout, workers=2)
+    responses = {response["request_id"]: response for response in map(json.loads, stdout.getvalue().splitlines()[1:])}
+    assert responses["bad"]["tool"] == "revit.health" and responses["bad"]["response"]["status"] == "error"
+    assert "serialized" in responses["bad"]["response"]["message"]
+    assert responses["good"]["response"]["views"]
+    server.close()
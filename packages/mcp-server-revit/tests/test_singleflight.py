@@ -0,0 +1,76 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+
+from revit_mcp_server.bridge import AsyncBridgeClient, BridgeClient
+from revit_mcp_server.bridge.singleflight import SingleFlight
+
+
+def test_threads_share_one_execution():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(2)
+        return {"walls": 3}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("k", slow))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 2
+    while flights.stats()["shared"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{"walls": 3}] * 5
+
+
+def test_sync_client_does_not_coalesce_mutations(bridge_transport):
+    requests: list[httpx.Request] = []
+    gate = threading.Barrier(4)
+    client = BridgeClient("http://bridge", transport=bridge_transport(requests))
+
+    def worker():
+        gate.wait()
+        client.call_tool("revit.create_wall", {"level": "L1"})
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [json.loads(request.content)["tool"] for request in requests] == ["revit.create_wall"] * 4
+    client.close()
+
+
+def test_async_client_coalesces_identical_reads(bridge_transport):
+    requests: list[httpx.Request] = []
+    transport = bridge_transport(
+        requests, result=lambda tool: {"count": 2}, delays={"revit.list_elements_by_category": 0.05}
+    )
+
+    async def scenario():
+        client = AsyncBridgeClient("http://bridge", transport=transport)
+        results = await asyncio.gather(
+            *(client.call_tool("revit.list_elements_by_category", {"category": "Walls"}) for _ in range(5)),
+            client.call_tool("revit.list_elements_by_category", {"category": "Doors"}),
+        )
+        await client.aclose()
+        return results, client.single_flight.stats()
+
+    results, stats = asyncio.run(scenario())
+    executed = [json.loads(request.content) for request in requests]
+    assert sorted((body["tool"], body["payload"]["category"]) for body in executed) == [
+        ("revit.list_elements_by_category", "Doors"),
+        ("revit.list_elements_by_category", "Walls"),
+    ]
+    assert all(result == {"count": 2} for result in results)
+    assert stats["shared"] == 4
@@ -0,0 +1,55 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from revit_mcp_server.bridge import BridgeClient, RetryPolicy
+from revit_mcp_server.bridge.standin import StandInBridge, ToolBehavior
+from revit_mcp_server.errors import BridgeError
+from revit_mcp_server.metrics import Metrics
+
+NO_WAIT = RetryPolicy(base_delay=0)
+
+
+def test_commands_run_one_at_a_time():
+    behavior = ToolBehavior(latency_ms=40)
+    metrics = Metrics()
+    with StandInBridge(behavior=behavior) as standin, BridgeClient(standin.url, coalesce_reads=False, metrics=metrics) as client:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda n: client.call_tool("revit.create_wall", {"n": n}), range(4)))
+        elapsed = time.perf_counter() - started
+        stats = standin.stats()
+
+    assert elapsed >= 0.16
+    assert stats["executed"] == 4 and stats["max_queue_depth"] >= 2
+    latency = metrics.snapshot()["bridge"]["revit.create_wall"]["latency_ms"]
+    assert latency["bridge"]["p50"] >= 40
+    assert latency["queue"]["p99"] >= 40  # the last command waited behind the others
+
+
+def test_queue_timeout_matches_command_queue():
+    with StandInBridge(behavior=ToolBehavior(latency_ms=300), timeout_ms=50) as standin, BridgeClient(standin.url) as client:
+        with pytest.raises(BridgeError, match="timed out after 50ms"):
+            client.call_tool("revit.create_wall", {})
+        assert standin.stats()["timeouts"] == 1
+
+
+def test_injected_failures_are_bridge_errors():
+    behaviors = {"revit.delete_element": ToolBehavior(error_rate=1.0)}
+    with StandInBridge(tool_behaviors=behaviors) as standin, BridgeClient(standin.url) as client:
+        assert client.call_tool("revit.create_wall", {})["tool"] == "revit.create_wall"
+        with pytest.raises(BridgeError, match="Injected failure in revit.delete_element"):
+            client.call_tool("revit.delete_element", {})
+        assert standin.stats()["failed"] == 1
+
+
+@pytest.mark.parametrize("tool, executed", [("revit.list_levels", 3), ("revit.create_wall", 1)])
+def test_dropped_replies_are_retried_only_when_safe(tool, executed):
+    with StandInBridge(behavior=ToolBehavior(drop_rate=1.0)) as standin, \
+            BridgeClient(standin.url, retry_policy=NO_WAIT, result_cache=None) as client:
+        with pytest.raises(BridgeError, match=f"after {executed} attempts"):
+            client.call_tool(tool, {})
+        stats = standin.stats()
+    # A dropped reply still ran the command, so a mutation must not be resent
+    assert stats["executed"] == stats["dropped"] == executed
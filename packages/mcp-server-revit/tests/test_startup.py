@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+# Self time of revit_mcp_server's own modules on the path to the first
+# tools/list. Measured around 30 ms; third-party imports (mcp, pydantic) are
+# excluded because this package cannot make them cheaper.
+IMPORT_BUDGET_US = 150_000
+
+# Only needed by the stdio server or by the first bridge call.
+DEFERRED_MODULES = (
+    "revit_mcp_server.server",
+    "revit_mcp_server.schemas",
+    "revit_mcp_server.tools.handlers",
+    "revit_mcp_server.bridge.client",
+    "revit_mcp_server.bridge.async_client",
+)
+
+FIRST_LIST_TOOLS = """
+import asyncio, sys
+import revit_mcp_server.mcp_server as server
+tools = asyncio.run(server.list_tools())
+print(len(tools), *sorted(name for name in sys.modules if name.startswith("revit_mcp_server")))
+"""
+
+
+def run_python(code: str, *flags: str, **env: str) -> subprocess.CompletedProcess:
+    environ = {key: value for key, value in os.environ.items() if not key.startswith("MCP_REVIT_")}
+    environ.update(env)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, env=environ, check=True
+    )
+
+
+def test_import_has_no_config_side_effects():
+    # Would raise a pydantic ValidationError if Config() were still built on import.
+    run_python("import revit_mcp_server, revit_mcp_server.mcp_server")
+
+
+def test_first_list_tools_import_budget(tmp_path):
+    completed = run_python(
+        FIRST_LIST_TOOLS,
+        "-X", "importtime",
+        MCP_REVIT_WORKSPACE_DIR=str(tmp_path),
+        MCP_REVIT_ALLOWED_DIRECTORIES=str(tmp_path),
+    )
+    count, *loaded = completed.stdout.split()
+    assert int(count) > 100
+    assert not set(DEFERRED_MODULES) & set(loaded)
+
+    own_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if name.strip().startswith("revit_mcp_server") and self_us.strip().isdigit():
+            own_us += int(self_us)
+    assert own_us < IMPORT_BUDGET_US, f"revit_mcp_server imports took {own_us / 1000:.1f} ms"
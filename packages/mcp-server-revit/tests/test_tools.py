@@ -1,7 +1,9 @@
 from pathlib import Path
 
 from revit_mcp_server.security.workspace import WorkspaceMonitor
+from revit_mcp_server.bridge.batch import BATCH_TOOL
 from revit_mcp_server.tools import TOOL_HANDLERS
+from revit_mcp_server.tools.handlers import TOOL_INPUTS
 
 
 def test_all_handlers_registered():
@@ -10,6 +12,12 @@ def test_all_handlers_registered():
     assert len(TOOL_HANDLERS) >= 25
 
 
+def test_every_handler_declares_its_input():
+    # A handler missing here would let batch validation skip its path checks
+    assert TOOL_INPUTS.keys() == TOOL_HANDLERS.keys() - {BATCH_TOOL}
+    assert TOOL_INPUTS["revit.export_pdf_by_sheet_set"][1] == ("csv_path",)
+
+
 def test_export_quantities_uses_workspace(tmp_path):
     workspace = WorkspaceMonitor([tmp_path])
     handler = TOOL_HANDLERS["revit.export_quantities"]
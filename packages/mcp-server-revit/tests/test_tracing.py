@@ -0,0 +1,77 @@
+import json
+
+import httpx
+import pytest
+
+from revit_mcp_server.bridge import BridgeClient
+from revit_mcp_server.security.audit import AuditDurability, AuditRecorder
+from revit_mcp_server.tracing import NOOP_SPAN, TRACER, Tracer, current_trace_id
+
+
+@pytest.fixture
+def traced(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    TRACER.configure(path)
+    yield path
+    TRACER.configure(None)
+
+
+def read_spans(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_disabled_tracer_yields_noop_and_writes_nothing(tmp_path):
+    tracer = Tracer()
+    with tracer.span("root") as span:
+        assert span is NOOP_SPAN
+        with tracer.span("child") as child:
+            assert child is NOOP_SPAN
+    assert current_trace_id() is None
+
+
+def test_unsampled_root_suppresses_descendants(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer(path, sample_rate=0.5, sampler=lambda: 0.9)
+    with tracer.span("root"):
+        with tracer.span("child") as child:
+            assert child is NOOP_SPAN
+    assert not path.exists()
+
+
+def test_spans_nest_and_record_errors(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer(path)
+    with tracer.span("root", tool="revit_health") as root:
+        with pytest.raises(ValueError):
+            with tracer.span("child"):
+                raise ValueError("boom")
+    tracer.close()
+
+    child, parent = read_spans(path)
+    assert parent["name"] == "root" and parent["ph"] == "X" and parent["args"]["tool"] == "revit_health"
+    assert child["args"]["trace_id"] == parent["args"]["trace_id"] == root.trace_id
+    assert child["args"]["parent_id"] == parent["args"]["span_id"]
+    assert child["args"]["status"] == "error" and child["args"]["error"] == "ValueError: boom"
+
+
+def test_trace_id_reaches_bridge_and_audit(traced, tmp_path, bridge_transport):
+    requests: list[httpx.Request] = []
+    audit = AuditRecorder(tmp_path / "audit.log", durability=AuditDurability.sync)
+    with TRACER.span("request") as root:
+        with BridgeClient("http://bridge", transport=bridge_transport(requests)) as client:
+            client.call_tool("revit.create_wall", {})
+        audit.record("revit.create_wall", "req-1", {}, {})
+    audit.close()
+
+    assert json.loads(requests[0].content)["trace_id"] == root.trace_id
+    entry = json.loads((tmp_path / "audit.log").read_text(encoding="utf-8"))
+    assert entry["trace_id"] == root.trace_id
+    names = [span["name"] for span in read_spans(traced)]
+    assert names == ["bridge.http", "bridge.normalize", "bridge.execute", "audit.record", "request"]
+
+
+def test_untraced_bridge_request_has_no_trace_id(bridge_transport):
+    requests: list[httpx.Request] = []
+    with BridgeClient("http://bridge", transport=bridge_transport(requests)) as client:
+        client.call_tool("revit.create_wall", {})
+    assert "trace_id" not in json.loads(requests[0].content)
@@ -0,0 +1,41 @@
+import pytest
+
+from revit_mcp_server.errors import WorkspaceViolation
+from revit_mcp_server.security.workspace import WorkspaceMonitor
+
+
+def test_allows_nested_paths_and_rejects_siblings(tmp_path):
+    roots = [tmp_path / "a", tmp_path / "b" / "c"]
+    for root in roots:
+        root.mkdir(parents=True)
+    monitor = WorkspaceMonitor(roots)
+    assert monitor.assert_in_workspace(tmp_path / "a" / "x.rvt") == (tmp_path / "a" / "x.rvt").resolve()
+    assert monitor.assert_in_workspace(tmp_path / "b" / "c" / "d" / "y.rvt")
+    for outside in (tmp_path / "b" / "other.rvt", tmp_path / "ab" / "z.rvt", tmp_path / "a" / ".." / "escape"):
+        with pytest.raises(WorkspaceViolation):
+            monitor.assert_in_workspace(outside)
+
+
+def test_symlink_change_is_seen_after_ttl(tmp_path, clock):
+    inside = tmp_path / "inside"
+    outside = tmp_path / "outside"
+    inside.mkdir()
+    outside.mkdir()
+    link = inside / "link"
+    link.symlink_to(inside / "target")
+    monitor = WorkspaceMonitor([inside], ttl=5.0, clock=clock)
+    monitor.assert_in_workspace(link)
+
+    link.unlink()
+    link.symlink_to(outside)
+    monitor.assert_in_workspace(link)  # still cached
+    clock.now = 6.0
+    with pytest.raises(WorkspaceViolation):
+        monitor.assert_in_workspace(link)
+
+
+def test_cache_is_bounded(tmp_path):
+    monitor = WorkspaceMonitor([tmp_path], cache_size=3)
+    for index in range(10):
+        monitor.assert_in_workspace(tmp_path / f"{index}.rvt")
+    assert len(monitor._cache) == 3
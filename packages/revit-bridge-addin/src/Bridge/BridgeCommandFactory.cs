@@ -182,6 +182,9 @@ public static class BridgeCommandFactory
             "revit.replace_family_type" => ExecuteReplaceFamilyType(app, payload),
             "revit.get_element_geometry" => ExecuteGetElementGeometry(app, payload),
 
+            // Multi-operation batch: many commands in one ExternalEvent hop
+            "revit.batch_execute" => ExecuteBatch(app, payload),
+
             _ => new { status = "error", message = $"Unknown tool: {tool}" }
         };
     }
@@ -351,10 +354,128 @@ public static class BridgeCommandFactory
             "revit.get_elements_by_type",
             "revit.batch_set_parameters_by_filter",
             "revit.replace_family_type",
-            "revit.get_element_geometry"
+            "revit.get_element_geometry",
+
+            // Multi-operation batch
+            "revit.batch_execute"
         };
     }
 
+    // ==================== BATCH ====================
+
+    private static object ExecuteBatch(UIApplication app, JsonElement payload)
+    {
+        if (!payload.TryGetProperty("operations", out var operations) || operations.ValueKind != JsonValueKind.Array)
+            throw new ArgumentException("Missing 'operations' array");
+
+        var useTransaction = payload.TryGetProperty("transaction", out var txProp) && txProp.ValueKind == JsonValueKind.True;
+        var stopOnError = payload.TryGetProperty("stop_on_error", out var stopProp)
+            ? stopProp.ValueKind == JsonValueKind.True
+            : useTransaction;
+
+        TransactionGroup? group = null;
+        if (useTransaction)
+        {
+            var doc = app.ActiveUIDocument?.Document;
+            if (doc == null)
+                throw new InvalidOperationException("No active document");
+            group = new TransactionGroup(doc, "MCP Batch");
+            group.Start();
+        }
+
+        var emptyPayload = JsonDocument.Parse("{}").RootElement;
+        var results = new List<object>();
+        var failed = 0;
+        var rolledBack = false;
+
+        try
+        {
+            var index = 0;
+            foreach (var operation in operations.EnumerateArray())
+            {
+                var tool = operation.TryGetProperty("tool", out var toolProp) ? toolProp.GetString() ?? string.Empty : string.Empty;
+                var opPayload = operation.TryGetProperty("payload", out var payloadProp) && payloadProp.ValueKind == JsonValueKind.Object
+                    ? payloadProp
+                    : emptyPayload;
+
+                try
+                {
+                    if (tool == "revit.batch_execute")
+                        throw new ArgumentException("Nested batches are not supported");
+
+                    var result = Execute(app, tool, opPayload);
+                    // Commands that report failure without throwing count as failed too
+                    var error = ReportedError(result);
+                    if (error != null)
+                        throw new InvalidOperationException(error);
+                    results.Add(new { index, tool, status = "ok", result });
+                }
+                catch (Exception ex)
+                {
+                    failed++;
+                    results.Add(new { index, tool, status = "error", message = ex.Message });
+                    if (stopOnError)
+                        break;
+                }
+                index++;
+            }
+
+            if (group != null)
+            {
+                if (failed > 0)
+                {
+                    group.RollBack();
+                    rolledBack = true;
+                }
+                else
+                {
+                    group.Assimilate();
+                }
+            }
+        }
+        catch
+        {
+            if (group != null && group.HasStarted())
+                group.RollBack();
+            throw;
+        }
+        finally
+        {
+            group?.Dispose();
+        }
+
+        return new
+        {
+            results,
+            succeeded = results.Count - failed,
+            failed,
+            skipped = operations.GetArrayLength() - results.Count,
+            transaction = useTransaction,
+            rolled_back = rolledBack
+        };
+    }
+
+    private static string? ReportedError(object? result)
+    {
+        if (result == null)
+            return null;
+        object? status, message;
+        if (result is IDictionary<string, object?> dict)
+        {
+            dict.TryGetValue("status", out status);
+            dict.TryGetValue("message", out message);
+        }
+        else
+        {
+            var type = result.GetType();
+            status = type.GetProperty("status")?.GetValue(result);
+            message = type.GetProperty("message")?.GetValue(result);
+        }
+        if (status as string != "error")
+            return null;
+        return message?.ToString() ?? "Command reported an error";
+    }
+
     // ==================== EXISTING TOOLS ====================
 
     private static object ExecuteHealth(UIApplication app)
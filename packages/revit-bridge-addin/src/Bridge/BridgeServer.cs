@@ -1,6 +1,8 @@
 using System;
+using System.Collections.Generic;
 using System.IO;
 using System.Net;
+using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
 using System.Threading;
@@ -21,6 +23,10 @@ public class BridgeServer
     private int _totalRequests = 0;
     private int _activeConnections = 0;
 
+    // The catalog is fixed for the add-in's lifetime, so its hash is computed once.
+    private static readonly List<string> ToolCatalog = BridgeCommandFactory.GetToolCatalog();
+    private static readonly string ToolsHash = ComputeToolsHash(ToolCatalog);
+
     public BridgeServer(CommandQueue queue, ExternalEvent externalEvent, string prefix = "http://127.0.0.1:3000/")
     {
         _queue = queue;
@@ -143,24 +149,27 @@ public class BridgeServer
         var requestId = root.GetProperty("request_id").GetString() ?? Guid.NewGuid().ToString();
         var tool = root.GetProperty("tool").GetString() ?? string.Empty;
         var payload = root.GetProperty("payload");
+        // Optional; sent by clients with tracing enabled so bridge logs can be joined to their spans
+        var traceId = root.TryGetProperty("trace_id", out var traceElement) ? traceElement.GetString() : null;
 
         var request = new CommandRequest
         {
             RequestId = requestId,
+            TraceId = traceId,
             Tool = tool,
             Payload = payload
         };
 
-        Log.Information("Request received: {RequestId} {Tool} from {ClientIP}",
-            requestId, tool, context.Request.RemoteEndPoint?.Address.ToString());
+        Log.Information("Request received: {RequestId} {TraceId} {Tool} from {ClientIP}",
+            requestId, traceId, tool, context.Request.RemoteEndPoint?.Address.ToString());
 
         _queue.Enqueue(request);
         _externalEvent.Raise();
 
         var response = await _queue.WaitForResponse(requestId);
 
-        Log.Information("Request completed: {RequestId} {Tool} {Status} {DurationMs}ms",
-            requestId, tool, response.Status, (DateTime.UtcNow - startTime).TotalMilliseconds);
+        Log.Information("Request completed: {RequestId} {TraceId} {Tool} {Status} {DurationMs}ms",
+            requestId, traceId, tool, response.Status, (DateTime.UtcNow - startTime).TotalMilliseconds);
 
         Respond(context, 200, response);
     }
@@ -173,7 +182,8 @@ public class BridgeServer
             version = System.Reflection.Assembly.GetExecutingAssembly().GetName().Version?.ToString(),
             uptime_seconds = (DateTime.UtcNow - _startTime).TotalSeconds,
             revit_version = App.RevitVersion ?? "unknown",
-            active_document = App.ActiveDocumentName ?? "none"
+            active_document = App.ActiveDocumentName ?? "none",
+            tools_hash = ToolsHash
         };
         Respond(context, 200, health);
         return Task.CompletedTask;
@@ -181,11 +191,26 @@ public class BridgeServer
 
     private Task HandleTools(HttpListenerContext context)
     {
-        var tools = BridgeCommandFactory.GetToolCatalog();
-        Respond(context, 200, new { tools });
+        var etag = $"\"{ToolsHash}\"";
+        context.Response.Headers["ETag"] = etag;
+        if (context.Request.Headers["If-None-Match"] == etag)
+        {
+            context.Response.StatusCode = 304;
+            context.Response.Close();
+            return Task.CompletedTask;
+        }
+        Respond(context, 200, new { tools = ToolCatalog });
         return Task.CompletedTask;
     }
 
+    // SHA-256 of the names joined by "\n"; must match catalog_etag() in catalog_store.py.
+    private static string ComputeToolsHash(IEnumerable<string> tools)
+    {
+        using var sha = SHA256.Create();
+        var bytes = sha.ComputeHash(Encoding.UTF8.GetBytes(string.Join("\n", tools)));
+        return BitConverter.ToString(bytes).Replace("-", string.Empty).ToLowerInvariant();
+    }
+
     private void Respond(HttpListenerContext context, int statusCode, object data)
     {
         context.Response.StatusCode = statusCode;
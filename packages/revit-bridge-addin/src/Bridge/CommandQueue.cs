@@ -8,8 +8,10 @@ namespace RevitBridge.Bridge;
 public class CommandRequest
 {
     public string RequestId { get; set; } = string.Empty;
+    public string? TraceId { get; set; }
     public string Tool { get; set; } = string.Empty;
     public JsonElement Payload { get; set; }
+    public DateTime EnqueuedAt { get; set; }
 }
 
 public class CommandResponse
@@ -19,6 +21,10 @@ public class CommandResponse
     public object? Result { get; set; }
     public string? Message { get; set; }
     public string? StackTrace { get; set; }
+    // Time spent waiting for the Revit UI thread and executing on it,
+    // reported so clients can split bridge latency from network latency.
+    public double? QueueMs { get; set; }
+    public double? ExecuteMs { get; set; }
 }
 
 public class CommandQueue
@@ -29,6 +35,7 @@ public class CommandQueue
     public void Enqueue(CommandRequest request)
     {
         var tcs = new TaskCompletionSource<CommandResponse>();
+        request.EnqueuedAt = DateTime.UtcNow;
         _pending[request.RequestId] = tcs;
         _queue.Enqueue(request);
     }
@@ -1,4 +1,5 @@
 using System;
+using System.Diagnostics;
 using Autodesk.Revit.UI;
 using Serilog;
 
@@ -19,9 +20,11 @@ public class RevitCommandExecutor : IExternalEventHandler
         {
             if (request == null) continue;
 
+            var queueMs = (DateTime.UtcNow - request.EnqueuedAt).TotalMilliseconds;
+            var stopwatch = Stopwatch.StartNew();
             try
             {
-                Log.Information("Executing {Tool} request {RequestId}", request.Tool, request.RequestId);
+                Log.Information("Executing {Tool} request {RequestId} trace {TraceId}", request.Tool, request.RequestId, request.TraceId);
 
                 var result = BridgeCommandFactory.Execute(app, request.Tool, request.Payload);
 
@@ -29,7 +32,9 @@ public class RevitCommandExecutor : IExternalEventHandler
                 {
                     Status = "ok",
                     Tool = request.Tool,
-                    Result = result
+                    Result = result,
+                    QueueMs = queueMs,
+                    ExecuteMs = stopwatch.Elapsed.TotalMilliseconds
                 };
 
                 _queue.Complete(request.RequestId, response);
@@ -44,7 +49,9 @@ public class RevitCommandExecutor : IExternalEventHandler
                     Status = "error",
                     Tool = request.Tool,
                     Message = ex.Message,
-                    StackTrace = ex.StackTrace
+                    StackTrace = ex.StackTrace,
+                    QueueMs = queueMs,
+                    ExecuteMs = stopwatch.Elapsed.TotalMilliseconds
                 };
 
                 _queue.Complete(request.RequestId, errorResponse);